@@ -1,8 +1,11 @@
 """Correlation Similarity Metric."""
 
+import itertools
+
 import numpy as np
 import pandas as pd
-from scipy.stats import pearsonr, spearmanr
+from scipy import linalg
+from scipy.stats import pearsonr, rankdata, spearmanr
 
 from sdmetrics.column_pairs.base import ColumnPairsMetric
 from sdmetrics.errors import ConstantInputError
@@ -112,6 +115,175 @@ class CorrelationSimilarity(ColumnPairsMetric):
             'synthetic': correlation_synthetic,
         }
 
+    @staticmethod
+    def _get_numerical_values(column):
+        if is_datetime(column):
+            column = pd.to_numeric(column).astype(float).where(column.notna())
+
+        return column.to_numpy(dtype=float)
+
+    @staticmethod
+    def _normalize(values, coefficient):
+        """Center and scale the values the same way as ``pearsonr`` and ``spearmanr``."""
+        if coefficient == 'Spearman':
+            return rankdata(values)
+
+        deviations = values - values.mean()
+        return deviations / linalg.norm(deviations)
+
+    @staticmethod
+    def _correlate(normalized_1, normalized_2, coefficient):
+        if coefficient == 'Spearman':
+            ranks = np.column_stack((normalized_1, normalized_2))
+            return np.corrcoef(ranks, rowvar=False)[1, 0]
+
+        return max(min(np.dot(normalized_1, normalized_2), 1.0), -1.0)
+
+    @classmethod
+    def _compute_pair_correlation(cls, values_1, values_2, coefficient):
+        """Compute the correlation of two columns without missing values."""
+        num_rows = len(values_1)
+        if num_rows < 2 or (values_1 == values_1[0]).all() or (values_2 == values_2[0]).all():
+            return np.nan
+
+        if num_rows == 2 and coefficient == 'Pearson':
+            return np.sign(values_1[1] - values_1[0]) * np.sign(values_2[1] - values_2[0])
+
+        return cls._correlate(
+            cls._normalize(values_1, coefficient),
+            cls._normalize(values_2, coefficient),
+            coefficient,
+        )
+
+    @classmethod
+    def _get_correlation_matrix(cls, data, coefficient, column_pairs=None):
+        """Compute the correlation of every pair of columns using pairwise-complete rows.
+
+        The columns without missing values are normalized only once, and every pair
+        reproduces the arithmetic of ``pearsonr`` or ``spearmanr`` on the ``dropna`` data.
+        If ``column_pairs`` is given, only those pairs are computed and the others are ``NaN``.
+        """
+        num_columns = len(data.columns)
+        if column_pairs is None:
+            index_pairs = list(itertools.combinations(range(num_columns), 2))
+        else:
+            index_pairs = [
+                (data.columns.get_loc(column_name_1), data.columns.get_loc(column_name_2))
+                for column_name_1, column_name_2 in column_pairs
+            ]
+
+        columns = [cls._get_numerical_values(data[column_name]) for column_name in data]
+        is_missing = [np.isnan(values) for values in columns]
+        is_complete = [not missing.any() for missing in is_missing]
+        normalized = {}
+        for idx in set(itertools.chain.from_iterable(index_pairs)):
+            values = columns[idx]
+            is_constant = len(values) < 3 or (values == values[0]).all()
+            if is_complete[idx] and not is_constant:
+                normalized[idx] = cls._normalize(values, coefficient)
+
+        correlation = np.full((num_columns, num_columns), np.nan)
+        for idx_1, idx_2 in index_pairs:
+            if idx_1 in normalized and idx_2 in normalized:
+                pair_correlation = cls._correlate(normalized[idx_1], normalized[idx_2], coefficient)
+            elif is_complete[idx_1] and is_complete[idx_2]:
+                pair_correlation = cls._compute_pair_correlation(
+                    columns[idx_1], columns[idx_2], coefficient
+                )
+            else:
+                is_valid = ~(is_missing[idx_1] | is_missing[idx_2])
+                pair_correlation = cls._compute_pair_correlation(
+                    columns[idx_1][is_valid], columns[idx_2][is_valid], coefficient
+                )
+
+            correlation[idx_1, idx_2] = correlation[idx_2, idx_1] = pair_correlation
+
+        return pd.DataFrame(correlation, index=data.columns, columns=data.columns)
+
+    @classmethod
+    def compute_correlation_matrix(cls, data, coefficient='Pearson', column_pairs=None):
+        """Compute the correlation of every pair of continuous columns of one dataset.
+
+        Args:
+            data (pandas.DataFrame):
+                The values of the columns.
+            coefficient (str):
+                The correlation coefficient to use, either ``'Pearson'`` or ``'Spearman'``.
+                Defaults to ``'Pearson'``.
+            column_pairs (list[tuple[str, str]] or None):
+                The pairs of columns to compute. The other pairs are set to ``NaN``.
+                Defaults to None, which computes all the pairs.
+
+        Returns:
+            pandas.DataFrame:
+                The correlation matrix, indexed by the column names.
+        """
+        return cls._get_correlation_matrix(data, coefficient, column_pairs)
+
+    @classmethod
+    def compute_matrix_breakdown(
+        cls,
+        real_data,
+        synthetic_data,
+        coefficient='Pearson',
+        real_correlation=None,
+        column_pairs=None,
+    ):
+        """Compute the correlation similarity of every pair of continuous columns at once.
+
+        The correlations use the pairwise-complete observations of each pair of columns, which
+        matches dropping the missing values of the pair in ``compute_breakdown``. The columns
+        without missing values are centered and scaled only once for all their pairs. The pairs with
+        a constant column or an undefined correlation are set to ``NaN``, so that their error
+        can be obtained from ``compute_breakdown``.
+
+        Args:
+            real_data (pandas.DataFrame):
+                The values from the real dataset.
+            synthetic_data (pandas.DataFrame):
+                The values from the synthetic dataset.
+            coefficient (str):
+                The correlation coefficient to use, either ``'Pearson'`` or ``'Spearman'``.
+                Defaults to ``'Pearson'``.
+            real_correlation (pandas.DataFrame or None):
+                The correlation matrix of the real data from ``compute_correlation_matrix``,
+                to avoid computing it again. Defaults to None.
+            column_pairs (list[tuple[str, str]] or None):
+                The pairs of columns to compute. The other pairs are set to ``NaN``.
+                Defaults to None, which computes all the pairs.
+
+        Returns:
+            dict:
+                A dict containing the ``score``, ``real`` and ``synthetic`` matrices as
+                ``pandas.DataFrame`` objects indexed by the column names.
+        """
+        if coefficient not in ('Pearson', 'Spearman'):
+            raise ValueError(
+                f'requested coefficient {coefficient} is not valid. '
+                'Please choose either Pearson or Spearman.'
+            )
+
+        columns = list(real_data.columns)
+        synthetic_data = synthetic_data[columns]
+        if real_correlation is None:
+            real_correlation = cls._get_correlation_matrix(real_data, coefficient, column_pairs)
+
+        synthetic_correlation = cls._get_correlation_matrix(
+            synthetic_data, coefficient, column_pairs
+        )
+
+        is_constant = (real_data.nunique() == 1) | (synthetic_data.nunique() == 1)
+        is_undefined = real_correlation.isna() | synthetic_correlation.isna()
+        is_undefined |= np.logical_or.outer(is_constant.to_numpy(), is_constant.to_numpy())
+        real_correlation = real_correlation.mask(is_undefined)
+        synthetic_correlation = synthetic_correlation.mask(is_undefined)
+
+        return {
+            'score': 1 - (real_correlation - synthetic_correlation).abs() / 2,
+            'real': real_correlation,
+            'synthetic': synthetic_correlation,
+        }
+
     @classmethod
     def compute(cls, real_data, synthetic_data, coefficient='Pearson'):
         """Compare the correlation similarity of two continuous columns.
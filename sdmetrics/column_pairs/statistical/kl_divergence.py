@@ -6,7 +6,7 @@ from scipy.special import kl_div
 
 from sdmetrics.column_pairs.base import ColumnPairsMetric
 from sdmetrics.goal import Goal
-from sdmetrics.utils import get_frequencies
+from sdmetrics.utils import get_frequency_arrays
 
 
 class ContinuousKLDivergence(ColumnPairsMetric):
@@ -114,10 +114,7 @@ class DiscreteKLDivergence(ColumnPairsMetric):
                 Metric output or outputs.
         """
         columns = real_data.columns[:2]
-        real = real_data[columns].itertuples(index=False)
-        synthetic = synthetic_data[columns].itertuples(index=False)
-
-        f_obs, f_exp = get_frequencies(real, synthetic)
+        f_obs, f_exp = get_frequency_arrays(real_data[columns], synthetic_data[columns])
         return 1 / (1 + np.sum(kl_div(f_obs, f_exp)))
 
     @classmethod
@@ -4,10 +4,12 @@ from sdmetrics.reports.multi_table import DiagnosticReport as MultiTableDiagnost
 from sdmetrics.reports.multi_table import QualityReport as MultiTableQualityReport
 from sdmetrics.reports.single_table import DiagnosticReport as SingleTableDiagnosticReport
 from sdmetrics.reports.single_table import QualityReport as SingleTableQualityReport
+from sdmetrics.reports.utils import RealDataProfile
 
 __all__ = [
     'SingleTableQualityReport',
     'SingleTableDiagnosticReport',
     'MultiTableQualityReport',
     'MultiTableDiagnosticReport',
+    'RealDataProfile',
 ]
@@ -1,10 +1,12 @@
 """Single table base report."""
 
 import importlib.metadata
+import os
 import pickle
 import sys
 import time
 import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from copy import deepcopy
 from datetime import datetime
 from importlib.metadata import version
@@ -13,10 +15,45 @@ import numpy as np
 import pandas as pd
 import tqdm
 
-from sdmetrics.reports.utils import convert_datetime_columns
+from sdmetrics.reports.utils import (
+    PreprocessingContext,
+    RealDataProfile,
+    convert_datetime_columns,
+)
 from sdmetrics.visualization import set_plotly_config
 
 
+def _compute_property_score(property_instance, real_data, synthetic_data, metadata):
+    score = property_instance.get_score(real_data, synthetic_data, metadata)
+    return score, property_instance
+
+
+_WORKER_DATA = {}
+
+
+def _generate_report(report_class, real_data, synthetic_data, metadata, generate_kwargs):
+    report = report_class()
+    report.generate(real_data, synthetic_data, metadata, verbose=False, **generate_kwargs)
+    return report
+
+
+def _initialize_worker(report_class, real_data, metadata, generate_kwargs):
+    _WORKER_DATA['report_class'] = report_class
+    _WORKER_DATA['real_data'] = real_data
+    _WORKER_DATA['metadata'] = metadata
+    _WORKER_DATA['generate_kwargs'] = generate_kwargs
+
+
+def _generate_worker_report(synthetic_data):
+    return _generate_report(
+        _WORKER_DATA['report_class'],
+        _WORKER_DATA['real_data'],
+        synthetic_data,
+        _WORKER_DATA['metadata'],
+        _WORKER_DATA['generate_kwargs'],
+    )
+
+
 class BaseReport:
     """Base report class for single table reports.
 
@@ -116,6 +153,28 @@ class BaseReport:
                 except Exception:
                     continue
 
+    def _get_preprocessing_context(
+        self, real_data, synthetic_data, metadata, real_data_profile=None
+    ):
+        """Get the preprocessing context shared by all the properties of the report.
+
+        Args:
+            real_data (pandas.DataFrame):
+                The real data.
+            synthetic_data (pandas.DataFrame):
+                The synthetic data.
+            metadata (dict):
+                The metadata of the table.
+            real_data_profile (sdmetrics.reports.utils.RealDataProfile or None):
+                The profile to share the real statistics with. Defaults to None.
+
+        Returns:
+            sdmetrics.reports.utils.PreprocessingContext:
+                The preprocessing context of the data.
+        """
+        real_cache = None if real_data_profile is None else real_data_profile.get_real_cache()
+        return PreprocessingContext(real_data, synthetic_data, metadata, real_cache)
+
     def _print_results(self, verbose):
         """Print the results.
 
@@ -126,22 +185,103 @@ class BaseReport:
         if verbose:
             sys.stdout.write(f'Overall Score (Average): {round(self._overall_score * 100, 2)}%\n\n')
 
-    def generate(self, real_data, synthetic_data, metadata, verbose=True):
+    def _get_scores_concurrently(
+        self, real_data, synthetic_data, metadata, context, verbose, concurrency
+    ):
+        """Compute the score of every property at the same time on a thread or process pool.
+
+        With threads, the properties share the preprocessing context and the progress bar.
+        With processes, each property is computed on a copy that replaces the original
+        property once it is done.
+
+        Returns:
+            list[float]:
+                The score of each property, in the order of the properties.
+        """
+        progress_bar = None
+        if verbose:
+            num_iterations = sum(
+                int(property_instance._get_num_iterations(metadata))
+                for property_instance in self._properties.values()
+            )
+            progress_bar = tqdm.tqdm(
+                total=num_iterations, file=sys.stdout, bar_format='{desc}|{bar}{r_bar}|'
+            )
+            progress_bar.set_description(f'Evaluating {len(self._properties)} properties')
+
+        pool_class = ThreadPoolExecutor if concurrency == 'thread' else ProcessPoolExecutor
+        with pool_class(max_workers=len(self._properties)) as executor:
+            futures = {}
+            for property_name, property_instance in self._properties.items():
+                if concurrency == 'thread':
+                    futures[property_name] = executor.submit(
+                        property_instance.get_score,
+                        real_data,
+                        synthetic_data,
+                        metadata,
+                        progress_bar=progress_bar,
+                        context=context,
+                    )
+                else:
+                    futures[property_name] = executor.submit(
+                        _compute_property_score,
+                        property_instance,
+                        real_data,
+                        synthetic_data,
+                        metadata,
+                    )
+
+            scores = []
+            for property_name, future in futures.items():
+                if concurrency == 'thread':
+                    score = future.result()
+                else:
+                    score, self._properties[property_name] = future.result()
+                    if progress_bar:
+                        progress_bar.update(
+                            int(self._properties[property_name]._get_num_iterations(metadata))
+                        )
+
+                scores.append(score)
+
+        if verbose:
+            progress_bar.close()
+            for property_name, score in zip(self._properties, scores):
+                sys.stdout.write(f'{property_name} Score: {round(score * 100, 2)}%\n')
+
+            sys.stdout.write('\n')
+            sys.stdout.flush()
+
+        return scores
+
+    def generate(self, real_data, synthetic_data, metadata, verbose=True, concurrency=None):
         """Generate report.
 
         This method generates the report by iterating through each property and calculating
         the score for each property.
 
         Args:
-            real_data (pandas.DataFrame):
-                The real data.
+            real_data (pandas.DataFrame or sdmetrics.reports.RealDataProfile):
+                The real data, or a profile of it to reuse its real statistics.
             synthetic_data (pandas.DataFrame):
                 The synthetic data.
             metadata (dict):
                 The metadata, which contains each column's data type as well as relationships.
             verbose (bool):
                 Whether or not to print report summary and progress.
+            concurrency (str or None):
+                Whether to compute the properties at the same time on a ``'thread'`` or
+                ``'process'`` pool. Defaults to ``None``, which computes them one at a time.
         """
+        if concurrency not in (None, 'thread', 'process'):
+            raise ValueError("`concurrency` must be None, 'thread' or 'process'.")
+
+        real_data_profile = None
+        if isinstance(real_data, RealDataProfile):
+            real_data_profile = real_data
+            real_data_profile.validate_metadata(metadata)
+            real_data = real_data_profile.real_data
+
         if not isinstance(metadata, dict):
             raise TypeError(
                 f"Expected a dictionary but received a '{type(metadata).__name__}' instead."
@@ -171,32 +311,142 @@ class BaseReport:
             sys.stdout.write('Generating report ...\n\n')
 
         start_time = time.time()
-        for ind, (property_name, property_instance) in enumerate(self._properties.items()):
-            if verbose:
-                num_iterations = int(property_instance._get_num_iterations(metadata))
-                progress_bar = tqdm.tqdm(
-                    total=num_iterations, file=sys.stdout, bar_format='{desc}|{bar}{r_bar}|'
-                )
-                progress_bar.set_description(
-                    f'({ind + 1}/{len(self._properties)}) Evaluating {property_name}'
+        context = self._get_preprocessing_context(
+            real_data, synthetic_data, metadata, real_data_profile
+        )
+        if concurrency is None:
+            for ind, (property_name, property_instance) in enumerate(self._properties.items()):
+                if verbose:
+                    num_iterations = int(property_instance._get_num_iterations(metadata))
+                    progress_bar = tqdm.tqdm(
+                        total=num_iterations, file=sys.stdout, bar_format='{desc}|{bar}{r_bar}|'
+                    )
+                    progress_bar.set_description(
+                        f'({ind + 1}/{len(self._properties)}) Evaluating {property_name}'
+                    )
+
+                score = self._properties[property_name].get_score(
+                    real_data, synthetic_data, metadata, progress_bar=progress_bar, context=context
                 )
-
-            score = self._properties[property_name].get_score(
-                real_data, synthetic_data, metadata, progress_bar=progress_bar
+                scores.append(score)
+                if verbose:
+                    progress_bar.close()
+                    sys.stdout.write(f'{property_name} Score: {round(score * 100, 2)}%\n\n')
+                    sys.stdout.flush()
+        else:
+            scores = self._get_scores_concurrently(
+                real_data, synthetic_data, metadata, context, verbose, concurrency
             )
-            scores.append(score)
-            if verbose:
-                progress_bar.close()
-                sys.stdout.write(f'{property_name} Score: {round(score * 100, 2)}%\n\n')
-                sys.stdout.flush()
 
         self._overall_score = np.nanmean(scores)
+        self._record_property_estimates()
         self.is_generated = True
         end_time = time.time()
         self.report_info['generation_time'] = end_time - start_time
 
         self._print_results(verbose)
 
+    def _record_property_estimates(self):
+        """Store the estimates of the properties that only scored a sample of the data."""
+        estimates = {}
+        for property_name, property_instance in self._properties.items():
+            estimate = property_instance._get_estimate()
+            if estimate is not None:
+                estimates[property_name] = estimate
+
+        if estimates:
+            self.report_info['property_estimates'] = estimates
+        else:
+            self.report_info.pop('property_estimates', None)
+
+    @classmethod
+    def generate_many(
+        cls, real_data, synthetic_data, metadata, verbose=True, n_jobs=None, **kwargs
+    ):
+        """Generate a report for each of many synthetic datasets against the same real data.
+
+        The real data is profiled once and the statistics of the real data are shared by all
+        the reports. The first report is generated on its own to compute them, and the others
+        are generated in parallel if ``n_jobs`` is given. The profile is sent once to each
+        process, and each report only receives its synthetic data.
+
+        Args:
+            real_data (pandas.DataFrame, dict or sdmetrics.reports.RealDataProfile):
+                The real data, or a profile of it.
+            synthetic_data (dict):
+                A mapping of the name of each synthetic dataset to its data.
+            metadata (dict):
+                The metadata, which contains each column's data type as well as relationships.
+            verbose (bool):
+                Whether or not to show the progress of the reports. Defaults to True.
+            n_jobs (int or None):
+                The number of processes used to generate the reports. ``-1`` uses all the
+                CPUs. Defaults to ``None``, which generates them sequentially.
+            **kwargs:
+                Other arguments to pass to the ``generate`` method of every report.
+
+        Returns:
+            pandas.DataFrame:
+                A table with the name of each synthetic dataset, its overall score and
+                the score of each property.
+        """
+        if n_jobs is not None and n_jobs != -1 and (not isinstance(n_jobs, int) or n_jobs < 1):
+            raise ValueError('`n_jobs` must be None, -1 or an integer greater than zero.')
+
+        if not isinstance(synthetic_data, dict):
+            raise ValueError(
+                '`synthetic_data` must be a dictionary mapping the name of each synthetic'
+                ' dataset to its data.'
+            )
+
+        if not isinstance(real_data, RealDataProfile):
+            real_data = RealDataProfile(real_data, metadata)
+
+        progress_bar = None
+        if verbose:
+            progress_bar = tqdm.tqdm(
+                total=len(synthetic_data), file=sys.stdout, bar_format='{desc}|{bar}{r_bar}|'
+            )
+            progress_bar.set_description(f'Generating {len(synthetic_data)} reports')
+
+        reports = {}
+        names = list(synthetic_data)
+        num_processes = os.cpu_count() if n_jobs == -1 else n_jobs
+        parallel = num_processes not in (None, 1)
+        for name in names[:1] if parallel else names:
+            reports[name] = _generate_report(cls, real_data, synthetic_data[name], metadata, kwargs)
+            if progress_bar:
+                progress_bar.update()
+
+        if parallel and len(names) > 1:
+            with ProcessPoolExecutor(
+                max_workers=num_processes,
+                initializer=_initialize_worker,
+                initargs=(cls, real_data, metadata, kwargs),
+            ) as executor:
+                futures = {
+                    executor.submit(_generate_worker_report, synthetic_data[name]): name
+                    for name in names[1:]
+                }
+                for future in as_completed(futures):
+                    reports[futures[future]] = future.result()
+                    if progress_bar:
+                        progress_bar.update()
+
+        if progress_bar:
+            progress_bar.close()
+
+        rows = []
+        for name in names:
+            properties = reports[name].get_properties()
+            rows.append({
+                'Synthetic Data': name,
+                'Overall Score': reports[name].get_score(),
+                **dict(zip(properties['Property'], properties['Score'])),
+            })
+
+        return pd.DataFrame(rows)
+
     def _check_property_name(self, property_name):
         """Check that the given property name is valid.
 
@@ -23,12 +23,16 @@ class BaseMultiTableProperty:
     _num_iteration_case = None
 
     def __init__(self):
+        self._single_table_property_kwargs = {}
+        self._context = None
         self._properties = {}
         self.is_computed = False
         self.details = pd.DataFrame()
 
     def _get_num_iterations(self, metadata):
         """Get the number of iterations for the property."""
+        max_column_pairs = self._single_table_property_kwargs.get('max_column_pairs')
+        max_column_pairs = float('inf') if max_column_pairs is None else max_column_pairs
         if self._num_iteration_case == 'column':
             return sum(len(metadata['tables'][table]['columns']) for table in metadata['tables'])
         elif self._num_iteration_case == 'table':
@@ -40,13 +44,15 @@ class BaseMultiTableProperty:
                 return 0
         elif self._num_iteration_case == 'column_pair':
             num_columns = [len(table['columns']) for table in metadata['tables'].values()]
-            return sum([(n_cols * (n_cols - 1)) // 2 for n_cols in num_columns])
+            return sum([
+                min((n_cols * (n_cols - 1)) // 2, max_column_pairs) for n_cols in num_columns
+            ])
         elif self._num_iteration_case == 'inter_table_column_pair':
             iterations = 0
             for relationship in metadata.get('relationships', []):
                 parent_columns = metadata['tables'][relationship['parent_table_name']]['columns']
                 child_columns = metadata['tables'][relationship['child_table_name']]['columns']
-                iterations += len(parent_columns) * len(child_columns)
+                iterations += min(len(parent_columns) * len(child_columns), max_column_pairs)
             return iterations
 
     @staticmethod
@@ -68,8 +74,65 @@ class BaseMultiTableProperty:
         if not has_score_column:
             return np.nan
 
+        estimate = self._get_estimate()
+        if estimate is not None:
+            return estimate['score']
+
         return self.details['Score'].mean()
 
+    def _get_estimate(self):
+        """Combine the estimates of the single table properties, if any of them has one.
+
+        The single table properties that were computed exactly are weighted by their number
+        of scores, without contributing to the standard error.
+
+        Returns:
+            dict or None:
+                The estimated ``score`` with its ``standard_error``, or ``None`` if the
+                score was computed exactly.
+        """
+        estimates = {key: prop._get_estimate() for key, prop in self._properties.items()}
+        if all(estimate is None for estimate in estimates.values()):
+            return None
+
+        parts = []
+        num_column_pairs = 0
+        num_computed_column_pairs = 0
+        for key, estimate in estimates.items():
+            if estimate is None:
+                details = self._properties[key].details
+                scores = details['Score'] if 'Score' in details else pd.Series(dtype=float)
+                estimate = {
+                    'score': scores.mean(),
+                    'standard_error': 0.0,
+                    'num_column_pairs': len(details),
+                    'num_computed_column_pairs': len(details),
+                }
+
+            num_column_pairs += estimate['num_column_pairs']
+            num_computed_column_pairs += estimate['num_computed_column_pairs']
+            if not pd.isna(estimate['score']):
+                parts.append((
+                    estimate['num_column_pairs'],
+                    estimate['score'],
+                    estimate['standard_error'],
+                ))
+
+        total_size = sum(size for size, _, _ in parts)
+        score = np.nan
+        standard_error = np.nan
+        if total_size:
+            weights = np.array([size for size, _, _ in parts]) / total_size
+            score = float(np.dot(weights, [part_score for _, part_score, _ in parts]))
+            standard_error = float(np.sqrt(np.dot(weights**2, [se**2 for _, _, se in parts])))
+
+        return {
+            'score': score,
+            'standard_error': standard_error,
+            'num_column_pairs': num_column_pairs,
+            'num_computed_column_pairs': num_computed_column_pairs,
+        }
+
     def _generate_details(self, real_data, synthetic_data, metadata, progress_bar=None):
         """Generate the ``details`` dataframe for the multi-table property.
 
@@ -87,9 +150,15 @@ class BaseMultiTableProperty:
             raise NotImplementedError()
 
         for table_name, metadata_table in metadata['tables'].items():
-            self._properties[table_name] = self._single_table_property()
+            self._properties[table_name] = self._single_table_property(
+                **self._single_table_property_kwargs
+            )
             self._properties[table_name].get_score(
-                real_data[table_name], synthetic_data[table_name], metadata_table, progress_bar
+                real_data[table_name],
+                synthetic_data[table_name],
+                metadata_table,
+                progress_bar,
+                context=(self._context or {}).get(table_name),
             )
 
         details_frames = []
@@ -103,7 +172,7 @@ class BaseMultiTableProperty:
         cols = ['Table'] + [col for col in self.details if col != 'Table']
         self.details = self.details[cols]
 
-    def get_score(self, real_data, synthetic_data, metadata, progress_bar=None):
+    def get_score(self, real_data, synthetic_data, metadata, progress_bar=None, context=None):
         """Get the average score of all the individual metric scores computed.
 
         Args:
@@ -115,12 +184,19 @@ class BaseMultiTableProperty:
                 The metadata, which contains each column's data type as well as relationships.
             progress_bar (tqdm.tqdm or None):
                 The progress bar object. Defaults to None.
+            context (dict or None):
+                A mapping of each table name to the preprocessing context shared with the
+                other properties of a report. Defaults to None.
 
         Returns:
             float:
                 The average score for the property for all the individual metric scores computed.
         """
-        self._generate_details(real_data, synthetic_data, metadata, progress_bar)
+        self._context = context
+        try:
+            self._generate_details(real_data, synthetic_data, metadata, progress_bar)
+        finally:
+            self._context = None
 
         self.is_computed = True
 
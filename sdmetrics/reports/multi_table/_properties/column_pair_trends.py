@@ -12,7 +12,35 @@ class ColumnPairTrends(BaseMultiTableProperty):
     This property evaluates the matching in trends between pairs of real
     and synthetic data columns. Each pair's correlation is calculated and
     the final score represents the average of these measures across all column pairs
+
+    Args:
+        n_jobs (int or None):
+            The number of processes used to compute the column pairs of each table.
+            Defaults to ``None``, which computes them sequentially.
+        executor (concurrent.futures.Executor or None):
+            An executor to compute the column pairs on instead of a new process pool.
+            Defaults to ``None``.
+        max_column_pairs (int or None):
+            The maximum number of column pairs to compute for each table. If there are more,
+            the score is estimated from a stratified sample of them. Defaults to ``None``.
+        time_budget (float or None):
+            The number of seconds after which no more column pairs of a table are computed.
+            Defaults to ``None``, which has no time limit.
+        random_state (int or None):
+            The seed used to sample the column pairs. Defaults to ``None``.
     """
 
     _single_table_property = SingleTableColumnPairTrends
     _num_iteration_case = 'column_pair'
+
+    def __init__(
+        self, n_jobs=None, executor=None, max_column_pairs=None, time_budget=None, random_state=None
+    ):
+        super().__init__()
+        self._single_table_property_kwargs = {
+            'n_jobs': n_jobs,
+            'executor': executor,
+            'max_column_pairs': max_column_pairs,
+            'time_budget': time_budget,
+            'random_state': random_state,
+        }
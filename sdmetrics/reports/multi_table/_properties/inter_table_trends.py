@@ -19,10 +19,38 @@ class InterTableTrends(BaseMultiTableProperty):
     and synthetic data columns across related tables. Each pair's correlation is
     calculated and the final score represents the average of these measures across
     all column pairs
+
+    Args:
+        n_jobs (int or None):
+            The number of processes used to compute the column pairs of each relationship.
+            Defaults to ``None``, which computes them sequentially.
+        executor (concurrent.futures.Executor or None):
+            An executor to compute the column pairs on instead of a new process pool.
+            Defaults to ``None``.
+        max_column_pairs (int or None):
+            The maximum number of column pairs to compute for each relationship. If there are more,
+            the score is estimated from a stratified sample of them. Defaults to ``None``.
+        time_budget (float or None):
+            The number of seconds after which no more column pairs of a relationship are computed.
+            Defaults to ``None``, which has no time limit.
+        random_state (int or None):
+            The seed used to sample the column pairs. Defaults to ``None``.
     """
 
     _num_iteration_case = 'inter_table_column_pair'
 
+    def __init__(
+        self, n_jobs=None, executor=None, max_column_pairs=None, time_budget=None, random_state=None
+    ):
+        super().__init__()
+        self._single_table_property_kwargs = {
+            'n_jobs': n_jobs,
+            'executor': executor,
+            'max_column_pairs': max_column_pairs,
+            'time_budget': time_budget,
+            'random_state': random_state,
+        }
+
     def _denormalize_tables(self, real_data, synthetic_data, relationship):
         """Merge a parent and child table into one denormalized table.
 
@@ -122,14 +150,18 @@ class InterTableTrends(BaseMultiTableProperty):
 
             parent_child_pairs = itertools.product(parent_cols, child_cols)
 
-            self._properties[(parent, child, foreign_key)] = SingleTableColumnPairTrends()
-            details = self._properties[(parent, child, foreign_key)]._generate_details(
+            relationship_property = SingleTableColumnPairTrends(
+                **self._single_table_property_kwargs
+            )
+            self._properties[(parent, child, foreign_key)] = relationship_property
+            details = relationship_property._generate_details(
                 denormalized_real,
                 denormalized_synthetic,
                 merged_metadata,
                 progress_bar=progress_bar,
                 column_pairs=parent_child_pairs,
             )
+            relationship_property.details = details.copy()
 
             details['Parent Table'] = parent
             details['Child Table'] = child
@@ -11,7 +11,26 @@ class Synthesis(BaseMultiTableProperty):
     The ``NewRowSynthesis`` metric is computed over the real and synthetic for each table
     to score the proportion of new rows in the synthetic data.
     The final score is the average over all tables.
+
+    Args:
+        synthetic_sample_size (int or None):
+            The maximum number of synthetic rows of each table to match against the real data.
+            If ``None``, all the synthetic rows are used. Defaults to 10000.
+        chunk_size (int or None):
+            The number of synthetic rows to match at a time. Defaults to ``None``, which
+            matches all the rows of a table at once.
+        n_jobs (int or None):
+            The number of processes used to match the chunks of synthetic rows.
+            Defaults to ``None``, which matches them sequentially.
     """
 
     _single_table_property = SingleTableSynthesis
     _num_iteration_case = 'table'
+
+    def __init__(self, synthetic_sample_size=10000, chunk_size=None, n_jobs=None):
+        super().__init__()
+        self._single_table_property_kwargs = {
+            'synthetic_sample_size': synthetic_sample_size,
+            'chunk_size': chunk_size,
+            'n_jobs': n_jobs,
+        }
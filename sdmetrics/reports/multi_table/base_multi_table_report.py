@@ -3,6 +3,7 @@
 import pandas as pd
 
 from sdmetrics.reports.base_report import BaseReport
+from sdmetrics.reports.utils import PreprocessingContext
 from sdmetrics.visualization import set_plotly_config
 
 
@@ -56,6 +57,35 @@ class BaseMultiTableReport(BaseReport):
                     f'The metadata for table "{table_name}" is missing a "columns" key.'
                 )
 
+    def _get_preprocessing_context(
+        self, real_data, synthetic_data, metadata, real_data_profile=None
+    ):
+        """Get the preprocessing context of each table, shared by the properties of the report.
+
+        Args:
+            real_data (dict[str, pandas.DataFrame]):
+                The real data.
+            synthetic_data (dict[str, pandas.DataFrame]):
+                The synthetic data.
+            metadata (dict):
+                The metadata, which contains each column's data type as well as relationships.
+            real_data_profile (sdmetrics.reports.utils.RealDataProfile or None):
+                The profile to share the real statistics with. Defaults to None.
+
+        Returns:
+            dict:
+                A mapping of each table name to its preprocessing context.
+        """
+        return {
+            table_name: PreprocessingContext(
+                real_data[table_name],
+                synthetic_data[table_name],
+                table_metadata,
+                None if real_data_profile is None else real_data_profile.get_real_cache(table_name),
+            )
+            for table_name, table_metadata in metadata['tables'].items()
+        }
+
     def _validate_relationships(self, real_data, synthetic_data, metadata):
         """Validate that the relationships are valid."""
         for rel in metadata.get('relationships', []):
@@ -85,23 +115,26 @@ class BaseMultiTableReport(BaseReport):
 
         self._validate_relationships(real_data, synthetic_data, metadata)
 
-    def generate(self, real_data, synthetic_data, metadata, verbose=True):
+    def generate(self, real_data, synthetic_data, metadata, verbose=True, concurrency=None):
         """Generate report.
 
         This method generates the report by iterating through each property and calculating
         the score for each property.
 
         Args:
-            real_data (pandas.DataFrame):
-                The real data.
+            real_data (dict[str, pandas.DataFrame] or sdmetrics.reports.RealDataProfile):
+                The real data, or a profile of it to reuse its real statistics.
             synthetic_data (pandas.DataFrame):
                 The synthetic data.
             metadata (dict):
                 The metadata, which contains each column's data type as well as relationships.
             verbose (bool):
                 Whether or not to print report summary and progress.
+            concurrency (str or None):
+                Whether to compute the properties at the same time on a ``'thread'`` or
+                ``'process'`` pool. Defaults to ``None``, which computes them one at a time.
         """
-        results = super().generate(real_data, synthetic_data, metadata, verbose)
+        results = super().generate(real_data, synthetic_data, metadata, verbose, concurrency)
         self.table_names = list(metadata.get('tables', {}).keys())
 
         return results
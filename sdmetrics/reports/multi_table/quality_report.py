@@ -24,3 +24,63 @@ class QualityReport(BaseMultiTableReport):
             'Cardinality': Cardinality(),
             'Intertable Trends': InterTableTrends(),
         }
+
+    def generate(
+        self,
+        real_data,
+        synthetic_data,
+        metadata,
+        verbose=True,
+        n_jobs=None,
+        executor=None,
+        concurrency=None,
+        max_column_pairs=None,
+        time_budget=None,
+        random_state=None,
+    ):
+        """Generate report.
+
+        This method generates the report by iterating through each property and calculating
+        the score for each property.
+
+        Args:
+            real_data (dict[str, pandas.DataFrame] or sdmetrics.reports.RealDataProfile):
+                The real data, or a profile of it to reuse its real statistics.
+            synthetic_data (dict[str, pandas.DataFrame]):
+                The synthetic data.
+            metadata (dict):
+                The metadata, which contains each column's data type as well as relationships.
+            verbose (bool):
+                Whether or not to print report summary and progress.
+            n_jobs (int or None):
+                The number of processes used to compute the column pairs. ``-1`` uses all
+                the CPUs. Defaults to ``None``, which computes them sequentially.
+            executor (concurrent.futures.Executor or None):
+                An executor to compute the column pairs on instead of a new process pool.
+                If given, ``n_jobs`` is ignored. Defaults to ``None``.
+            concurrency (str or None):
+                Whether to compute the properties at the same time on a ``'thread'`` or
+                ``'process'`` pool. Defaults to ``None``, which computes them one at a time.
+            max_column_pairs (int or None):
+                The maximum number of column pairs to compute for each table or relationship.
+                If there are more, the score is estimated from a sample of them stratified by
+                their sdtypes and the estimate is stored in the ``property_estimates`` of the
+                report info.
+                Defaults to ``None``, which computes all the column pairs.
+            time_budget (float or None):
+                The number of seconds after which no more column pairs of a table or
+                relationship are computed. Defaults to ``None``, which has no time limit.
+            random_state (int or None):
+                The seed used to sample the column pairs, so that the estimated score can be
+                reproduced. Defaults to ``None``.
+        """
+        pair_kwargs = {
+            'n_jobs': n_jobs,
+            'executor': executor,
+            'max_column_pairs': max_column_pairs,
+            'random_state': random_state,
+            'time_budget': time_budget,
+        }
+        self._properties['Column Pair Trends'] = ColumnPairTrends(**pair_kwargs)
+        self._properties['Intertable Trends'] = InterTableTrends(**pair_kwargs)
+        super().generate(real_data, synthetic_data, metadata, verbose, concurrency)
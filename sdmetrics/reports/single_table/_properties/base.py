@@ -2,6 +2,8 @@
 
 import pandas as pd
 
+from sdmetrics.reports.utils import PreprocessingContext
+
 
 class BaseSingleTableProperty:
     """Base class for single table properties.
@@ -14,14 +16,29 @@ class BaseSingleTableProperty:
 
     def __init__(self):
         self.details = pd.DataFrame()
+        self._context = None
 
     def _compute_average(self):
         """Average the scores for each column."""
         if not isinstance(self.details, pd.DataFrame) or 'Score' not in self.details.columns:
             raise ValueError("The property details must be a DataFrame with a 'Score' column.")
 
+        estimate = self._get_estimate()
+        if estimate is not None:
+            return estimate['score']
+
         return self.details['Score'].mean()
 
+    def _get_estimate(self):
+        """Get the estimate of the score if only a sample of the data was scored.
+
+        Returns:
+            dict or None:
+                The estimated ``score`` with its ``standard_error``, or ``None`` if the
+                score was computed exactly.
+        """
+        return None
+
     def _generate_details(self, real_data, synthetic_data, metadata, progress_bar=None):
         """Generate the _details dataframe for the property."""
         raise NotImplementedError()
@@ -35,7 +52,14 @@ class BaseSingleTableProperty:
         elif self._num_iteration_case == 'column_pair':
             return int(len(metadata['columns']) * (len(metadata['columns']) - 1) / 2)
 
-    def get_score(self, real_data, synthetic_data, metadata, progress_bar=None):
+    def _get_context(self, real_data, synthetic_data, metadata):
+        """Get the preprocessing context given to ``get_score``, or a new one for the data."""
+        if self._context is not None and self._context.matches(real_data, synthetic_data):
+            return self._context
+
+        return PreprocessingContext(real_data, synthetic_data, metadata)
+
+    def get_score(self, real_data, synthetic_data, metadata, progress_bar=None, context=None):
         """Get the average score for the property on the data.
 
         Args:
@@ -47,12 +71,20 @@ class BaseSingleTableProperty:
                 The metadata, which contains each column's data type as well as relationships.
             progress_bar (tqdm.tqdm or None):
                 The progress bar object. Defaults to None.
+            context (sdmetrics.reports.utils.PreprocessingContext or None):
+                The preprocessed columns shared with the other properties of a report.
+                Defaults to None.
 
         Returns:
             float:
                 The average score for the property.
         """
-        self.details = self._generate_details(real_data, synthetic_data, metadata, progress_bar)
+        self._context = context
+        try:
+            self.details = self._generate_details(real_data, synthetic_data, metadata, progress_bar)
+        finally:
+            self._context = None
+
         return self._compute_average()
 
     def get_visualization(self):
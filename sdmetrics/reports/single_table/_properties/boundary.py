@@ -35,6 +35,7 @@ class Boundary(BaseSingleTableProperty):
         Returns:
             pandas.DataFrame
         """
+        context = self._get_context(real_data, synthetic_data, metadata)
         column_names, metric_names, scores = [], [], []
         error_messages = []
         for column_name in metadata['columns']:
@@ -42,10 +43,12 @@ class Boundary(BaseSingleTableProperty):
             error_message = None
             try:
                 if sdtype in ('numerical', 'datetime'):
-                    real_column = real_data[column_name]
-                    synthetic_column = synthetic_data[column_name]
-                    real_column_is_na = all(real_column.isna())
-                    synthetic_column_is_na = all(synthetic_column.isna())
+                    real_profile = context.get_column_profile(column_name)
+                    synthetic_profile = context.get_column_profile(column_name, synthetic=True)
+                    real_column_is_na = real_profile.num_nulls == real_profile.num_rows
+                    synthetic_column_is_na = (
+                        synthetic_profile.num_nulls == synthetic_profile.num_rows
+                    )
 
                     if real_column_is_na and synthetic_column_is_na:
                         raise InvalidDataError('All NaN values in both real and synthetic data.')
@@ -54,7 +57,7 @@ class Boundary(BaseSingleTableProperty):
                     elif synthetic_column_is_na:
                         raise InvalidDataError('All NaN values in synthetic data.')
                     else:
-                        column_score = self.metric.compute(real_column, synthetic_column)
+                        column_score = self.metric.compute(real_profile, synthetic_profile)
 
                 else:
                     continue
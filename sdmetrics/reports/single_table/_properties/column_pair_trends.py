@@ -1,4 +1,7 @@
 import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 import numpy as np
 import pandas as pd
@@ -7,8 +10,27 @@ from plotly.subplots import make_subplots
 
 from sdmetrics.column_pairs.statistical import ContingencySimilarity, CorrelationSimilarity
 from sdmetrics.reports.single_table._properties import BaseSingleTableProperty
-from sdmetrics.reports.utils import PlotConfig
-from sdmetrics.utils import is_datetime
+from sdmetrics.reports.utils import PlotConfig, PreprocessingContext
+
+PAIR_CHUNK_SIZE = 32
+BUDGET_BATCH_SIZE = 64
+_WORKER_DATA = {}
+
+
+def _initialize_worker(column_pair_trends, data):
+    _WORKER_DATA['property'] = column_pair_trends
+    _WORKER_DATA['data'] = data
+
+
+def _compute_pairs(column_pair_trends, data, column_pairs):
+    return [
+        column_pair_trends._compute_pair(column_name_1, column_name_2, *data)
+        for column_name_1, column_name_2 in column_pairs
+    ]
+
+
+def _compute_worker_pairs(column_pairs):
+    return _compute_pairs(_WORKER_DATA['property'], _WORKER_DATA['data'], column_pairs)
 
 
 class ColumnPairTrends(BaseSingleTableProperty):
@@ -17,6 +39,25 @@ class ColumnPairTrends(BaseSingleTableProperty):
     This property evaluates the matching in trends between pairs of real
     and synthetic data columns. Each pair's correlation is calculated and
     the final score represents the average of these measures across all column pairs
+
+    Args:
+        n_jobs (int or None):
+            The number of processes used to compute the pairs that are not computed all at
+            once. ``-1`` uses all the CPUs. Defaults to ``None``, which computes them
+            sequentially.
+        executor (concurrent.futures.Executor or None):
+            An executor to compute those pairs on instead of a new process pool. If given,
+            ``n_jobs`` is ignored. Defaults to ``None``.
+        max_column_pairs (int or None):
+            The maximum number of pairs to compute. If there are more pairs, a sample stratified
+            by the shapes of the columns is computed and the score is an estimate. Defaults to
+            ``None``, which computes all the pairs.
+        time_budget (float or None):
+            The number of seconds after which no more pairs are computed. The budget is checked
+            between batches of pairs, so it may be exceeded by the time of one batch. Defaults
+            to ``None``, which has no time limit.
+        random_state (int or None):
+            The seed used to sample the pairs. Defaults to ``None``.
     """
 
     _num_iteration_case = 'column_pair'
@@ -27,11 +68,50 @@ class ColumnPairTrends(BaseSingleTableProperty):
         'boolean': 'discrete',
     }
 
-    def __init__(self):
+    def __init__(
+        self,
+        n_jobs=None,
+        executor=None,
+        max_column_pairs=None,
+        time_budget=None,
+        random_state=None,
+    ):
+        if n_jobs is not None and n_jobs != -1 and (not isinstance(n_jobs, int) or n_jobs < 1):
+            raise ValueError('`n_jobs` must be None, -1 or an integer greater than zero.')
+
+        if max_column_pairs is not None and (
+            not isinstance(max_column_pairs, int) or max_column_pairs < 1
+        ):
+            raise ValueError('`max_column_pairs` must be None or an integer greater than zero.')
+
+        if time_budget is not None and (
+            not isinstance(time_budget, (int, float)) or time_budget <= 0
+        ):
+            raise ValueError('`time_budget` must be None or a number greater than zero.')
+
+        super().__init__()
+        self.n_jobs = n_jobs
+        self.executor = executor
+        self.max_column_pairs = max_column_pairs
+        self.time_budget = time_budget
+        self.random_state = random_state
+        self._estimate = None
         self._columns_datetime_conversion_failed = {}
         self._columns_discretization_failed = {}
 
-    def _convert_datetime_columns_to_numeric(self, data, metadata):
+    def _get_num_iterations(self, metadata):
+        """Get the number of iterations for the property."""
+        num_iterations = super()._get_num_iterations(metadata)
+        if self.max_column_pairs is not None:
+            num_iterations = min(num_iterations, self.max_column_pairs)
+
+        return num_iterations
+
+    def _get_estimate(self):
+        """Get the estimate of the score if only a sample of the column pairs was computed."""
+        return self._estimate
+
+    def _convert_datetime_columns_to_numeric(self, data, metadata, context=None, synthetic=False):
         """Convert all the datetime columns to numeric columns.
 
         Args:
@@ -39,35 +119,30 @@ class ColumnPairTrends(BaseSingleTableProperty):
                 The data to convert.
             metadata (dict):
                 The table metadata.
+            context (sdmetrics.reports.utils.PreprocessingContext or None):
+                The context to get the converted columns from. Defaults to None, which
+                converts them from ``data``.
+            synthetic (bool):
+                Whether ``data`` is the synthetic data of the context. Defaults to False.
 
         Returns:
-            pandas.Series:
-                The converted column.
+            pandas.DataFrame:
+                The data with the converted columns. The other columns are not copied.
         """
+        context = context or PreprocessingContext(data, data, metadata)
+        columns = {column_name: data[column_name] for column_name in data.columns}
         for column_name in metadata['columns']:
             column_meta = metadata['columns'][column_name]
-            col_sdtype = column_meta['sdtype']
-            try:
-                if col_sdtype == 'datetime':
-                    if not is_datetime(data[column_name]):
-                        datetime_format = column_meta.get(
-                            'datetime_format', column_meta.get('format')
-                        )
-                        data[column_name] = pd.to_datetime(
-                            data[column_name], format=datetime_format
-                        )
-                    nan_mask = pd.isna(data[column_name])
-                    data[column_name] = pd.to_numeric(data[column_name])
-                    if nan_mask.any():
-                        data.loc[nan_mask, column_name] = np.nan
-
+            if column_meta['sdtype'] != 'datetime':
                 continue
+
+            try:
+                columns[column_name] = context.get_numeric_column(column_name, synthetic)
             except Exception as e:
                 message = f'{type(e).__name__}: {e}'
                 self._columns_datetime_conversion_failed[column_name] = message
-                continue
 
-        return data
+        return pd.DataFrame(columns, index=data.index, copy=False)
 
     def _discretize_column(self, column_name, data, bin_edges=None):
         """Discretize a column.
@@ -98,7 +173,22 @@ class ColumnPairTrends(BaseSingleTableProperty):
 
         return column_result, bin_edges
 
-    def _get_processed_data(self, data, metadata):
+    def _get_real_discretized_column(self, column_name, column, context):
+        """Discretize a real column, or get it from the real statistics of the context."""
+
+        def discretize():
+            discretized_column, _ = self._discretize_column(column_name, column)
+            return discretized_column, self._columns_discretization_failed.get(column_name)
+
+        discretized_column, error = context.get_real_statistic(
+            ('discretized_column', column_name), discretize
+        )
+        if error is not None:
+            self._columns_discretization_failed[column_name] = error
+
+        return discretized_column
+
+    def _get_processed_data(self, data, metadata, context=None, synthetic=False):
         """Get the processed data for the property.
 
         Preprocess the data by converting datetime columns to numeric and
@@ -109,19 +199,30 @@ class ColumnPairTrends(BaseSingleTableProperty):
                 The data
             metadata (dict):
                 The metadata of the table
+            context (sdmetrics.reports.utils.PreprocessingContext or None):
+                The context to get the converted datetime columns from. Defaults to None.
+            synthetic (bool):
+                Whether ``data`` is the synthetic data of the context. Defaults to False.
         """
-        processed_data = data.copy()
         discretized_dict = {}
-
-        processed_data = self._convert_datetime_columns_to_numeric(processed_data, metadata)
+        processed_data = self._convert_datetime_columns_to_numeric(
+            data, metadata, context, synthetic
+        )
 
         for column_name in metadata['columns']:
             column_meta = metadata['columns'][column_name]
             column_sdtype = column_meta['sdtype']
-            if column_sdtype in ['numerical', 'datetime']:
+            if column_sdtype not in ['numerical', 'datetime']:
+                continue
+
+            if context is None or synthetic:
                 discretized_dict[column_name], _ = self._discretize_column(
                     column_name, processed_data[column_name]
                 )
+            else:
+                discretized_dict[column_name] = self._get_real_discretized_column(
+                    column_name, processed_data[column_name], context
+                )
 
         return processed_data, pd.DataFrame(discretized_dict, index=processed_data.index)
 
@@ -186,6 +287,191 @@ class ColumnPairTrends(BaseSingleTableProperty):
 
         return data_real, data_synthetic, metric
 
+    def _get_continuous_correlations(
+        self, real_data, synthetic_data, metadata, column_pairs=None, context=None
+    ):
+        """Compute the correlations of every pair of continuous columns at once.
+
+        Args:
+            real_data (pandas.DataFrame):
+                The processed real data.
+            synthetic_data (pandas.DataFrame):
+                The processed synthetic data.
+            metadata (dict):
+                The metadata of the table.
+            column_pairs (list[tuple[str, str]] or None):
+                The pairs of columns to restrict the correlations to. Defaults to None, which
+                computes every pair of continuous columns.
+            context (sdmetrics.reports.utils.PreprocessingContext or None):
+                The context to get the real correlations from. Defaults to None.
+
+        Returns:
+            dict or None:
+                The ``CorrelationSimilarity`` matrix breakdown of the numerical continuous
+                columns, or ``None`` if it could not be computed.
+        """
+        column_names = None
+        if column_pairs is not None:
+            column_names = set(itertools.chain.from_iterable(column_pairs))
+
+        continuous_columns = []
+        for column_name, column_meta in metadata['columns'].items():
+            if column_names is not None and column_name not in column_names:
+                continue
+
+            is_continuous = self._sdtype_to_shape.get(column_meta['sdtype']) == 'continuous'
+            if (
+                is_continuous
+                and column_name not in self._columns_datetime_conversion_failed
+                and column_name in real_data
+                and column_name in synthetic_data
+                and pd.api.types.is_numeric_dtype(real_data[column_name])
+                and pd.api.types.is_numeric_dtype(synthetic_data[column_name])
+            ):
+                continuous_columns.append(column_name)
+
+        if len(continuous_columns) < 2:
+            return None
+
+        correlation_pairs = None
+        if column_pairs is not None:
+            continuous_names = set(continuous_columns)
+            correlation_pairs = [
+                (column_name_1, column_name_2)
+                for column_name_1, column_name_2 in column_pairs
+                if column_name_1 in continuous_names and column_name_2 in continuous_names
+            ]
+
+        try:
+            real_correlation = None
+            if context is not None:
+                real_correlation = context.get_real_statistic(
+                    (
+                        'correlation_matrix',
+                        tuple(continuous_columns),
+                        None if correlation_pairs is None else tuple(correlation_pairs),
+                    ),
+                    lambda: CorrelationSimilarity.compute_correlation_matrix(
+                        real_data[continuous_columns], column_pairs=correlation_pairs
+                    ),
+                )
+
+            return CorrelationSimilarity.compute_matrix_breakdown(
+                real_data[continuous_columns],
+                synthetic_data[continuous_columns],
+                real_correlation=real_correlation,
+                column_pairs=correlation_pairs,
+            )
+        except Exception:
+            return None
+
+    def _get_contingency_scores(
+        self,
+        real_data,
+        real_discrete_data,
+        synthetic_data,
+        synthetic_discrete_data,
+        metadata,
+        column_pairs,
+        context=None,
+    ):
+        """Compute the contingency similarity of every pair with a discrete column at once.
+
+        The continuous columns use their discretized version, like in
+        ``_get_columns_data_and_metric``, and each column is integer-coded only once.
+        The codes of the discrete columns are taken from the ``context`` if given.
+
+        Args:
+            real_data (pandas.DataFrame):
+                The processed real data.
+            real_discrete_data (pandas.DataFrame):
+                The real data with discrete versions of the continuous columns.
+            synthetic_data (pandas.DataFrame):
+                The processed synthetic data.
+            synthetic_discrete_data (pandas.DataFrame):
+                The synthetic data with discrete versions of the continuous columns.
+            metadata (dict):
+                The metadata of the table.
+            column_pairs (list[tuple[str, str]]):
+                The pairs of columns of the property.
+            context (sdmetrics.reports.utils.PreprocessingContext or None):
+                The context of the data. Defaults to None.
+
+        Returns:
+            dict:
+                A mapping of the pairs that could be computed to their score.
+        """
+        real_columns = {}
+        synthetic_columns = {}
+        discrete_columns = []
+        for column_name, column_meta in metadata['columns'].items():
+            shape = self._sdtype_to_shape.get(column_meta['sdtype'])
+            if shape == 'discrete' and column_name in real_data and column_name in synthetic_data:
+                real_columns[column_name] = real_data[column_name]
+                synthetic_columns[column_name] = synthetic_data[column_name]
+                discrete_columns.append(column_name)
+            elif (
+                shape == 'continuous'
+                and column_name in real_discrete_data
+                and column_name in synthetic_discrete_data
+                and column_name not in self._columns_datetime_conversion_failed
+                and column_name not in self._columns_discretization_failed
+            ):
+                real_columns[column_name] = real_discrete_data[column_name]
+                synthetic_columns[column_name] = synthetic_discrete_data[column_name]
+
+        contingency_pairs = []
+        for column_name_1, column_name_2 in column_pairs:
+            if column_name_1 not in real_columns or column_name_2 not in real_columns:
+                continue
+
+            shape_col_1 = self._sdtype_to_shape[metadata['columns'][column_name_1]['sdtype']]
+            shape_col_2 = self._sdtype_to_shape[metadata['columns'][column_name_2]['sdtype']]
+            if shape_col_1 == 'discrete' or shape_col_2 == 'discrete':
+                contingency_pairs.append((column_name_1, column_name_2))
+
+        try:
+            column_codes = {}
+            if context is not None:
+                used_columns = set(itertools.chain.from_iterable(contingency_pairs))
+                column_codes = {
+                    column_name: context.get_codes(column_name)
+                    for column_name in discrete_columns
+                    if column_name in used_columns
+                }
+
+            return ContingencySimilarity.compute_pairs(
+                real_columns, synthetic_columns, contingency_pairs, column_codes=column_codes
+            )
+        except Exception:
+            return {}
+
+    @staticmethod
+    def _get_correlation_breakdown(correlations, column_name_1, column_name_2):
+        """Get the breakdown of a pair of columns from the precomputed correlations.
+
+        Returns:
+            dict or None:
+                The score breakdown, or ``None`` if the pair was not precomputed or
+                its correlation is undefined.
+        """
+        if correlations is None:
+            return None
+
+        scores = correlations['score']
+        if column_name_1 not in scores or column_name_2 not in scores:
+            return None
+
+        score = scores.loc[column_name_1, column_name_2]
+        if np.isnan(score):
+            return None
+
+        return {
+            'score': score,
+            'real': correlations['real'].loc[column_name_1, column_name_2],
+            'synthetic': correlations['synthetic'].loc[column_name_1, column_name_2],
+        }
+
     def _preprocessing_failed(self, column_name_1, column_name_2, sdtype_col_1, sdtype_col_2):
         """Check if a processing of one of the columns has failed.
 
@@ -214,52 +500,245 @@ class ColumnPairTrends(BaseSingleTableProperty):
 
         return error
 
-    def _generate_details(
-        self, real_data, synthetic_data, metadata, progress_bar=None, column_pairs=None
+    def _compute_pair(
+        self,
+        column_name_1,
+        column_name_2,
+        real_data,
+        real_discrete_data,
+        synthetic_data,
+        synthetic_discrete_data,
+        metadata,
+        precomputed_breakdown=None,
     ):
-        """Generate the _details dataframe for the column pair trends property.
+        """Compute the details row of a pair of columns.
 
         Args:
+            column_name_1 (str):
+                The name of the first column
+            column_name_2 (str):
+                The name of the second column
             real_data (pandas.DataFrame):
-                The real data
+                The processed real data
+            real_discrete_data (pandas.DataFrame):
+                The real data with discrete versions of the continuous columns
             synthetic_data (pandas.DataFrame):
-                The synthetic data
+                The processed synthetic data
+            synthetic_discrete_data (pandas.DataFrame):
+                The synthetic data with discrete versions of the continuous columns
             metadata (dict):
                 The metadata of the table
-            progress_bar:
-                The progress bar to use. Defaults to None.
-            column_pairs (list[tuple[str, str]]):
-                Pairs of columns to calculate results for. If None, uses every combination of
-                pairs of columns in the metadata. Defaults to None.
+            precomputed_breakdown (dict or None):
+                The score breakdown of the pair if it was already computed. Defaults to None.
+
+        Returns:
+            tuple:
+                The column names, metric name, score, real and synthetic correlations
+                and error of the pair.
         """
-        processed_real_data, discrete_real = self._get_processed_data(real_data, metadata)
-        processed_synthetic_data, discrete_synthetic = self._get_processed_data(
-            synthetic_data, metadata
+        sdtype_col_1 = metadata['columns'][column_name_1]['sdtype']
+        sdtype_col_2 = metadata['columns'][column_name_2]['sdtype']
+        shape_col_1 = self._sdtype_to_shape[sdtype_col_1]
+        shape_col_2 = self._sdtype_to_shape[sdtype_col_2]
+        if precomputed_breakdown is None:
+            columns_real, columns_synthetic, metric = self._get_columns_data_and_metric(
+                column_name_1,
+                column_name_2,
+                real_data,
+                real_discrete_data,
+                synthetic_data,
+                synthetic_discrete_data,
+                metadata,
+            )
+        elif shape_col_1 == shape_col_2 == 'continuous':
+            metric = CorrelationSimilarity
+        else:
+            metric = ContingencySimilarity
+
+        error = None
+        try:
+            error = self._preprocessing_failed(
+                column_name_1, column_name_2, sdtype_col_1, sdtype_col_2
+            )
+            if error:
+                raise Exception('Preprocessing failed')
+
+            if precomputed_breakdown is None:
+                score_breakdown = metric.compute_breakdown(
+                    real_data=columns_real, synthetic_data=columns_synthetic
+                )
+            else:
+                score_breakdown = precomputed_breakdown
+
+            pair_score = score_breakdown['score']
+            if metric.__name__ == 'CorrelationSimilarity':
+                real_correlation = score_breakdown['real']
+                synthetic_correlation = score_breakdown['synthetic']
+            else:
+                real_correlation = np.nan
+                synthetic_correlation = np.nan
+
+        except Exception as e:
+            pair_score = np.nan
+            real_correlation = np.nan
+            synthetic_correlation = np.nan
+            if not str(e) == 'Preprocessing failed':
+                error = f'{type(e).__name__}: {e}'
+
+        return (
+            column_name_1,
+            column_name_2,
+            metric.__name__,
+            pair_score,
+            real_correlation,
+            synthetic_correlation,
+            error,
+        )
+
+    def _get_worker_property(self):
+        """Get a copy of the property with only the state needed to compute the pairs."""
+        worker_property = ColumnPairTrends()
+        worker_property._columns_datetime_conversion_failed = (
+            self._columns_datetime_conversion_failed
+        )
+        worker_property._columns_discretization_failed = self._columns_discretization_failed
+        return worker_property
+
+    @staticmethod
+    def _select_columns(data, column_pairs):
+        """Select the columns used by the given pairs from the data of the property."""
+        column_names = list(dict.fromkeys(itertools.chain.from_iterable(column_pairs)))
+        frames = tuple(
+            frame[[column_name for column_name in column_names if column_name in frame]]
+            for frame in data[:-1]
         )
+        return (*frames, data[-1])
 
-        column_names_1 = []
-        column_names_2 = []
-        metric_names = []
-        scores = []
-        real_correlations = []
-        synthetic_correlations = []
-        error_messages = []
+    def _compute_pairs_in_parallel(self, column_pairs, data):
+        """Compute the details rows of the pairs in chunks on the executor or a process pool.
 
-        list_dtypes = self._sdtype_to_shape.keys()
+        When the property creates its own process pool, the data is sent once to each worker.
+        When an ``executor`` is given, each chunk is sent along with the columns it uses.
 
-        column_pairs = (
-            itertools.combinations(list(metadata['columns']), r=2)
-            if column_pairs is None
-            else column_pairs
+        Args:
+            column_pairs (list[tuple[str, str]]):
+                The pairs of columns to compute.
+            data (tuple):
+                The processed and discrete real and synthetic data, and the metadata.
+
+        Yields:
+            tuple[int, list]:
+                The position of the first pair of a chunk and the rows of the chunk,
+                as soon as the chunk is computed.
+        """
+        worker_property = self._get_worker_property()
+        starts = range(0, len(column_pairs), PAIR_CHUNK_SIZE)
+        if self.executor is not None:
+            futures = {
+                self.executor.submit(
+                    _compute_pairs,
+                    worker_property,
+                    self._select_columns(data, column_pairs[start : start + PAIR_CHUNK_SIZE]),
+                    column_pairs[start : start + PAIR_CHUNK_SIZE],
+                ): start
+                for start in starts
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
+            return
+
+        max_workers = os.cpu_count() if self.n_jobs == -1 else self.n_jobs
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_initialize_worker,
+            initargs=(worker_property, data),
+        ) as executor:
+            futures = {
+                executor.submit(
+                    _compute_worker_pairs, column_pairs[start : start + PAIR_CHUNK_SIZE]
+                ): start
+                for start in starts
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
+    def _get_precomputed_scores(self, column_pairs, data, context, restrict_to_pairs=False):
+        """Compute the scores of the pairs that can be computed all at once.
+
+        Args:
+            column_pairs (list[tuple[str, str]]):
+                The pairs of columns of the property.
+            data (tuple):
+                The processed and discrete real and synthetic data, and the metadata.
+            context (sdmetrics.reports.utils.PreprocessingContext):
+                The context of the data.
+            restrict_to_pairs (bool):
+                Whether to compute the correlations of ``column_pairs`` only, instead of
+                every pair of continuous columns. Defaults to False.
+
+        Returns:
+            tuple[dict or None, dict]:
+                The continuous correlations and the contingency scores.
+        """
+        (
+            processed_real_data,
+            discrete_real,
+            processed_synthetic_data,
+            discrete_synthetic,
+            metadata,
+        ) = data
+        correlations = self._get_continuous_correlations(
+            processed_real_data,
+            processed_synthetic_data,
+            metadata,
+            column_pairs if restrict_to_pairs else None,
+            context,
+        )
+        contingency_scores = self._get_contingency_scores(
+            processed_real_data,
+            discrete_real,
+            processed_synthetic_data,
+            discrete_synthetic,
+            metadata,
+            column_pairs,
+            context,
         )
-        for column_names in column_pairs:
-            column_name_1 = column_names[0]
-            column_name_2 = column_names[1]
+        return correlations, contingency_scores
 
+    def _compute_rows(self, column_pairs, data, context, progress_bar=None, precomputed=None):
+        """Compute the details rows of the given pairs of columns.
+
+        Args:
+            column_pairs (list[tuple[str, str]]):
+                The pairs of columns to compute.
+            data (tuple):
+                The processed and discrete real and synthetic data, and the metadata.
+            context (sdmetrics.reports.utils.PreprocessingContext):
+                The context of the data.
+            progress_bar (tqdm.tqdm or None):
+                The progress bar to use. Defaults to None.
+            precomputed (tuple or None):
+                The continuous correlations and contingency scores from
+                ``_get_precomputed_scores``. Defaults to None, which computes them.
+
+        Returns:
+            list[tuple]:
+                The row of each pair with valid sdtypes, in the order of the pairs.
+        """
+        metadata = data[-1]
+        if precomputed is None:
+            precomputed = self._get_precomputed_scores(column_pairs, data, context)
+
+        correlations, contingency_scores = precomputed
+
+        parallel = self.executor is not None or self.n_jobs not in (None, 1)
+        rows = [None] * len(column_pairs)
+        pending_pairs = []
+        list_dtypes = self._sdtype_to_shape.keys()
+        for idx, (column_name_1, column_name_2) in enumerate(column_pairs):
             sdtype_col_1 = metadata['columns'][column_name_1]['sdtype']
             sdtype_col_2 = metadata['columns'][column_name_2]['sdtype']
-
-            error = None
             valid_sdtypes = sdtype_col_1 in list_dtypes and sdtype_col_2 in list_dtypes
             if not valid_sdtypes:
                 if progress_bar:
@@ -267,60 +746,226 @@ class ColumnPairTrends(BaseSingleTableProperty):
 
                 continue
 
-            columns_real, columns_synthetic, metric = self._get_columns_data_and_metric(
-                column_name_1,
-                column_name_2,
-                processed_real_data,
-                discrete_real,
-                processed_synthetic_data,
-                discrete_synthetic,
-                metadata,
-            )
-
-            try:
-                error = self._preprocessing_failed(
-                    column_name_1, column_name_2, sdtype_col_1, sdtype_col_2
+            precomputed_breakdown = None
+            shape_col_1 = self._sdtype_to_shape[sdtype_col_1]
+            shape_col_2 = self._sdtype_to_shape[sdtype_col_2]
+            if shape_col_1 == shape_col_2 == 'continuous':
+                precomputed_breakdown = self._get_correlation_breakdown(
+                    correlations, column_name_1, column_name_2
                 )
-                if error:
-                    raise Exception('Preprocessing failed')
+            elif (column_name_1, column_name_2) in contingency_scores:
+                precomputed_breakdown = {'score': contingency_scores[column_name_1, column_name_2]}
 
-                score_breakdown = metric.compute_breakdown(
-                    real_data=columns_real, synthetic_data=columns_synthetic
-                )
-                pair_score = score_breakdown['score']
-                if metric.__name__ == 'CorrelationSimilarity':
-                    real_correlation = score_breakdown['real']
-                    synthetic_correlation = score_breakdown['synthetic']
-                else:
-                    real_correlation = np.nan
-                    synthetic_correlation = np.nan
+            if precomputed_breakdown is None and parallel:
+                pending_pairs.append(idx)
+                continue
+
+            rows[idx] = self._compute_pair(
+                column_name_1, column_name_2, *data, precomputed_breakdown=precomputed_breakdown
+            )
+            if progress_bar:
+                progress_bar.update()
+
+        if pending_pairs:
+            pairs = [column_pairs[idx] for idx in pending_pairs]
+            for start, chunk_rows in self._compute_pairs_in_parallel(pairs, data):
+                for idx, row in zip(pending_pairs[start : start + len(chunk_rows)], chunk_rows):
+                    rows[idx] = row
 
-            except Exception as e:
-                pair_score = np.nan
-                real_correlation = np.nan
-                synthetic_correlation = np.nan
-                if not str(e) == 'Preprocessing failed':
-                    error = f'{type(e).__name__}: {e}'
-            finally:
                 if progress_bar:
-                    progress_bar.update()
+                    progress_bar.update(len(chunk_rows))
+
+        return [row for row in rows if row is not None]
 
-            column_names_1.append(column_name_1)
-            column_names_2.append(column_name_2)
-            metric_names.append(metric.__name__)
-            scores.append(pair_score)
-            real_correlations.append(real_correlation)
-            synthetic_correlations.append(synthetic_correlation)
-            error_messages.append(error)
+    def _get_stratified_pairs(self, column_pairs, metadata):
+        """Shuffle the pairs of columns so that any prefix is a stratified sample of them.
 
+        The pairs with valid sdtypes are split in strata by the shapes of their columns:
+        ``'continuous'``, ``'discrete'`` and ``'mixed'``. Each stratum is shuffled and the
+        strata are interleaved proportionally to their size, starting with one pair of
+        each stratum.
+
+        Args:
+            column_pairs (list[tuple[str, str]]):
+                The pairs of columns to sample from.
+            metadata (dict):
+                The metadata of the table.
+
+        Returns:
+            tuple[list, dict]:
+                The shuffled pairs and a mapping of each pair to its stratum.
+        """
+        strata = {}
+        for column_name_1, column_name_2 in column_pairs:
+            shape_col_1 = self._sdtype_to_shape.get(metadata['columns'][column_name_1]['sdtype'])
+            shape_col_2 = self._sdtype_to_shape.get(metadata['columns'][column_name_2]['sdtype'])
+            if shape_col_1 is None or shape_col_2 is None:
+                continue
+
+            stratum = shape_col_1 if shape_col_1 == shape_col_2 else 'mixed'
+            strata.setdefault(stratum, []).append((column_name_1, column_name_2))
+
+        random_state = np.random.RandomState(self.random_state)
+        shuffled_pairs = []
+        positions = []
+        pair_strata = {}
+        for stratum, stratum_pairs in strata.items():
+            num_pairs = len(stratum_pairs)
+            stratum_positions = np.arange(num_pairs) + random_state.uniform(size=num_pairs)
+            stratum_positions[0] = 0
+            for idx in random_state.permutation(num_pairs):
+                shuffled_pairs.append(stratum_pairs[idx])
+                pair_strata[stratum_pairs[idx]] = stratum
+
+            positions.extend(stratum_positions / num_pairs)
+
+        order = np.argsort(positions, kind='stable')
+        return [shuffled_pairs[idx] for idx in order], pair_strata
+
+    @staticmethod
+    def _get_stratified_estimate(rows, pair_strata):
+        """Estimate the average score of all the pairs from the scores of a stratified sample.
+
+        Args:
+            rows (list[tuple]):
+                The details rows of the sampled pairs.
+            pair_strata (dict):
+                A mapping of every pair of columns to its stratum.
+
+        Returns:
+            dict:
+                The estimated score, its standard error, the number of pairs and
+                the number of pairs that were computed.
+        """
+        stratum_sizes = pd.Series(list(pair_strata.values())).value_counts()
+        stratum_scores = {}
+        num_sampled = {}
+        for column_name_1, column_name_2, _, score, *_ in rows:
+            stratum = pair_strata[column_name_1, column_name_2]
+            num_sampled[stratum] = num_sampled.get(stratum, 0) + 1
+            if not pd.isna(score):
+                stratum_scores.setdefault(stratum, []).append(score)
+
+        total_size = sum(stratum_sizes[stratum] for stratum in stratum_scores)
+        score = np.nan
+        variance = np.nan
+        if total_size:
+            score = 0.0
+            variance = 0.0
+            for stratum, scores in stratum_scores.items():
+                weight = stratum_sizes[stratum] / total_size
+                sampling_fraction = num_sampled[stratum] / stratum_sizes[stratum]
+                score += weight * np.mean(scores)
+                if len(scores) > 1:
+                    variance += (
+                        weight**2 * (1 - sampling_fraction) * np.var(scores, ddof=1) / len(scores)
+                    )
+
+        return {
+            'score': float(score),
+            'standard_error': float(np.sqrt(variance)),
+            'num_column_pairs': len(pair_strata),
+            'num_computed_column_pairs': len(rows),
+        }
+
+    def _compute_sampled_rows(self, column_pairs, data, context, progress_bar=None):
+        """Compute the details rows of a stratified sample of the pairs within the budget.
+
+        At most ``max_column_pairs`` pairs are computed. The pairs that can be computed all
+        at once are computed first, restricted to the sampled pairs. With a ``time_budget``,
+        the rows are then computed in batches of ``BUDGET_BATCH_SIZE`` until the budget is
+        spent. If not all the pairs are computed, the estimate of the score is stored in
+        ``_estimate``.
+
+        Returns:
+            list[tuple]:
+                The rows of the computed pairs, in the order of ``column_pairs``.
+        """
+        sampled_pairs, pair_strata = self._get_stratified_pairs(column_pairs, data[-1])
+        if self.max_column_pairs is not None:
+            sampled_pairs = sampled_pairs[: self.max_column_pairs]
+
+        start_time = time.time()
+        precomputed = self._get_precomputed_scores(
+            sampled_pairs, data, context, restrict_to_pairs=True
+        )
+        if self.time_budget is None:
+            rows = self._compute_rows(sampled_pairs, data, context, progress_bar, precomputed)
+        else:
+            rows = []
+            for start in range(0, len(sampled_pairs), BUDGET_BATCH_SIZE):
+                if start and time.time() - start_time >= self.time_budget:
+                    break
+
+                batch = sampled_pairs[start : start + BUDGET_BATCH_SIZE]
+                rows.extend(self._compute_rows(batch, data, context, progress_bar, precomputed))
+
+        num_iterations = len(column_pairs)
+        if self.max_column_pairs is not None:
+            num_iterations = min(num_iterations, self.max_column_pairs)
+
+        if progress_bar and num_iterations > len(rows):
+            progress_bar.update(num_iterations - len(rows))
+
+        if len(rows) < len(pair_strata):
+            self._estimate = self._get_stratified_estimate(rows, pair_strata)
+
+        pair_positions = {pair: position for position, pair in enumerate(column_pairs)}
+        return sorted(rows, key=lambda row: pair_positions[row[0], row[1]])
+
+    def _generate_details(
+        self, real_data, synthetic_data, metadata, progress_bar=None, column_pairs=None
+    ):
+        """Generate the _details dataframe for the column pair trends property.
+
+        Args:
+            real_data (pandas.DataFrame):
+                The real data
+            synthetic_data (pandas.DataFrame):
+                The synthetic data
+            metadata (dict):
+                The metadata of the table
+            progress_bar:
+                The progress bar to use. Defaults to None.
+            column_pairs (list[tuple[str, str]]):
+                Pairs of columns to calculate results for. If None, uses every combination of
+                pairs of columns in the metadata. Defaults to None.
+        """
+        context = self._get_context(real_data, synthetic_data, metadata)
+        processed_real_data, discrete_real = self._get_processed_data(real_data, metadata, context)
+        processed_synthetic_data, discrete_synthetic = self._get_processed_data(
+            synthetic_data, metadata, context, synthetic=True
+        )
+        column_pairs = (
+            list(itertools.combinations(list(metadata['columns']), r=2))
+            if column_pairs is None
+            else list(column_pairs)
+        )
+        data = (
+            processed_real_data,
+            discrete_real,
+            processed_synthetic_data,
+            discrete_synthetic,
+            metadata,
+        )
+        self._estimate = None
+        if self.max_column_pairs is None and self.time_budget is None:
+            rows = self._compute_rows(column_pairs, data, context, progress_bar)
+        else:
+            rows = self._compute_sampled_rows(column_pairs, data, context, progress_bar)
+
+        detail_columns = [
+            'Column 1',
+            'Column 2',
+            'Metric',
+            'Score',
+            'Real Correlation',
+            'Synthetic Correlation',
+            'Error',
+        ]
+        values = list(zip(*rows)) if rows else [()] * len(detail_columns)
         result = pd.DataFrame({
-            'Column 1': column_names_1,
-            'Column 2': column_names_2,
-            'Metric': metric_names,
-            'Score': scores,
-            'Real Correlation': real_correlations,
-            'Synthetic Correlation': synthetic_correlations,
-            'Error': error_messages,
+            column: list(column_values) for column, column_values in zip(detail_columns, values)
         })
 
         if result['Error'].isna().all():
@@ -15,6 +15,15 @@ class ColumnShapes(BaseSingleTableProperty):
     The KSComplement metric is used for numerical and datetime columns while the TVComplement
     is used for categorical and boolean columns.
     The other column types are ignored by this property.
+
+    Args:
+        ks_row_threshold (int or None):
+            The number of rows above which the KSComplement of a column is estimated from
+            quantile sketches instead of being computed exactly. The bound of the error of
+            each estimated score is stored in ``ks_error_bounds``. Defaults to ``None``,
+            which computes every score exactly.
+        sketch_size (int):
+            The size of the levels of the quantile sketches. Defaults to 1024.
     """
 
     _num_iteration_case = 'column'
@@ -25,6 +34,29 @@ class ColumnShapes(BaseSingleTableProperty):
         'boolean': TVComplement,
     }
 
+    def __init__(self, ks_row_threshold=None, sketch_size=1024):
+        super().__init__()
+        if ks_row_threshold is not None and (
+            not isinstance(ks_row_threshold, int) or ks_row_threshold <= 0
+        ):
+            raise ValueError('`ks_row_threshold` must be None or an integer greater than zero.')
+
+        self.ks_row_threshold = ks_row_threshold
+        self.sketch_size = sketch_size
+        self.ks_error_bounds = {}
+
+    def _compute_approximate_ks(self, column_name, real_column, synthetic_column, context):
+        """Estimate the KSComplement of a column, reusing the sketch of the real column."""
+        real_sketch = context.get_real_statistic(
+            ('ks_sketch', column_name, self.sketch_size),
+            lambda: KSComplement.build_sketch(real_column, self.sketch_size),
+        )
+        breakdown = KSComplement.compute_breakdown(
+            real_sketch, synthetic_column, approximate=True, sketch_size=self.sketch_size
+        )
+        self.ks_error_bounds[column_name] = breakdown['error_bound']
+        return breakdown['score']
+
     def _generate_details(self, real_data, synthetic_data, metadata, progress_bar=None):
         """Generate the _details dataframe for the column shapes property.
 
@@ -38,6 +70,8 @@ class ColumnShapes(BaseSingleTableProperty):
             progress_bar (tqdm.tqdm or None):
                 The progress bar to use. Defaults to None.
         """
+        context = self._get_context(real_data, synthetic_data, metadata)
+        self.ks_error_bounds = {}
         column_names, metric_names, scores = [], [], []
         error_messages = []
         for column_name in metadata['columns']:
@@ -45,9 +79,28 @@ class ColumnShapes(BaseSingleTableProperty):
             try:
                 if sdtype in self._sdtype_to_metric:
                     metric = self._sdtype_to_metric[sdtype]
-                    column_score = metric.compute(
-                        real_data[column_name], synthetic_data[column_name]
-                    )
+                    real_column = context.get_non_null_column(column_name)
+                    synthetic_column = context.get_non_null_column(column_name, synthetic=True)
+                    num_rows = max(len(real_column), len(synthetic_column))
+                    if (
+                        metric is KSComplement
+                        and self.ks_row_threshold is not None
+                        and num_rows > self.ks_row_threshold
+                    ):
+                        column_score = self._compute_approximate_ks(
+                            column_name, real_column, synthetic_column, context
+                        )
+                    elif metric is KSComplement:
+                        real_sorted = context.get_real_statistic(
+                            ('ks_sorted_column', column_name),
+                            lambda: KSComplement.sort_column(real_column),
+                        )
+                        column_score = KSComplement.compute_sorted(
+                            real_sorted, KSComplement.sort_column(synthetic_column)
+                        )
+                    else:
+                        column_score = metric.compute(real_column, synthetic_column)
+
                     error_message = None
                 else:
                     continue
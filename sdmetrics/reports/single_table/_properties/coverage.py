@@ -40,6 +40,7 @@ class Coverage(BaseSingleTableProperty):
         Returns:
             pandas.DataFrame
         """
+        context = self._get_context(real_data, synthetic_data, metadata)
         column_names, metric_names, scores = [], [], []
         error_messages = []
         for column_name in metadata['columns']:
@@ -48,7 +49,8 @@ class Coverage(BaseSingleTableProperty):
                 if sdtype in self._sdtype_to_metric:
                     metric = self._sdtype_to_metric[sdtype]
                     column_score = metric.compute(
-                        real_data[column_name], synthetic_data[column_name]
+                        context.get_column_profile(column_name),
+                        context.get_column_profile(column_name, synthetic=True),
                     )
                     error_message = None
                 else:
@@ -15,6 +15,12 @@ class DataValidity(BaseSingleTableProperty):
     The BoundaryAdherence metric is used for numerical and datetime columns, the CategoryAdherence
     is used for categorical and boolean columns and the KeyUniqueness for primary
     and alternate keys. The other column types are ignored by this property.
+
+    Args:
+        key_row_threshold (int or None):
+            The number of rows above which the duplicates of the primary and alternate keys
+            are counted from 64-bit fingerprints of their values, which needs much less memory
+            than a hash table of the values. Defaults to ``None``, which never uses them.
     """
 
     _num_iteration_case = 'column'
@@ -25,6 +31,15 @@ class DataValidity(BaseSingleTableProperty):
         'boolean': CategoryAdherence,
     }
 
+    def __init__(self, key_row_threshold=None):
+        super().__init__()
+        if key_row_threshold is not None and (
+            not isinstance(key_row_threshold, int) or key_row_threshold <= 0
+        ):
+            raise ValueError('`key_row_threshold` must be None or an integer greater than zero.')
+
+        self.key_row_threshold = key_row_threshold
+
     def _generate_details(self, real_data, synthetic_data, metadata, progress_bar=None):
         """Generate the _details dataframe for the data validity property.
 
@@ -38,6 +53,10 @@ class DataValidity(BaseSingleTableProperty):
             progress_bar (tqdm.tqdm or None):
                 The progress bar to use. Defaults to None.
         """
+        context = self._get_context(real_data, synthetic_data, metadata)
+        use_low_memory_keys = self.key_row_threshold is not None and (
+            max(len(real_data), len(synthetic_data)) > self.key_row_threshold
+        )
         column_names, metric_names, scores = [], [], []
         error_messages = []
         primary_key = metadata.get('primary_key')
@@ -53,7 +72,16 @@ class DataValidity(BaseSingleTableProperty):
                     continue
 
                 metric = self._sdtype_to_metric.get(sdtype, KeyUniqueness)
-                column_score = metric.compute(real_data[column_name], synthetic_data[column_name])
+                if metric is KeyUniqueness and use_low_memory_keys:
+                    column_score = metric.compute(
+                        real_data[column_name], synthetic_data[column_name], low_memory=True
+                    )
+                else:
+                    column_score = metric.compute(
+                        context.get_column_profile(column_name),
+                        context.get_column_profile(column_name, synthetic=True),
+                    )
+
                 error_message = None
 
             except Exception as e:
@@ -12,11 +12,28 @@ class Synthesis(BaseSingleTableProperty):
     This property assesses the novelty of the synthetic data over the real data.
     The ``NewRowSynthesis`` metric is computed over the real and synthetic table to
     score the proportion of new rows in the synthetic data.
+
+    Args:
+        synthetic_sample_size (int or None):
+            The maximum number of synthetic rows to match against the real data. If ``None``,
+            all the synthetic rows are used. Defaults to 10000.
+        chunk_size (int or None):
+            The number of synthetic rows to match at a time. Defaults to ``None``, which
+            matches all the rows at once.
+        n_jobs (int or None):
+            The number of processes used to match the chunks of synthetic rows.
+            Defaults to ``None``, which matches them sequentially.
     """
 
     _num_iteration_case = 'table'
     metric = NewRowSynthesis
 
+    def __init__(self, synthetic_sample_size=10000, chunk_size=None, n_jobs=None):
+        super().__init__()
+        self.synthetic_sample_size = synthetic_sample_size
+        self.chunk_size = chunk_size
+        self.n_jobs = n_jobs
+
     def _generate_details(self, real_data, synthetic_data, metadata, progress_bar=None):
         """Generate the _details dataframe for the synthesis property.
 
@@ -36,13 +53,18 @@ class Synthesis(BaseSingleTableProperty):
         name = self.metric.__name__
         error_message = None
 
-        sample_size = len(synthetic_data) if len(synthetic_data) < 10000 else 10000
+        sample_size = len(synthetic_data)
+        if self.synthetic_sample_size is not None:
+            sample_size = min(sample_size, self.synthetic_sample_size)
+
         try:
             score_breakdown = self.metric.compute_breakdown(
                 real_data=real_data,
                 synthetic_data=synthetic_data,
                 metadata=metadata,
                 synthetic_sample_size=sample_size,
+                chunk_size=self.chunk_size,
+                n_jobs=self.n_jobs,
             )
             score = score_breakdown['score']
             num_matched_rows = score_breakdown['num_matched_rows']
@@ -18,5 +18,39 @@ class DiagnosticReport(BaseReport):
             'Data Structure': Structure(),
         }
 
+    def generate(
+        self,
+        real_data,
+        synthetic_data,
+        metadata,
+        verbose=True,
+        concurrency=None,
+        key_row_threshold=None,
+    ):
+        """Generate report.
+
+        This method generates the report by iterating through each property and calculating
+        the score for each property.
+
+        Args:
+            real_data (pandas.DataFrame or sdmetrics.reports.RealDataProfile):
+                The real data, or a profile of it to reuse its real statistics.
+            synthetic_data (pandas.DataFrame):
+                The synthetic data.
+            metadata (dict):
+                The metadata, which contains each column's data type as well as relationships.
+            verbose (bool):
+                Whether or not to print report summary and progress.
+            concurrency (str or None):
+                Whether to compute the properties at the same time on a ``'thread'`` or
+                ``'process'`` pool. Defaults to ``None``, which computes them one at a time.
+            key_row_threshold (int or None):
+                The number of rows above which the uniqueness of the primary and alternate
+                keys is checked from 64-bit fingerprints of their values, to use less memory.
+                Defaults to ``None``, which checks it with a hash table of the values.
+        """
+        self._properties['Data Validity'] = DataValidity(key_row_threshold=key_row_threshold)
+        super().generate(real_data, synthetic_data, metadata, verbose, concurrency)
+
     def _validate_metadata_matches_data(self, real_data, synthetic_data, metadata):
         return
@@ -1,7 +1,21 @@
 """Single table quality report."""
 
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
 from sdmetrics.reports.base_report import BaseReport
 from sdmetrics.reports.single_table._properties import ColumnPairTrends, ColumnShapes
+from sdmetrics.reports.streaming import (
+    DEFAULT_CHUNK_SIZE,
+    TableStatistics,
+    compute_table_statistics,
+    get_column_pair_trends_details,
+    get_column_shapes_details,
+    is_reiterable,
+)
 
 
 class QualityReport(BaseReport):
@@ -17,3 +31,171 @@ class QualityReport(BaseReport):
             'Column Shapes': ColumnShapes(),
             'Column Pair Trends': ColumnPairTrends(),
         }
+
+    def generate(
+        self,
+        real_data,
+        synthetic_data,
+        metadata,
+        verbose=True,
+        n_jobs=None,
+        executor=None,
+        concurrency=None,
+        max_column_pairs=None,
+        time_budget=None,
+        random_state=None,
+        ks_row_threshold=None,
+    ):
+        """Generate report.
+
+        This method generates the report by iterating through each property and calculating
+        the score for each property.
+
+        Args:
+            real_data (pandas.DataFrame or sdmetrics.reports.RealDataProfile):
+                The real data, or a profile of it to reuse its real statistics.
+            synthetic_data (pandas.DataFrame):
+                The synthetic data.
+            metadata (dict):
+                The metadata, which contains each column's data type as well as relationships.
+            verbose (bool):
+                Whether or not to print report summary and progress.
+            n_jobs (int or None):
+                The number of processes used to compute the column pairs. ``-1`` uses all
+                the CPUs. Defaults to ``None``, which computes them sequentially.
+            executor (concurrent.futures.Executor or None):
+                An executor to compute the column pairs on instead of a new process pool.
+                If given, ``n_jobs`` is ignored. Defaults to ``None``.
+            concurrency (str or None):
+                Whether to compute the properties at the same time on a ``'thread'`` or
+                ``'process'`` pool. Defaults to ``None``, which computes them one at a time.
+            max_column_pairs (int or None):
+                The maximum number of column pairs to compute. If there are more, the
+                score is estimated from a sample of them stratified by their sdtypes and the
+                estimate is stored in the ``property_estimates`` of the report info.
+                Defaults to ``None``, which computes all the column pairs.
+            time_budget (float or None):
+                The number of seconds after which no more column pairs are computed.
+                Defaults to ``None``, which has no time limit.
+            random_state (int or None):
+                The seed used to sample the column pairs, so that the estimated score can be
+                reproduced. Defaults to ``None``.
+            ks_row_threshold (int or None):
+                The number of rows above which the KSComplement of a column is estimated
+                from quantile sketches. The bound of the error of each estimated score is
+                stored in the ``ks_error_bounds`` of the report info. Defaults to ``None``,
+                which computes every score exactly.
+        """
+        pair_kwargs = {
+            'n_jobs': n_jobs,
+            'executor': executor,
+            'max_column_pairs': max_column_pairs,
+            'random_state': random_state,
+            'time_budget': time_budget,
+        }
+        self._properties['Column Shapes'] = ColumnShapes(ks_row_threshold=ks_row_threshold)
+        self._properties['Column Pair Trends'] = ColumnPairTrends(**pair_kwargs)
+        super().generate(real_data, synthetic_data, metadata, verbose, concurrency)
+        ks_error_bounds = self._properties['Column Shapes'].ks_error_bounds
+        if ks_error_bounds:
+            self.report_info['ks_error_bounds'] = ks_error_bounds
+        else:
+            self.report_info.pop('ks_error_bounds', None)
+
+    def generate_streaming(
+        self,
+        real_data,
+        synthetic_data,
+        metadata,
+        verbose=True,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        sketch_size=1024,
+    ):
+        """Generate the report from data that is read one chunk at a time.
+
+        The statistics of each table are computed chunk by chunk and merged, so the tables
+        never have to fit in memory. The pairs of a continuous and a discrete column need a
+        second pass over the chunks, so in that case the data must be readable twice. The
+        ``KSComplement`` scores are estimated from quantile sketches, and the bound of their
+        error is stored in the ``ks_error_bounds`` of the report info.
+
+        Args:
+            real_data (pandas.DataFrame, str, pathlib.Path, callable or iterable):
+                The real data, the path to a CSV or Parquet file, a function that returns an
+                iterable of chunks or an iterable of ``pandas.DataFrame`` chunks.
+            synthetic_data (pandas.DataFrame, str, pathlib.Path, callable or iterable):
+                The synthetic data, in any of the forms accepted for the real data.
+            metadata (dict):
+                The metadata, which contains each column's data type.
+            verbose (bool):
+                Whether or not to print report summary and progress.
+            chunk_size (int):
+                The number of rows of each chunk read from a table or a file.
+                Defaults to ``DEFAULT_CHUNK_SIZE``.
+            sketch_size (int):
+                The size of the levels of the quantile sketches. Larger sketches use more
+                memory and give a smaller error. Defaults to 1024.
+        """
+        if not isinstance(metadata, dict):
+            raise TypeError(
+                f"Expected a dictionary but received a '{type(metadata).__name__}' instead."
+                " For SDV metadata objects, please use the 'to_dict' function to convert it"
+                ' to a dictionary.'
+            )
+
+        self._validate_metadata_format(metadata)
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            raise ValueError('`chunk_size` must be an integer greater than zero.')
+
+        if TableStatistics(metadata).get_mixed_pairs():
+            for name, data in (('real_data', real_data), ('synthetic_data', synthetic_data)):
+                if not is_reiterable(data):
+                    raise ValueError(
+                        f'`{name}` can only be read once, but the metadata has pairs of'
+                        ' continuous and discrete columns that need a second pass over the'
+                        ' data. Please pass a function that returns the chunks instead.'
+                    )
+
+        if verbose:
+            sys.stdout.write('Generating report ...\n\n')
+
+        start_time = time.time()
+        statistics = []
+        for name, data in (('real', real_data), ('synthetic', synthetic_data)):
+            if verbose:
+                sys.stdout.write(f'Computing the statistics of the {name} data ...\n')
+                sys.stdout.flush()
+
+            statistics.append(compute_table_statistics(data, metadata, chunk_size, sketch_size))
+
+        real_statistics, synthetic_statistics = statistics
+        column_shapes_details, ks_error_bounds = get_column_shapes_details(
+            real_statistics, synthetic_statistics
+        )
+        self._properties = {
+            'Column Shapes': ColumnShapes(),
+            'Column Pair Trends': ColumnPairTrends(),
+        }
+        self._properties['Column Shapes'].details = column_shapes_details
+        self._properties['Column Pair Trends'].details = get_column_pair_trends_details(
+            real_statistics, synthetic_statistics
+        )
+        scores = []
+        for property_name, property_instance in self._properties.items():
+            score = property_instance._compute_average()
+            scores.append(score)
+            if verbose:
+                sys.stdout.write(f'{property_name} Score: {round(score * 100, 2)}%\n')
+
+        self._overall_score = np.nanmean(scores)
+        self._record_property_estimates()
+        self.report_info['generated_date'] = datetime.today().strftime('%Y-%m-%d')
+        self.report_info['num_rows_real_data'] = real_statistics.num_rows
+        self.report_info['num_rows_synthetic_data'] = synthetic_statistics.num_rows
+        self.report_info['ks_error_bounds'] = ks_error_bounds
+        self.is_generated = True
+        self.report_info['generation_time'] = time.time() - start_time
+        if verbose:
+            sys.stdout.write('\n')
+
+        self._print_results(verbose)
@@ -0,0 +1,525 @@
+"""Mergeable statistics to generate reports on tables that are read in chunks."""
+
+import itertools
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from sdmetrics.column_pairs import ContingencySimilarity, CorrelationSimilarity
+from sdmetrics.errors import IncomputableMetricError
+from sdmetrics.reports.utils import CONTINUOUS_SDTYPES, DISCRETE_SDTYPES, convert_to_datetime
+from sdmetrics.single_column import KSComplement, TVComplement
+from sdmetrics.single_column.statistical.kscomplement import MAX_DECIMALS
+from sdmetrics.utils import QuantileSketch
+
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+def iterate_chunks(data, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Iterate over the chunks of a table.
+
+    Args:
+        data (pandas.DataFrame, str, pathlib.Path, callable or iterable):
+            The table, the path to a CSV or Parquet file, a function that returns an iterable
+            of chunks or an iterable of chunks.
+        chunk_size (int):
+            The number of rows of each chunk read from a table or a file.
+            Defaults to ``DEFAULT_CHUNK_SIZE``.
+
+    Yields:
+        pandas.DataFrame:
+            The chunks of the table.
+    """
+    if isinstance(data, pd.DataFrame):
+        for start in range(0, len(data), chunk_size):
+            yield data.iloc[start : start + chunk_size]
+
+    elif isinstance(data, (str, Path)):
+        if Path(data).suffix == '.parquet':
+            try:
+                import pyarrow.parquet as pq
+            except ImportError:
+                raise ImportError('Please install pyarrow with `pip install pyarrow`.')
+
+            for batch in pq.ParquetFile(data).iter_batches(batch_size=chunk_size):
+                yield batch.to_pandas()
+        else:
+            yield from pd.read_csv(data, chunksize=chunk_size)
+
+    elif callable(data):
+        yield from data()
+
+    else:
+        yield from data
+
+
+def is_reiterable(data):
+    """Return whether the chunks of the data can be read more than once."""
+    if isinstance(data, (pd.DataFrame, str, Path)) or callable(data):
+        return True
+
+    return iter(data) is not data
+
+
+def _add_counts(counts, new_counts):
+    if counts is None:
+        return new_counts
+
+    levels = list(range(counts.index.nlevels))
+    combined = pd.concat([counts, new_counts])
+    return combined.groupby(level=levels, dropna=False, sort=False).sum()
+
+
+def _merge_comoments(comoments, new_comoments):
+    """Merge the count, means and co-moments of two sets of rows of a pair of columns."""
+    if comoments is None:
+        return new_comoments
+
+    count_1, mean_x_1, mean_y_1, m2_x_1, m2_y_1, c_xy_1 = comoments
+    count_2, mean_x_2, mean_y_2, m2_x_2, m2_y_2, c_xy_2 = new_comoments
+    count = count_1 + count_2
+    if count == 0:
+        return comoments
+
+    delta_x = mean_x_2 - mean_x_1
+    delta_y = mean_y_2 - mean_y_1
+    weight = count_1 * count_2 / count
+    return np.array([
+        count,
+        mean_x_1 + delta_x * count_2 / count,
+        mean_y_1 + delta_y * count_2 / count,
+        m2_x_1 + m2_x_2 + delta_x**2 * weight,
+        m2_y_1 + m2_y_2 + delta_y**2 * weight,
+        c_xy_1 + c_xy_2 + delta_x * delta_y * weight,
+    ])
+
+
+class TableStatistics:
+    """Mergeable statistics of a table for the quality report, computed one chunk at a time.
+
+    The first pass over the chunks, with ``update``, counts the rows, the missing values
+    and the categories, keeps the minimum and maximum of the continuous columns, summarizes
+    them in quantile sketches and accumulates the co-moments of every pair of continuous
+    columns and the contingency table of every pair of discrete columns. The pairs of a
+    continuous and a discrete column need the bins of the continuous column, so their
+    contingency tables are counted by a second pass, with ``update_discretized``.
+
+    Args:
+        metadata (dict):
+            The metadata of the table.
+        sketch_size (int):
+            The size of the levels of the quantile sketches. Defaults to 1024.
+    """
+
+    def __init__(self, metadata, sketch_size=1024):
+        self.metadata = metadata
+        self.sketch_size = sketch_size
+        self.num_rows = 0
+        self.null_counts = {}
+        self.minimums = {}
+        self.maximums = {}
+        self.category_counts = {}
+        self.sketches = {}
+        self.comoments = {}
+        self.pair_counts = {}
+        self.errors = {}
+
+    def _get_columns(self, sdtypes):
+        return [
+            column_name
+            for column_name, column_meta in self.metadata['columns'].items()
+            if column_meta['sdtype'] in sdtypes
+        ]
+
+    def _get_numeric_values(self, column, column_name):
+        column_meta = self.metadata['columns'][column_name]
+        if column_meta['sdtype'] == 'datetime':
+            datetime_format = column_meta.get('format') or column_meta.get('datetime_format')
+            column = convert_to_datetime(column, datetime_format)
+            null_mask = pd.isna(column).to_numpy()
+            values = pd.to_numeric(column).to_numpy().astype(np.float64)
+            values[null_mask] = np.nan
+            return values
+
+        return pd.to_numeric(column).to_numpy().astype(np.float64)
+
+    def _update_continuous_columns(self, chunk):
+        columns = {}
+        for column_name in self._get_columns(CONTINUOUS_SDTYPES):
+            if column_name in self.errors:
+                continue
+
+            try:
+                values = self._get_numeric_values(chunk[column_name], column_name)
+            except Exception as error:
+                self.errors[column_name] = f'{type(error).__name__}: {error}'
+                continue
+
+            columns[column_name] = values
+            non_null_values = values[~np.isnan(values)]
+            num_nulls = len(values) - len(non_null_values)
+            self.null_counts[column_name] = self.null_counts.get(column_name, 0) + num_nulls
+            if len(non_null_values):
+                minimum, maximum = non_null_values.min(), non_null_values.max()
+                self.minimums[column_name] = min(self.minimums.get(column_name, minimum), minimum)
+                self.maximums[column_name] = max(self.maximums.get(column_name, maximum), maximum)
+
+            if column_name not in self.sketches:
+                self.sketches[column_name] = QuantileSketch(self.sketch_size)
+
+            self.sketches[column_name].update(np.round(non_null_values, MAX_DECIMALS))
+
+        return columns
+
+    def _validate_columns(self, chunk):
+        missing_columns = set(chunk.columns).symmetric_difference(self.metadata['columns'])
+        if missing_columns:
+            raise ValueError(
+                'The metadata does not match the data. The following columns are missing'
+                ' in the real/synthetic data or in the metadata: '
+                f'{", ".join(sorted(missing_columns))}'
+            )
+
+    def update(self, chunk):
+        """Add the statistics of a chunk of the table.
+
+        Args:
+            chunk (pandas.DataFrame):
+                The chunk of the table.
+        """
+        self._validate_columns(chunk)
+        self.num_rows += len(chunk)
+        continuous_columns = self._update_continuous_columns(chunk)
+        for column_name_1, column_name_2 in itertools.combinations(continuous_columns, 2):
+            values_1 = continuous_columns[column_name_1]
+            values_2 = continuous_columns[column_name_2]
+            is_valid = ~(np.isnan(values_1) | np.isnan(values_2))
+            values_1, values_2 = values_1[is_valid], values_2[is_valid]
+            if not len(values_1):
+                continue
+
+            deviations_1 = values_1 - values_1.mean()
+            deviations_2 = values_2 - values_2.mean()
+            pair = (column_name_1, column_name_2)
+            self.comoments[pair] = _merge_comoments(
+                self.comoments.get(pair),
+                np.array([
+                    len(values_1),
+                    values_1.mean(),
+                    values_2.mean(),
+                    deviations_1 @ deviations_1,
+                    deviations_2 @ deviations_2,
+                    deviations_1 @ deviations_2,
+                ]),
+            )
+
+        discrete_columns = self._get_columns(DISCRETE_SDTYPES)
+        for column_name in discrete_columns:
+            self.null_counts[column_name] = (
+                self.null_counts.get(column_name, 0) + chunk[column_name].isna().sum()
+            )
+            self.category_counts[column_name] = _add_counts(
+                self.category_counts.get(column_name), chunk[column_name].value_counts()
+            )
+
+        for pair in itertools.combinations(discrete_columns, 2):
+            self.pair_counts[pair] = _add_counts(
+                self.pair_counts.get(pair), chunk[list(pair)].value_counts(dropna=False)
+            )
+
+    def get_mixed_pairs(self):
+        """Get the pairs of a continuous and a discrete column, in the order of the metadata."""
+        continuous_columns = set(self._get_columns(CONTINUOUS_SDTYPES))
+        discrete_columns = set(self._get_columns(DISCRETE_SDTYPES))
+        return [
+            (column_name_1, column_name_2)
+            for column_name_1, column_name_2 in itertools.combinations(self.metadata['columns'], 2)
+            if (column_name_1 in continuous_columns and column_name_2 in discrete_columns)
+            or (column_name_1 in discrete_columns and column_name_2 in continuous_columns)
+        ]
+
+    def get_bin_edges(self, column_name):
+        """Get the bin edges of a continuous column, as ``numpy.histogram_bin_edges`` would.
+
+        Args:
+            column_name (str):
+                The name of the column.
+
+        Returns:
+            numpy.ndarray:
+                The bin edges.
+        """
+        if column_name not in self.minimums:
+            return np.histogram_bin_edges(np.empty(0))
+
+        return np.histogram_bin_edges(
+            np.array([self.minimums[column_name], self.maximums[column_name]])
+        )
+
+    def update_discretized(self, chunk):
+        """Add the contingency tables of the pairs of a continuous and a discrete column.
+
+        This must be called on every chunk after all of them have been given to ``update``.
+
+        Args:
+            chunk (pandas.DataFrame):
+                The chunk of the table.
+        """
+        discretized_columns = {}
+        for pair in self.get_mixed_pairs():
+            if any(column_name in self.errors for column_name in pair):
+                continue
+
+            columns = {}
+            for column_name in pair:
+                if self.metadata['columns'][column_name]['sdtype'] in DISCRETE_SDTYPES:
+                    columns[column_name] = chunk[column_name].to_numpy()
+                    continue
+
+                if column_name not in discretized_columns:
+                    values = self._get_numeric_values(chunk[column_name], column_name)
+                    discretized_columns[column_name] = np.digitize(
+                        values, bins=self.get_bin_edges(column_name)
+                    )
+
+                columns[column_name] = discretized_columns[column_name]
+
+            self.pair_counts[pair] = _add_counts(
+                self.pair_counts.get(pair), pd.DataFrame(columns).value_counts(dropna=False)
+            )
+
+
+def compute_table_statistics(data, metadata, chunk_size=DEFAULT_CHUNK_SIZE, sketch_size=1024):
+    """Compute the statistics of a table one chunk at a time.
+
+    Args:
+        data (pandas.DataFrame, str, pathlib.Path, callable or iterable):
+            The table or its chunks, as accepted by ``iterate_chunks``.
+        metadata (dict):
+            The metadata of the table.
+        chunk_size (int):
+            The number of rows of each chunk read from a table or a file.
+            Defaults to ``DEFAULT_CHUNK_SIZE``.
+        sketch_size (int):
+            The size of the levels of the quantile sketches. Defaults to 1024.
+
+    Returns:
+        TableStatistics:
+            The statistics of the table.
+    """
+    statistics = TableStatistics(metadata, sketch_size)
+    for chunk in iterate_chunks(data, chunk_size):
+        statistics.update(chunk)
+
+    if statistics.get_mixed_pairs():
+        for chunk in iterate_chunks(data, chunk_size):
+            statistics.update_discretized(chunk)
+
+    return statistics
+
+
+def _compute_tv_complement(real_counts, synthetic_counts):
+    """Compute the ``TVComplement`` of a column from the counts of its non-null values."""
+    if real_counts is None or synthetic_counts is None:
+        raise IncomputableMetricError(
+            'The TVComplement metric must have 1 or more non-null values.'
+        )
+
+    real_counts = real_counts[real_counts > 0]
+    synthetic_counts = synthetic_counts[synthetic_counts > 0]
+    if not len(real_counts) or not len(synthetic_counts):
+        raise IncomputableMetricError(
+            'The TVComplement metric must have 1 or more non-null values.'
+        )
+
+    synthetic_only = synthetic_counts.index.difference(real_counts.index)
+    real_counts = pd.concat([
+        real_counts.astype(float),
+        pd.Series(1e-6, index=synthetic_only),
+    ])
+    synthetic_counts = synthetic_counts.reindex(real_counts.index, fill_value=0)
+    real_frequencies = real_counts / real_counts.sum()
+    synthetic_frequencies = synthetic_counts / synthetic_counts.sum()
+    total_variation = np.abs(synthetic_frequencies - real_frequencies).sum()
+    return 1 - 0.5 * total_variation
+
+
+def get_column_shapes_details(real_statistics, synthetic_statistics):
+    """Get the details of the Column Shapes property from the statistics of the tables.
+
+    The ``KSComplement`` of the continuous columns is computed from their quantile sketches,
+    so it is approximate. Its error bound is returned along with the details.
+
+    Args:
+        real_statistics (TableStatistics):
+            The statistics of the real table.
+        synthetic_statistics (TableStatistics):
+            The statistics of the synthetic table.
+
+    Returns:
+        tuple[pandas.DataFrame, dict]:
+            The details of the property, and the bound of the error of the ``KSComplement``
+            score of each continuous column.
+    """
+    metadata = real_statistics.metadata
+    rows = []
+    error_bounds = {}
+    for column_name, column_meta in metadata['columns'].items():
+        sdtype = column_meta['sdtype']
+        if sdtype not in CONTINUOUS_SDTYPES and sdtype not in DISCRETE_SDTYPES:
+            continue
+
+        metric = KSComplement if sdtype in CONTINUOUS_SDTYPES else TVComplement
+        score = np.nan
+        error = real_statistics.errors.get(column_name) or synthetic_statistics.errors.get(
+            column_name
+        )
+        if error is None and metric is KSComplement:
+            statistic, error_bound = real_statistics.sketches[column_name].ks_statistic(
+                synthetic_statistics.sketches[column_name]
+            )
+            score = 1 - statistic
+            error_bounds[column_name] = error_bound
+
+        elif error is None:
+            try:
+                score = _compute_tv_complement(
+                    real_statistics.category_counts.get(column_name),
+                    synthetic_statistics.category_counts.get(column_name),
+                )
+            except Exception as exception:
+                error = f'{type(exception).__name__}: {exception}'
+
+        rows.append((column_name, metric.__name__, score, error))
+
+    details = pd.DataFrame(rows, columns=['Column', 'Metric', 'Score', 'Error'])
+    if details['Error'].isna().all():
+        details = details.drop('Error', axis=1)
+
+    return details, error_bounds
+
+
+def _compute_contingency_similarity(real_counts, synthetic_counts, num_real_rows, num_rows):
+    """Compute the ``ContingencySimilarity`` of a pair from its contingency tables."""
+    real_frequencies = real_counts / num_real_rows
+    synthetic_frequencies = synthetic_counts / num_rows
+    difference = _add_counts(real_frequencies, -synthetic_frequencies)
+    return 1 - np.abs(difference).sum() / 2
+
+
+def _get_correlation(statistics, column_name_1, column_name_2, prefix):
+    """Get the Pearson correlation of a pair of continuous columns from their co-moments."""
+    constant_columns = [
+        column_name
+        for column_name in (column_name_1, column_name_2)
+        if column_name in statistics.minimums
+        and statistics.minimums[column_name] == statistics.maximums[column_name]
+    ]
+    CorrelationSimilarity._raise_constant_data_error(constant_columns, prefix)
+    comoments = statistics.comoments.get((column_name_1, column_name_2))
+    if comoments is None or comoments[0] < 2:
+        raise ValueError('x and y must have length at least 2.')
+
+    _, _, _, m2_x, m2_y, c_xy = comoments
+    if m2_x == 0 or m2_y == 0:
+        return np.nan
+
+    return float(np.clip(c_xy / np.sqrt(m2_x * m2_y), -1, 1))
+
+
+def _compute_correlation_similarity(
+    real_statistics, synthetic_statistics, column_name_1, column_name_2
+):
+    """Compute the ``CorrelationSimilarity`` breakdown of a pair from its co-moments."""
+    real_correlation = _get_correlation(real_statistics, column_name_1, column_name_2, 'real data')
+    synthetic_correlation = _get_correlation(
+        synthetic_statistics, column_name_1, column_name_2, 'synthetic data'
+    )
+    if np.isnan(real_correlation) or np.isnan(synthetic_correlation):
+        return {'score': np.nan}
+
+    return {
+        'score': 1 - abs(real_correlation - synthetic_correlation) / 2,
+        'real': real_correlation,
+        'synthetic': synthetic_correlation,
+    }
+
+
+def get_column_pair_trends_details(real_statistics, synthetic_statistics):
+    """Get the details of the Column Pair Trends property from the statistics of the tables.
+
+    Args:
+        real_statistics (TableStatistics):
+            The statistics of the real table.
+        synthetic_statistics (TableStatistics):
+            The statistics of the synthetic table.
+
+    Returns:
+        pandas.DataFrame:
+            The details of the property.
+    """
+    metadata = real_statistics.metadata
+    rows = []
+    for column_name_1, column_name_2 in itertools.combinations(metadata['columns'], 2):
+        sdtype_1 = metadata['columns'][column_name_1]['sdtype']
+        sdtype_2 = metadata['columns'][column_name_2]['sdtype']
+        valid_sdtypes = CONTINUOUS_SDTYPES + DISCRETE_SDTYPES
+        if sdtype_1 not in valid_sdtypes or sdtype_2 not in valid_sdtypes:
+            continue
+
+        both_continuous = sdtype_1 in CONTINUOUS_SDTYPES and sdtype_2 in CONTINUOUS_SDTYPES
+        metric = CorrelationSimilarity if both_continuous else ContingencySimilarity
+        score = real_correlation = synthetic_correlation = np.nan
+        error = None
+        for column_name in (column_name_1, column_name_2):
+            error = error or real_statistics.errors.get(column_name)
+            error = error or synthetic_statistics.errors.get(column_name)
+
+        try:
+            if error is None and both_continuous:
+                score_breakdown = _compute_correlation_similarity(
+                    real_statistics, synthetic_statistics, column_name_1, column_name_2
+                )
+                score = score_breakdown['score']
+                real_correlation = score_breakdown['real']
+                synthetic_correlation = score_breakdown['synthetic']
+            elif error is None:
+                pair = (column_name_1, column_name_2)
+                score = _compute_contingency_similarity(
+                    real_statistics.pair_counts[pair],
+                    synthetic_statistics.pair_counts[pair],
+                    real_statistics.num_rows,
+                    synthetic_statistics.num_rows,
+                )
+
+        except Exception as exception:
+            real_correlation = synthetic_correlation = np.nan
+            error = f'{type(exception).__name__}: {exception}'
+
+        rows.append((
+            column_name_1,
+            column_name_2,
+            metric.__name__,
+            score,
+            real_correlation,
+            synthetic_correlation,
+            error,
+        ))
+
+    details = pd.DataFrame(
+        rows,
+        columns=[
+            'Column 1',
+            'Column 2',
+            'Metric',
+            'Score',
+            'Real Correlation',
+            'Synthetic Correlation',
+            'Error',
+        ],
+    )
+    if details['Error'].isna().all():
+        details = details.drop('Error', axis=1)
+
+    return details
@@ -2,13 +2,16 @@
 
 import copy
 import itertools
+import threading
 import warnings
 
 import numpy as np
 import pandas as pd
 from pandas.core.tools.datetimes import _guess_datetime_format_for_array
 
+from sdmetrics.column_pairs.statistical.contingency_similarity import _factorize_column
 from sdmetrics.utils import (
+    ColumnProfile,
     discretize_column,
     get_alternate_keys,
     get_columns_from_metadata,
@@ -242,3 +245,326 @@ def _validate_categorical_values(real_data, synthetic_data, metadata, table=None
                     f'"{value_list}" + more' if len(extra_categories) > 5 else f'"{value_list}"'
                 )
                 warnings.warn(warning_format.format(values=values, column=column))
+
+
+class PreprocessingCache(dict):
+    """Cache of preprocessed values that can be filled from several threads.
+
+    Each value is computed by a single thread, while the other threads that need it wait
+    for it instead of computing it again. The locks are not pickled.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._key_locks = {}
+
+    def __reduce__(self):
+        """Pickle the cached values without the locks."""
+        return (PreprocessingCache, (), None, None, iter(self.items()))
+
+    def get_or_compute(self, key, compute):
+        """Get the cached ``(value, error)`` entry of a key, computing it if missing.
+
+        Args:
+            key (tuple):
+                The key of the value.
+            compute (callable):
+                Function that computes the value.
+
+        Returns:
+            tuple:
+                The computed value and None, or None and the error raised by ``compute``.
+        """
+        entry = self.get(key)
+        if entry is not None:
+            return entry
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.RLock())
+
+        with key_lock:
+            entry = self.get(key)
+            if entry is None:
+                try:
+                    entry = (compute(), None)
+                except Exception as error:
+                    entry = (None, error)
+
+                self[key] = entry
+
+        with self._lock:
+            self._key_locks.pop(key, None)
+
+        return entry
+
+
+class PreprocessingContext:
+    """Preprocessed columns of a real and synthetic table, shared by the properties of a report.
+
+    Every value is computed the first time a property asks for it and cached for the
+    other properties, so each column is only converted, masked or coded once per report.
+
+    Args:
+        real_data (pandas.DataFrame):
+            The real data.
+        synthetic_data (pandas.DataFrame):
+            The synthetic data.
+        metadata (dict):
+            The metadata of the table.
+        real_cache (PreprocessingCache or None):
+            The cache of the values that only depend on the real data, shared with other
+            contexts of the same real data. Defaults to None, which uses a new one.
+    """
+
+    def __init__(self, real_data, synthetic_data, metadata, real_cache=None):
+        self.real_data = real_data
+        self.synthetic_data = synthetic_data
+        self.metadata = metadata
+        self._cache = PreprocessingCache()
+        self._real_cache = PreprocessingCache() if real_cache is None else real_cache
+
+    def matches(self, real_data, synthetic_data):
+        """Return whether the context was built for the given real and synthetic data."""
+        return self.real_data is real_data and self.synthetic_data is synthetic_data
+
+    def _get_cached(self, key, compute, real=False):
+        cache = self._real_cache if real else self._cache
+        value, error = cache.get_or_compute(key, compute)
+        if error is not None:
+            raise error
+
+        return value
+
+    def _get_column(self, column_name, synthetic):
+        return self.synthetic_data[column_name] if synthetic else self.real_data[column_name]
+
+    def get_null_mask(self, column_name, synthetic=False):
+        """Get the mask of the missing values of a column.
+
+        Args:
+            column_name (str):
+                The name of the column.
+            synthetic (bool):
+                Whether to use the synthetic data instead of the real data. Defaults to False.
+
+        Returns:
+            numpy.ndarray:
+                A boolean array that is True for the missing values.
+        """
+        return self._get_cached(
+            ('null_mask', column_name, synthetic),
+            lambda: pd.isna(self._get_column(column_name, synthetic)).to_numpy(),
+            real=not synthetic,
+        )
+
+    def get_non_null_column(self, column_name, synthetic=False):
+        """Get a column without its missing values.
+
+        Args:
+            column_name (str):
+                The name of the column.
+            synthetic (bool):
+                Whether to use the synthetic data instead of the real data. Defaults to False.
+
+        Returns:
+            pandas.Series:
+                The values of the column that are not missing.
+        """
+        return self._get_cached(
+            ('non_null_column', column_name, synthetic),
+            lambda: self._get_column(column_name, synthetic)[
+                ~self.get_null_mask(column_name, synthetic)
+            ],
+            real=not synthetic,
+        )
+
+    def get_datetime_column(self, column_name, synthetic=False):
+        """Get a datetime column converted to pandas datetime.
+
+        The column is parsed with its ``datetime_format`` from the metadata if it is not
+        already a datetime column. Any error of the conversion is raised again every time.
+
+        Args:
+            column_name (str):
+                The name of the column.
+            synthetic (bool):
+                Whether to use the synthetic data instead of the real data. Defaults to False.
+
+        Returns:
+            pandas.Series:
+                The converted column.
+        """
+
+        def convert():
+            column = self._get_column(column_name, synthetic)
+            if is_datetime(column):
+                return column
+
+            column_meta = self.metadata['columns'][column_name]
+            datetime_format = column_meta.get('datetime_format', column_meta.get('format'))
+            return pd.to_datetime(column, format=datetime_format)
+
+        return self._get_cached(
+            ('datetime_column', column_name, synthetic), convert, real=not synthetic
+        )
+
+    def get_numeric_column(self, column_name, synthetic=False):
+        """Get a datetime column as nanoseconds since the epoch, with ``NaN`` for missing values.
+
+        Args:
+            column_name (str):
+                The name of the column.
+            synthetic (bool):
+                Whether to use the synthetic data instead of the real data. Defaults to False.
+
+        Returns:
+            pandas.Series:
+                The numeric column.
+        """
+
+        def convert():
+            datetime_column = self.get_datetime_column(column_name, synthetic)
+            null_mask = pd.isna(datetime_column)
+            column = pd.to_numeric(datetime_column)
+            if null_mask.any():
+                column = column.where(~null_mask, np.nan)
+
+            return column
+
+        return self._get_cached(
+            ('numeric_column', column_name, synthetic), convert, real=not synthetic
+        )
+
+    def get_codes(self, column_name):
+        """Integer-code the real and synthetic values of a column together.
+
+        Args:
+            column_name (str):
+                The name of the column.
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray, int]:
+                The real codes, the synthetic codes and the number of codes, with the
+                missing values as the last code.
+        """
+        return self._get_cached(
+            ('codes', column_name),
+            lambda: _factorize_column(
+                self.real_data[column_name], self.synthetic_data[column_name]
+            ),
+        )
+
+    def get_column_profile(self, column_name, synthetic=False):
+        """Get the profile of a column, with its number of missing values and its bounds.
+
+        Args:
+            column_name (str):
+                The name of the column.
+            synthetic (bool):
+                Whether to use the synthetic data instead of the real data. Defaults to False.
+
+        Returns:
+            sdmetrics.utils.ColumnProfile:
+                The profile of the column.
+        """
+        return self._get_cached(
+            ('column_profile', column_name, synthetic),
+            lambda: ColumnProfile.from_column(self._get_column(column_name, synthetic)),
+            real=not synthetic,
+        )
+
+    def get_real_statistic(self, key, compute):
+        """Get a statistic that only depends on the real data.
+
+        The statistic is cached with the real-side values, so it is only computed once for
+        all the contexts that share them.
+
+        Args:
+            key (tuple):
+                The key that identifies the statistic.
+            compute (callable):
+                A function that computes the statistic.
+
+        Returns:
+            object:
+                The statistic.
+        """
+        return self._get_cached(('statistic', *key), compute, real=True)
+
+
+class RealDataProfile:
+    """Statistics of the real data that are reused by every report generated against it.
+
+    A report that is given the profile in place of the real data only computes the
+    statistics of the synthetic data once the real ones are cached, which is useful when
+    scoring many synthetic datasets against the same real data. The real statistics are
+    computed by the first report that needs them and kept in the profile.
+
+    The datetime columns are converted when the profile is created. The other columns of
+    the real data are not copied.
+
+    Args:
+        real_data (pandas.DataFrame or dict[str, pandas.DataFrame]):
+            The real data, or a mapping of each table name to its real data.
+        metadata (dict):
+            The metadata of the real data.
+    """
+
+    def __init__(self, real_data, metadata):
+        self.metadata = metadata
+        if 'tables' in metadata:
+            self.real_data = {
+                table_name: self._convert_datetimes(table, metadata['tables'].get(table_name))
+                for table_name, table in real_data.items()
+            }
+        else:
+            self.real_data = self._convert_datetimes(real_data, metadata)
+
+        self._real_caches = {}
+
+    @staticmethod
+    def _convert_datetimes(data, metadata):
+        if not isinstance(data, pd.DataFrame) or not isinstance(metadata, dict):
+            return data
+
+        columns = {column_name: data[column_name] for column_name in data.columns}
+        for column_name, column_meta in metadata.get('columns', {}).items():
+            if column_meta.get('sdtype') == 'datetime' and column_name in columns:
+                datetime_format = column_meta.get('format') or column_meta.get('datetime_format')
+                try:
+                    columns[column_name] = convert_to_datetime(
+                        columns[column_name], datetime_format
+                    )
+                except Exception:
+                    continue
+
+        return pd.DataFrame(columns, index=data.index, copy=False)
+
+    def validate_metadata(self, metadata):
+        """Validate that the profile was created with the given metadata.
+
+        Args:
+            metadata (dict):
+                The metadata given to the report.
+        """
+        if metadata != self.metadata:
+            raise ValueError(
+                'The metadata does not match the metadata used to create the `RealDataProfile`.'
+            )
+
+    def get_real_cache(self, table_name=None):
+        """Get the cache of the statistics of a real table.
+
+        Args:
+            table_name (str or None):
+                The name of the table. Defaults to None, for single table data.
+
+        Returns:
+            PreprocessingCache:
+                The cache of the real statistics of the table.
+        """
+        if table_name not in self._real_caches:
+            self._real_caches.setdefault(table_name, PreprocessingCache())
+
+        return self._real_caches[table_name]
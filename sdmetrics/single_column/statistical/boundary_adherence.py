@@ -1,10 +1,8 @@
 """Boundary Adherence Metric."""
 
-import pandas as pd
-
 from sdmetrics.goal import Goal
 from sdmetrics.single_column.base import SingleColumnMetric
-from sdmetrics.utils import is_datetime
+from sdmetrics.utils import ColumnProfile
 
 
 class BoundaryAdherence(SingleColumnMetric):
@@ -34,28 +32,25 @@ class BoundaryAdherence(SingleColumnMetric):
         """Compute the boundary adherence of two continuous columns.
 
         Args:
-            real_data (Union[numpy.ndarray, pandas.Series]):
-                The values from the real dataset.
-            synthetic_data (Union[numpy.ndarray, pandas.Series]):
-                The values from the synthetic dataset.
+            real_data (Union[numpy.ndarray, pandas.Series, ColumnProfile]):
+                The values from the real dataset, or their profile.
+            synthetic_data (Union[numpy.ndarray, pandas.Series, ColumnProfile]):
+                The values from the synthetic dataset, or their profile.
 
         Returns:
             float:
                 The boundary adherence of the two columns.
         """
-        real_data = pd.Series(real_data)
-        synthetic_data = pd.Series(synthetic_data)
-        if any(pd.isna(real_data)):
-            real_data = real_data.dropna()
-            synthetic_data = synthetic_data.dropna()
-
-        if is_datetime(real_data):
-            real_data = pd.to_numeric(real_data)
-            synthetic_data = pd.to_numeric(synthetic_data)
+        real_profile = ColumnProfile.from_column(real_data)
+        synthetic_profile = ColumnProfile.from_column(synthetic_data)
+        num_rows = synthetic_profile.num_rows
+        if real_profile.num_nulls:
+            num_rows -= synthetic_profile.num_nulls
 
-        valid = synthetic_data.between(real_data.min(), real_data.max())
+        # The missing synthetic values are never within the bounds.
+        num_valid = synthetic_profile.count_between(real_profile.minimum, real_profile.maximum)
 
-        return valid.sum() / len(synthetic_data)
+        return num_valid / num_rows
 
     @classmethod
     def normalize(cls, raw_score):
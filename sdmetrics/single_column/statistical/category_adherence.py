@@ -4,6 +4,7 @@ import numpy as np
 
 from sdmetrics.goal import Goal
 from sdmetrics.single_column.base import SingleColumnMetric
+from sdmetrics.utils import ColumnProfile
 
 
 class CategoryAdherence(SingleColumnMetric):
@@ -32,30 +33,37 @@ class CategoryAdherence(SingleColumnMetric):
         """Compute the score breakdown of the category adherence metric.
 
         Args:
-            real_data (pandas.Series):
-                The real data.
-            synthetic_data (pandas.Series):
-                The synthetic data.
+            real_data (pandas.Series or ColumnProfile):
+                The real data, or its profile.
+            synthetic_data (pandas.Series or ColumnProfile):
+                The synthetic data, or its profile.
 
         Returns:
             dict:
                 The score breakdown of the category adherence metric.
         """
-        real_data = real_data.fillna(np.nan)
-        synthetic_data = synthetic_data.fillna(np.nan)
-        score = synthetic_data.isin(real_data).mean()
+        real_profile = ColumnProfile.from_column(real_data)
+        synthetic_profile = ColumnProfile.from_column(synthetic_data)
+        if not synthetic_profile.num_rows:
+            return {'score': np.nan}
 
-        return {'score': score}
+        is_real_category = synthetic_profile.categories.isin(real_profile.categories)
+        num_valid = synthetic_profile.value_counts[is_real_category].sum()
+        if real_profile.num_nulls:
+            # The missing values are a valid category when the real data has them.
+            num_valid += synthetic_profile.num_nulls
+
+        return {'score': num_valid / synthetic_profile.num_rows}
 
     @classmethod
     def compute(cls, real_data, synthetic_data):
         """Compute the category adherence of two columns.
 
         Args:
-            real_data (pandas.Series):
-                The real data.
-            synthetic_data (pandas.Series):
-                The synthetic data.
+            real_data (pandas.Series or ColumnProfile):
+                The real data, or its profile.
+            synthetic_data (pandas.Series or ColumnProfile):
+                The synthetic data, or its profile.
 
         Returns:
             float:
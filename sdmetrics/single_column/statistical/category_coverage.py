@@ -1,9 +1,8 @@
 """Category Coverage Metric."""
 
-import pandas as pd
-
 from sdmetrics.goal import Goal
 from sdmetrics.single_column.base import SingleColumnMetric
+from sdmetrics.utils import ColumnProfile
 
 
 class CategoryCoverage(SingleColumnMetric):
@@ -32,10 +31,10 @@ class CategoryCoverage(SingleColumnMetric):
         """Compare the category coverage of two continuous columns.
 
         Args:
-            real_data (Union[numpy.ndarray, pandas.Series]):
-                The values from the real dataset.
-            synthetic_data (Union[numpy.ndarray, pandas.Series]):
-                The values from the synthetic dataset.
+            real_data (Union[numpy.ndarray, pandas.Series, ColumnProfile]):
+                The values from the real dataset, or their profile.
+            synthetic_data (Union[numpy.ndarray, pandas.Series, ColumnProfile]):
+                The values from the synthetic dataset, or their profile.
 
         Returns:
             float:
@@ -49,20 +48,17 @@ class CategoryCoverage(SingleColumnMetric):
         """Compare the category coverage of two continuous columns.
 
         Args:
-            real_data (Union[numpy.ndarray, pandas.Series]):
-                The values from the real dataset.
-            synthetic_data (Union[numpy.ndarray, pandas.Series]):
-                The values from the synthetic dataset.
+            real_data (Union[numpy.ndarray, pandas.Series, ColumnProfile]):
+                The values from the real dataset, or their profile.
+            synthetic_data (Union[numpy.ndarray, pandas.Series, ColumnProfile]):
+                The values from the synthetic dataset, or their profile.
 
         Returns:
             dict:
                 A mapping of the category coverage results.
         """
-        real_data = pd.Series(real_data).dropna()
-        synthetic_data = pd.Series(synthetic_data).dropna()
-
-        real_data_values = set(real_data.value_counts().index)
-        synthetic_data_values = set(synthetic_data.value_counts().index)
+        real_data_values = set(ColumnProfile.from_column(real_data).categories)
+        synthetic_data_values = set(ColumnProfile.from_column(synthetic_data).categories)
         synthetic_coverage = synthetic_data_values.intersection(real_data_values)
 
         return {
@@ -4,7 +4,7 @@ from scipy.stats import chisquare
 
 from sdmetrics.goal import Goal
 from sdmetrics.single_column.base import SingleColumnMetric
-from sdmetrics.utils import get_frequencies
+from sdmetrics.utils import get_frequency_arrays
 
 
 class CSTest(SingleColumnMetric):
@@ -45,7 +45,7 @@ class CSTest(SingleColumnMetric):
             float:
                 The Chi-Squared test p-value
         """
-        f_obs, f_exp = get_frequencies(real_data, synthetic_data)
+        f_obs, f_exp = get_frequency_arrays(real_data, synthetic_data)
         if len(f_obs) == len(f_exp) == 1:
             pvalue = 1.0
         else:
@@ -2,8 +2,11 @@
 
 import logging
 
+import numpy as np
+
 from sdmetrics.goal import Goal
 from sdmetrics.single_column.base import SingleColumnMetric
+from sdmetrics.utils import ColumnProfile, count_duplicate_keys
 
 LOGGER = logging.getLogger(__name__)
 
@@ -29,42 +32,68 @@ class KeyUniqueness(SingleColumnMetric):
     min_value = 0.0
     max_value = 1.0
 
+    @staticmethod
+    def _count_nans_and_duplicates(data, low_memory, verify):
+        if low_memory:
+            num_nans, num_duplicates = count_duplicate_keys(data, verify=verify)
+            return num_nans, num_duplicates, len(data)
+
+        profile = ColumnProfile.from_column(data)
+        return profile.num_nulls, profile.num_duplicates, profile.num_rows
+
     @classmethod
-    def compute_breakdown(cls, real_data, synthetic_data):
+    def compute_breakdown(cls, real_data, synthetic_data, low_memory=False, verify=True):
         """Compute the score breakdown of the key uniqueness metric.
 
+        In the low memory mode, the duplicates are counted from 64-bit fingerprints of the
+        values instead of a hash table of the values, to score very large key columns.
+
         Args:
-            real_data (pandas.Series):
-                The real data.
-            synthetic_data (pandas.Series):
-                The synthetic data.
+            real_data (pandas.Series or ColumnProfile):
+                The real data, or its profile if not in the low memory mode.
+            synthetic_data (pandas.Series or ColumnProfile):
+                The synthetic data, or its profile if not in the low memory mode.
+            low_memory (bool):
+                Whether to count the duplicates from fingerprints. Defaults to False.
+            verify (bool):
+                Whether to compare the values that share a fingerprint in the low memory
+                mode, so that a collision of two different values is not counted as a
+                duplicate. Defaults to True.
 
         Returns:
             dict:
                 The score breakdown of the key uniqueness metric.
         """
-        has_duplicates = real_data.duplicated().any()
-        has_nans = real_data.isna().any()
-        if has_duplicates or has_nans:
+        num_real_nans, num_real_duplicates, _ = cls._count_nans_and_duplicates(
+            real_data, low_memory, verify
+        )
+        if num_real_duplicates or num_real_nans:
             LOGGER.info('The real data contains NA or duplicate values.')
 
-        nans_or_duplicates_synthetic = synthetic_data.duplicated() | synthetic_data.isna()
-        score = 1 - nans_or_duplicates_synthetic.sum() / len(synthetic_data)
+        num_nans, num_duplicates, num_rows = cls._count_nans_and_duplicates(
+            synthetic_data, low_memory, verify
+        )
+        score = 1 - np.divide(num_nans + num_duplicates, num_rows)
 
         return {'score': score}
 
     @classmethod
-    def compute(cls, real_data, synthetic_data):
+    def compute(cls, real_data, synthetic_data, low_memory=False, verify=True):
         """Compute the key uniqueness metric.
 
         Args:
-            real_data (pandas.Series):
-                The real data.
-            synthetic_data (pandas.Series):
-                The synthetic data.
+            real_data (pandas.Series or ColumnProfile):
+                The real data, or its profile if not in the low memory mode.
+            synthetic_data (pandas.Series or ColumnProfile):
+                The synthetic data, or its profile if not in the low memory mode.
+            low_memory (bool):
+                Whether to count the duplicates from fingerprints. Defaults to False.
+            verify (bool):
+                Whether to compare the values that share a fingerprint in the low memory
+                mode. Defaults to True.
 
         Returns:
             float:
                 The proportion of data points in the synthetic data that are unique.
         """
-        return cls.compute_breakdown(real_data, synthetic_data)['score']
+        return cls.compute_breakdown(real_data, synthetic_data, low_memory, verify)['score']
@@ -1,6 +1,7 @@
 """Kolmogorov-Smirnov test based Metric."""
 
 import sys
+from math import gcd
 
 import numpy as np
 import pandas as pd
@@ -8,9 +9,10 @@ from scipy.stats import ks_2samp
 
 from sdmetrics.goal import Goal
 from sdmetrics.single_column.base import SingleColumnMetric
-from sdmetrics.utils import is_datetime
+from sdmetrics.utils import QuantileSketch, is_datetime
 
 MAX_DECIMALS = sys.float_info.dig - 1
+MAX_EXACT_ROWS = 10000
 
 
 class KSComplement(SingleColumnMetric):
@@ -74,6 +76,162 @@ class KSComplement(SingleColumnMetric):
 
         return 1 - statistic
 
+    @staticmethod
+    def sort_column(data):
+        """Get the sorted values of a column, as they are compared by ``compute``.
+
+        The missing values are dropped, the datetimes are converted to numbers and the
+        values are rounded to ``MAX_DECIMALS``.
+
+        Args:
+            data (Union[numpy.ndarray, pandas.Series]):
+                The values of the column.
+
+        Returns:
+            numpy.ndarray:
+                The sorted values.
+        """
+        data = pd.Series(data).dropna()
+        if is_datetime(data):
+            data = pd.to_numeric(data)
+
+        return np.sort(data.round(MAX_DECIMALS).to_numpy())
+
+    @staticmethod
+    def compute_sorted(real_sorted, synthetic_sorted):
+        """Compute the metric from the sorted values of two columns.
+
+        The difference of the empirical CDFs is evaluated at every value with
+        ``numpy.searchsorted``, as ``scipy.stats.ks_2samp`` does, without sorting again.
+
+        Args:
+            real_sorted (numpy.ndarray):
+                The sorted real values, as given by ``sort_column``.
+            synthetic_sorted (numpy.ndarray):
+                The sorted synthetic values, as given by ``sort_column``.
+
+        Returns:
+            float:
+                1 minus the Kolmogorov–Smirnov D statistic, or ``NaN`` if a column is empty.
+        """
+        if not len(real_sorted) or not len(synthetic_sorted):
+            return np.nan
+
+        values = np.concatenate([real_sorted, synthetic_sorted])
+        differences = np.searchsorted(real_sorted, values, side='right') / len(real_sorted)
+        differences -= np.searchsorted(synthetic_sorted, values, side='right') / len(
+            synthetic_sorted
+        )
+        statistic = max(np.clip(-differences.min(), 0, 1), differences.max())
+        num_real, num_synthetic = len(real_sorted), len(synthetic_sorted)
+        if max(num_real, num_synthetic) <= MAX_EXACT_ROWS:
+            # The statistic is a multiple of one over the least common multiple of the sizes,
+            # which ``ks_2samp`` rounds it to when computing its exact p-value.
+            multiple = num_real // gcd(num_real, num_synthetic) * num_synthetic
+            statistic = np.round(statistic * multiple) / multiple
+
+        return 1 - statistic
+
+    @classmethod
+    def compute_columns(
+        cls, real_data, synthetic_data, column_names=None, real_sorted_columns=None
+    ):
+        """Compute the metric for many continuous columns of a table at once.
+
+        Every real column is sorted only once. The sorted columns are stored in
+        ``real_sorted_columns``, so passing the same dictionary to later calls with new
+        synthetic data skips sorting the real data again.
+
+        Args:
+            real_data (pandas.DataFrame):
+                The real table.
+            synthetic_data (pandas.DataFrame):
+                The synthetic table.
+            column_names (list[str] or None):
+                The numerical and datetime columns to compare. Defaults to None, which
+                compares all the columns.
+            real_sorted_columns (dict or None):
+                The sorted real columns already computed, which is updated with the new
+                ones. Defaults to None.
+
+        Returns:
+            dict:
+                A mapping of each column to its score.
+        """
+        if column_names is None:
+            column_names = list(real_data.columns)
+
+        if real_sorted_columns is None:
+            real_sorted_columns = {}
+
+        scores = {}
+        for column_name in column_names:
+            if column_name not in real_sorted_columns:
+                real_sorted_columns[column_name] = cls.sort_column(real_data[column_name])
+
+            scores[column_name] = cls.compute_sorted(
+                real_sorted_columns[column_name], cls.sort_column(synthetic_data[column_name])
+            )
+
+        return scores
+
+    @staticmethod
+    def build_sketch(data, sketch_size=1024):
+        """Summarize a continuous column in a quantile sketch for the approximate mode.
+
+        The sketch can be saved with its ``to_dict`` method and passed to
+        ``compute_breakdown`` in place of the column, to compare it with many columns.
+
+        Args:
+            data (Union[numpy.ndarray, pandas.Series]):
+                The values of the column.
+            sketch_size (int):
+                The size of the levels of the sketch. Defaults to 1024.
+
+        Returns:
+            sdmetrics.utils.QuantileSketch:
+                The sketch of the column.
+        """
+        data = pd.Series(data).dropna()
+        if is_datetime(data):
+            data = pd.to_numeric(data)
+
+        sketch = QuantileSketch(sketch_size)
+        sketch.update(data.round(MAX_DECIMALS).to_numpy(dtype=np.float64))
+        return sketch
+
+    @classmethod
+    def compute_breakdown(cls, real_data, synthetic_data, approximate=False, sketch_size=1024):
+        """Compute the breakdown of the metric, exactly or from quantile sketches.
+
+        In the approximate mode, the statistic is computed from the sketches of the columns
+        without sorting all their values, and it is within ``error_bound`` of the exact one.
+
+        Args:
+            real_data (Union[numpy.ndarray, pandas.Series, sdmetrics.utils.QuantileSketch]):
+                The values from the real dataset, or their sketch in the approximate mode.
+            synthetic_data (Union[numpy.ndarray, pandas.Series, sdmetrics.utils.QuantileSketch]):
+                The values from the synthetic dataset, or their sketch in the approximate mode.
+            approximate (bool):
+                Whether to compute the statistic from quantile sketches. Defaults to False.
+            sketch_size (int):
+                The size of the levels of the sketches built from the columns.
+                Defaults to 1024.
+
+        Returns:
+            dict:
+                The score, and its ``error_bound`` in the approximate mode.
+        """
+        if not approximate:
+            return super().compute_breakdown(real_data, synthetic_data)
+
+        real_sketch, synthetic_sketch = (
+            data if isinstance(data, QuantileSketch) else cls.build_sketch(data, sketch_size)
+            for data in (real_data, synthetic_data)
+        )
+        statistic, error_bound = real_sketch.ks_statistic(synthetic_sketch)
+        return {'score': 1 - statistic, 'error_bound': error_bound}
+
     @classmethod
     def normalize(cls, raw_score):
         """Return the `raw_score` as is, since it is already normalized.
@@ -1,9 +1,8 @@
 """Missing Value Similarity Metric."""
 
-import pandas as pd
-
 from sdmetrics.goal import Goal
 from sdmetrics.single_column.base import SingleColumnMetric
+from sdmetrics.utils import ColumnProfile
 
 
 class MissingValueSimilarity(SingleColumnMetric):
@@ -32,20 +31,19 @@ class MissingValueSimilarity(SingleColumnMetric):
         """Compare the missing value similarity of two continuous columns.
 
         Args:
-            real_data (Union[numpy.ndarray, pandas.Series]):
-                The values from the real dataset.
-            synthetic_data (Union[numpy.ndarray, pandas.Series]):
-                The values from the synthetic dataset.
+            real_data (Union[numpy.ndarray, pandas.Series, ColumnProfile]):
+                The values from the real dataset, or their profile.
+            synthetic_data (Union[numpy.ndarray, pandas.Series, ColumnProfile]):
+                The values from the synthetic dataset, or their profile.
 
         Returns:
             dict:
                 A mapping of the missing value similarity results.
         """
-        real_data = pd.Series(real_data)
-        synthetic_data = pd.Series(synthetic_data)
-
-        real_data_value = real_data.isna().sum() / len(real_data)
-        synthetic_data_value = synthetic_data.isna().sum() / len(synthetic_data)
+        real_profile = ColumnProfile.from_column(real_data)
+        synthetic_profile = ColumnProfile.from_column(synthetic_data)
+        real_data_value = real_profile.num_nulls / real_profile.num_rows
+        synthetic_data_value = synthetic_profile.num_nulls / synthetic_profile.num_rows
 
         return {
             'score': 1 - abs(real_data_value - synthetic_data_value),
@@ -53,15 +51,53 @@ class MissingValueSimilarity(SingleColumnMetric):
             'synthetic': synthetic_data_value,
         }
 
+    @classmethod
+    def compute_breakdown_columns(
+        cls, real_data, synthetic_data, column_names=None, store_errors=False
+    ):
+        """Compare the missing value similarity of many columns at once.
+
+        Args:
+            real_data (pandas.DataFrame):
+                The real table.
+            synthetic_data (pandas.DataFrame):
+                The synthetic table.
+            column_names (list[str] or None):
+                The columns to compare. Defaults to None, which compares all the columns.
+            store_errors (bool):
+                Whether to store the errors of the columns instead of raising them. Counting
+                the missing values of a column does not fail, so it has no effect.
+                Defaults to False.
+
+        Returns:
+            dict:
+                A mapping of each column to its missing value similarity results.
+        """
+        if column_names is None:
+            column_names = list(real_data.columns)
+
+        real_data_values = real_data[column_names].isna().mean().to_numpy()
+        synthetic_data_values = synthetic_data[column_names].isna().mean().to_numpy()
+        return {
+            column_name: {
+                'score': 1 - abs(real_data_value - synthetic_data_value),
+                'real': real_data_value,
+                'synthetic': synthetic_data_value,
+            }
+            for column_name, real_data_value, synthetic_data_value in zip(
+                column_names, real_data_values, synthetic_data_values
+            )
+        }
+
     @classmethod
     def compute(cls, real_data, synthetic_data):
         """Compare the missing value similarity of two continuous columns.
 
         Args:
-            real_data (Union[numpy.ndarray, pandas.Series]):
-                The values from the real dataset.
-            synthetic_data (Union[numpy.ndarray, pandas.Series]):
-                The values from the synthetic dataset.
+            real_data (Union[numpy.ndarray, pandas.Series, ColumnProfile]):
+                The values from the real dataset, or their profile.
+            synthetic_data (Union[numpy.ndarray, pandas.Series, ColumnProfile]):
+                The values from the synthetic dataset, or their profile.
 
         Returns:
             float:
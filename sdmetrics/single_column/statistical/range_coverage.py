@@ -1,10 +1,10 @@
 """Range Coverage Metric."""
 
 import numpy as np
-import pandas as pd
 
 from sdmetrics.goal import Goal
 from sdmetrics.single_column.base import SingleColumnMetric
+from sdmetrics.utils import ColumnProfile
 
 
 class RangeCoverage(SingleColumnMetric):
@@ -34,25 +34,21 @@ class RangeCoverage(SingleColumnMetric):
         """Compute the range coverage of synthetic columns over the real column.
 
         Args:
-            real_data (Union[numpy.ndarray, pandas.Series]):
-                The values from the real dataset.
-            synthetic_data (Union[numpy.ndarray, pandas.Series]):
-                The values from the synthetic dataset.
+            real_data (Union[numpy.ndarray, pandas.Series, ColumnProfile]):
+                The values from the real dataset, or their profile.
+            synthetic_data (Union[numpy.ndarray, pandas.Series, ColumnProfile]):
+                The values from the synthetic dataset, or their profile.
 
         Returns:
             float:
                 The range coverage of the synthetic data over the real data.
         """
-        if not isinstance(real_data, pd.Series):
-            real_data = pd.Series(real_data)
-
-        if not isinstance(synthetic_data, pd.Series):
-            synthetic_data = pd.Series(synthetic_data)
-
-        min_r = real_data.min()
-        max_r = real_data.max()
-        min_s = synthetic_data.min()
-        max_s = synthetic_data.max()
+        real_profile = ColumnProfile.from_column(real_data)
+        synthetic_profile = ColumnProfile.from_column(synthetic_data)
+        min_r = real_profile.minimum
+        max_r = real_profile.maximum
+        min_s = synthetic_profile.minimum
+        max_s = synthetic_profile.maximum
 
         if min_r == max_r:
             return np.nan
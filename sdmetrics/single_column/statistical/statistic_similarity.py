@@ -1,6 +1,7 @@
 """Statistic Similarity Metric."""
 
 import warnings
+from functools import partial
 
 import numpy as np
 import pandas as pd
@@ -30,6 +31,8 @@ class StatisticSimilarity(SingleColumnMetric):
     min_value = 0.0
     max_value = 1.0
 
+    _STATISTICS = {'mean': np.nanmean, 'std': partial(np.nanstd, ddof=1), 'median': np.nanmedian}
+
     @classmethod
     def compute(cls, real_data, synthetic_data, statistic='mean'):
         """Compare the statistic similarity of two continuous columns.
@@ -93,6 +96,94 @@ class StatisticSimilarity(SingleColumnMetric):
         score = 1 - abs(score_real - score_synthetic) / (real_data.max() - real_data.min())
         return {'real': score_real, 'synthetic': score_synthetic, 'score': max(score, 0)}
 
+    @classmethod
+    def compute_breakdown_columns(
+        cls, real_data, synthetic_data, column_names=None, statistic='mean', store_errors=False
+    ):
+        """Compare the breakdown of statistic similarity of many continuous columns.
+
+        The numerical and datetime columns are reduced together as a single array, and any
+        other column, or every column if the statistic is not valid, is compared with
+        ``compute_breakdown``.
+
+        Args:
+            real_data (pandas.DataFrame):
+                The real table.
+            synthetic_data (pandas.DataFrame):
+                The synthetic table.
+            column_names (list[str] or None):
+                The columns to compare. Defaults to None, which compares all the columns.
+            statistic (str):
+                The statistic to compare, either ``mean``, ``std`` or ``median``.
+                Defaults to ``mean``.
+            store_errors (bool):
+                Whether to store the error of a column compared with ``compute_breakdown``
+                as its result instead of raising it. Defaults to False.
+
+        Returns:
+            dict:
+                A mapping of each column to a dict containing the score, and the real and
+                synthetic metric values, or the error of the column.
+        """
+        if column_names is None:
+            column_names = list(real_data.columns)
+
+        real_dtypes = real_data.dtypes
+        synthetic_dtypes = synthetic_data.dtypes
+        column_kinds = {}
+        for column_name in column_names:
+            kind = _get_column_kind(real_dtypes[column_name])
+            if (
+                statistic in cls._STATISTICS
+                and kind is not None
+                and kind == _get_column_kind(synthetic_dtypes[column_name])
+            ):
+                column_kinds[column_name] = kind
+
+        breakdowns = {}
+        for column_name in column_names:
+            if column_name in column_kinds:
+                continue
+
+            try:
+                breakdowns[column_name] = cls.compute_breakdown(
+                    real_data[column_name], synthetic_data[column_name], statistic
+                )
+            except Exception as error:
+                if not store_errors:
+                    raise
+
+                breakdowns[column_name] = {'error': error}
+
+        if not column_kinds:
+            return breakdowns
+
+        real_values, real_minimums, real_maximums = _reduce_columns(
+            real_data, column_kinds, statistic
+        )
+        synthetic_values = _reduce_columns(synthetic_data, column_kinds, statistic)[0]
+        for index, column_name in enumerate(column_kinds):
+            real_minimum, real_maximum = real_minimums[index], real_maximums[index]
+            if real_minimum == real_maximum:
+                msg = (
+                    'The real data input array is constant. '
+                    'The StatisticSimilarity metric is either undefined or infinite.'
+                )
+                warnings.warn(ConstantInputWarning(msg))
+                breakdowns[column_name] = {'score': np.nan}
+                continue
+
+            score_real = real_values[index]
+            score_synthetic = synthetic_values[index]
+            score = 1 - abs(score_real - score_synthetic) / (real_maximum - real_minimum)
+            breakdowns[column_name] = {
+                'real': score_real,
+                'synthetic': score_synthetic,
+                'score': max(score, 0),
+            }
+
+        return {column_name: breakdowns[column_name] for column_name in column_names}
+
     @classmethod
     def normalize(cls, raw_score):
         """Return the `raw_score` as is, since it is already normalized.
@@ -106,3 +197,65 @@ class StatisticSimilarity(SingleColumnMetric):
                 The normalized value of the metric
         """
         return super().normalize(raw_score)
+
+
+def _get_column_kind(dtype):
+    """Get whether a dtype can be reduced as ``numerical`` or ``datetime`` values, or None."""
+    if pd.api.types.is_bool_dtype(dtype):
+        return None
+
+    if pd.api.types.is_numeric_dtype(dtype):
+        return 'numerical'
+
+    if pd.api.types.is_datetime64_dtype(dtype):
+        return 'datetime'
+
+    return None
+
+
+def _reduce_columns(data, column_kinds, statistic):
+    """Compute a statistic and the range of many columns, ignoring the missing values.
+
+    Args:
+        data (pandas.DataFrame):
+            The table.
+        column_kinds (dict):
+            A mapping of each column to reduce to its kind, ``numerical`` or ``datetime``.
+        statistic (str):
+            The statistic to compute.
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+            The statistic, the minimum and the maximum of each column.
+    """
+    column_names = list(column_kinds)
+    values = np.full((len(column_names), len(data)), np.nan)
+    numerical = [index for index, kind in enumerate(column_kinds.values()) if kind == 'numerical']
+    if numerical:
+        numerical_data = data[[column_names[index] for index in numerical]]
+        values[numerical] = numerical_data.to_numpy(dtype=float, na_value=np.nan).T
+
+    for index, kind in enumerate(column_kinds.values()):
+        if kind == 'datetime':
+            column = data[column_names[index]]
+            values[index] = pd.to_numeric(column).where(column.notna(), np.nan)
+
+    reduce = StatisticSimilarity._STATISTICS[statistic]
+    with warnings.catch_warnings(), np.errstate(invalid='ignore', divide='ignore'):
+        # The empty columns get ``NaN`` results, as in ``compute_breakdown``.
+        warnings.simplefilter('ignore', RuntimeWarning)
+        if not len(data):
+            empty = np.full(len(column_names), np.nan)
+            return empty, empty, empty
+
+        # Each column is a contiguous row. The rows with missing values are reduced
+        # again without them, so they add up in the same order as a single column.
+        is_missing = np.isnan(values)
+        result = reduce(values, axis=1)
+        for index in np.flatnonzero(is_missing.any(axis=1)):
+            result[index] = reduce(values[index][~is_missing[index]])
+
+        minimums = np.nanmin(values, axis=1)
+        maximums = np.nanmax(values, axis=1)
+
+    return result, minimums, maximums
@@ -1,11 +1,12 @@
 """Total Variation Complement Metric."""
 
+import numpy as np
 import pandas as pd
 
 from sdmetrics.errors import IncomputableMetricError
 from sdmetrics.goal import Goal
 from sdmetrics.single_column.base import SingleColumnMetric
-from sdmetrics.utils import get_frequencies
+from sdmetrics.utils import get_frequency_arrays
 
 
 class TVComplement(SingleColumnMetric):
@@ -51,13 +52,43 @@ class TVComplement(SingleColumnMetric):
                 'The TVComplement metric must have 1 or more non-null values.'
             )
 
-        f_obs, f_exp = get_frequencies(real_data, synthetic_data)
-        total_variation = 0
-        for i in range(len(f_obs)):
-            total_variation += abs(f_obs[i] - f_exp[i])
+        f_obs, f_exp = get_frequency_arrays(real_data, synthetic_data)
+        # A running sum adds the differences in the same order as summing them one by one.
+        total_variation = float(np.cumsum(np.abs(f_obs - f_exp))[-1])
 
         return 1 - 0.5 * total_variation
 
+    @classmethod
+    def compute_columns(cls, real_data, synthetic_data, column_names=None):
+        """Compute the complement of the total variation distance of many discrete columns.
+
+        Args:
+            real_data (pandas.DataFrame):
+                The real table.
+            synthetic_data (pandas.DataFrame):
+                The synthetic table.
+            column_names (list[str] or None):
+                The columns to compare. Defaults to None, which compares all the columns.
+
+        Returns:
+            dict:
+                A mapping of each column to its score. The columns without non-null values
+                in the real or the synthetic data get a ``NaN`` score.
+        """
+        if column_names is None:
+            column_names = list(real_data.columns)
+
+        scores = {}
+        for column_name in column_names:
+            try:
+                scores[column_name] = cls.compute(
+                    real_data[column_name], synthetic_data[column_name]
+                )
+            except IncomputableMetricError:
+                scores[column_name] = np.nan
+
+        return scores
+
     @classmethod
     def normalize(cls, raw_score):
         """Return the `raw_score` as is, since it is already normalized.
@@ -47,7 +47,10 @@ class MultiSingleColumnMetric(
         This is done by computing the underlying SingleColumn metric to all the
         columns that are compatible with it.
 
-        The output is a mapping of column name to the score of that column.
+        The output is a mapping of column name to the score of that column. If the
+        SingleColumn metric has a ``compute_breakdown_columns`` method, all the columns
+        are computed with a single call to it instead, which stores the errors of the
+        columns itself.
 
         Args:
             real_data (pandas.DataFrame):
@@ -74,24 +77,43 @@ class MultiSingleColumnMetric(
         invalid_cols = set(get_columns_from_metadata(metadata).keys()) - set(fields)
 
         scores = {col: {'score': np.nan} for col in invalid_cols}
-        for column_name, real_column in real_data.items():
-            if column_name in fields:
-                real_column = real_column.to_numpy()
-                synthetic_column = synthetic_data[column_name].to_numpy()
-
-                try:
-                    score = self.single_column_metric.compute_breakdown(
-                        real_column,
-                        synthetic_column,
-                        **(self.single_column_metric_kwargs or {}),
-                        **kwargs,
-                    )
-                    scores[column_name] = score
-                except Exception as error:
-                    if store_errors:
-                        scores[column_name] = {'error': error}
-                    else:
-                        raise error
+        selected_fields = set(fields)
+        column_names = [
+            column_name for column_name in real_data.columns if column_name in selected_fields
+        ]
+        compute_breakdown_columns = getattr(
+            self.single_column_metric, 'compute_breakdown_columns', None
+        )
+        if compute_breakdown_columns is not None:
+            scores.update(
+                compute_breakdown_columns(
+                    real_data,
+                    synthetic_data,
+                    column_names,
+                    store_errors=store_errors,
+                    **(self.single_column_metric_kwargs or {}),
+                    **kwargs,
+                )
+            )
+            return scores
+
+        for column_name in column_names:
+            real_column = real_data[column_name].to_numpy()
+            synthetic_column = synthetic_data[column_name].to_numpy()
+
+            try:
+                score = self.single_column_metric.compute_breakdown(
+                    real_column,
+                    synthetic_column,
+                    **(self.single_column_metric_kwargs or {}),
+                    **kwargs,
+                )
+                scores[column_name] = score
+            except Exception as error:
+                if store_errors:
+                    scores[column_name] = {'error': error}
+                else:
+                    raise error
 
         return scores
 
@@ -1,13 +1,206 @@
 """New Row Synthesis metric for single table."""
 
+import itertools
+import os
 import warnings
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 
+import numpy as np
 import pandas as pd
 
 from sdmetrics.errors import IncomputableMetricError
 from sdmetrics.goal import Goal
 from sdmetrics.single_table.base import SingleTableMetric
-from sdmetrics.utils import get_columns_from_metadata, get_type_from_column_meta, strip_characters
+from sdmetrics.utils import get_columns_from_metadata, get_type_from_column_meta
+
+MAX_CANDIDATES = 2**22
+MAX_GRID_COLUMNS = 2
+MAX_GRID_TOLERANCE = 0.5
+_WORKER_DATA = {}
+
+
+def _to_numerical_array(column):
+    if pd.api.types.is_integer_dtype(column.dtype) and not column.isna().any():
+        return column.to_numpy(dtype=np.int64)
+
+    return pd.to_numeric(column, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _searchsorted(array, values, side):
+    """Run ``numpy.searchsorted`` with the values sorted first, which is more cache friendly."""
+    order = np.argsort(values, kind='stable')
+    positions = np.empty(len(values), dtype=np.int64)
+    positions[order] = np.searchsorted(array, values[order], side=side)
+    return positions
+
+
+class _RealDataIndex:
+    """Index of the real rows used to find which synthetic rows match any of them.
+
+    The categorical columns and the missing value pattern of the numerical columns are
+    encoded into a composite key, so only real rows with the same key are compared. Up to
+    ``MAX_GRID_COLUMNS`` numerical columns are also added to the key as cells of a grid in
+    log scale, which are wide enough for any value within the tolerance of a synthetic
+    value to fall in the same or a neighboring cell. Within each key, the real rows are
+    sorted by the numerical column with most distinct values, so the rows whose value is
+    within the tolerance of a synthetic value are found with a binary search. All the
+    numerical columns are then checked exactly on those candidates only.
+
+    Args:
+        real_data (pandas.DataFrame):
+            The real data.
+        numerical_fields (list[str]):
+            The names of the numerical columns, compared using the tolerance.
+        categorical_fields (list[str]):
+            The names of the categorical columns, compared exactly.
+        numerical_match_tolerance (float):
+            How close two numerical values have to be, relative to the synthetic value,
+            in order to be considered a match.
+    """
+
+    def __init__(self, real_data, numerical_fields, categorical_fields, numerical_match_tolerance):
+        self.numerical_fields = list(numerical_fields)
+        self.categorical_fields = list(categorical_fields)
+        self.tolerance = numerical_match_tolerance
+        self._categories = {}
+        for field in self.categorical_fields:
+            self._categories[field] = pd.Index(pd.unique(real_data[field].dropna()))
+
+        self._numerical_values = [_to_numerical_array(real_data[f]) for f in numerical_fields]
+        self._primary = None
+        self._grid = []
+        if self.numerical_fields:
+            num_unique = [pd.unique(values).size for values in self._numerical_values]
+            by_num_unique = list(np.argsort(num_unique, kind='stable')[::-1])
+            self._primary = by_num_unique[0]
+            if 0 < self.tolerance < MAX_GRID_TOLERANCE:
+                self._grid = by_num_unique[1 : MAX_GRID_COLUMNS + 1]
+                tolerance_width = np.log((1 + self.tolerance) / (1 - self.tolerance))
+                self._cell_width = 1.5 * tolerance_width
+
+        key_codes = self._get_key_codes(real_data, self._numerical_values)
+        key_ids, self._keys = pd.MultiIndex.from_arrays(key_codes).factorize()
+
+        primary_values = self._get_primary_values(self._numerical_values, len(real_data))
+        self._unique_values = np.unique(primary_values[~np.isnan(primary_values)])
+        ranks = np.searchsorted(self._unique_values, primary_values)
+        composite = key_ids.astype(np.int64) * (len(self._unique_values) + 1) + ranks
+        self._order = np.argsort(composite, kind='stable')
+        self._composite = composite[self._order]
+
+    def _get_cells(self, values):
+        values = values.astype(np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cells = np.floor(np.log(np.abs(values)) / self._cell_width)
+
+        cells[~np.isfinite(cells)] = 0
+        return np.sign(np.nan_to_num(values)).astype(np.int64), cells.astype(np.int64)
+
+    def _get_key_codes(self, data, numerical_values):
+        key_codes = [np.zeros(len(data), dtype=np.int64)]
+        for field in self.categorical_fields:
+            categories = self._categories[field]
+            codes = categories.get_indexer(data[field])
+            codes[pd.isna(data[field]).to_numpy()] = len(categories)
+            key_codes.append(codes)
+
+        key_codes.extend(pd.isna(values).astype(np.int64) for values in numerical_values)
+        for column in self._grid:
+            key_codes.extend(self._get_cells(numerical_values[column]))
+
+        return key_codes
+
+    def _get_primary_values(self, numerical_values, num_rows):
+        if self._primary is None:
+            return np.zeros(num_rows)
+
+        return numerical_values[self._primary].astype(np.float64)
+
+    def _get_primary_ranks(self, primary_values):
+        margins = np.abs(self.tolerance * primary_values)
+        margins += 8 * np.spacing(np.abs(primary_values) + margins)
+        low_ranks = _searchsorted(self._unique_values, primary_values - margins, side='left')
+        high_ranks = _searchsorted(self._unique_values, primary_values + margins, side='right')
+        is_null = np.isnan(primary_values)
+        low_ranks[is_null] = len(self._unique_values)
+        high_ranks[is_null] = len(self._unique_values) + 1
+        return low_ranks, high_ranks
+
+    def _get_candidate_ranges(self, key_ids, low_ranks, high_ranks):
+        offsets = key_ids.astype(np.int64) * (len(self._unique_values) + 1)
+        starts = _searchsorted(self._composite, offsets + low_ranks, side='left')
+        ends = _searchsorted(self._composite, offsets + high_ranks, side='left')
+        ends[key_ids == -1] = starts[key_ids == -1]
+        return starts, ends
+
+    def _check_candidates(self, rows, positions, numerical_values):
+        real_rows = self._order[positions]
+        is_match = np.ones(len(rows), dtype=bool)
+        for real_values, synthetic_values in zip(self._numerical_values, numerical_values):
+            synthetic_values = synthetic_values[rows]
+            within_tolerance = np.abs(real_values[real_rows] - synthetic_values) <= np.abs(
+                self.tolerance * synthetic_values
+            )
+            is_match &= within_tolerance | np.isnan(synthetic_values)
+
+        return is_match
+
+    def _match_candidates(self, starts, ends, numerical_values, matched):
+        counts = ends - starts
+        candidate_rows = np.flatnonzero((counts > 0) & ~matched)
+        while len(candidate_rows):
+            cumulative_counts = np.cumsum(counts[candidate_rows])
+            num_rows = max(1, np.searchsorted(cumulative_counts, MAX_CANDIDATES, side='right'))
+            rows = candidate_rows[:num_rows]
+            candidate_rows = candidate_rows[num_rows:]
+
+            row_counts = counts[rows]
+            repeated_rows = np.repeat(rows, row_counts)
+            first_positions = np.repeat(np.cumsum(row_counts) - row_counts, row_counts)
+            positions = np.arange(len(repeated_rows)) - first_positions
+            positions += np.repeat(starts[rows], row_counts)
+            is_match = self._check_candidates(repeated_rows, positions, numerical_values)
+            matched[repeated_rows[is_match]] = True
+
+    def match(self, synthetic_data):
+        """Find the synthetic rows that match at least one real row.
+
+        Args:
+            synthetic_data (pandas.DataFrame):
+                The synthetic data.
+
+        Returns:
+            numpy.ndarray:
+                A boolean array that is ``True`` for the synthetic rows that match a real row.
+        """
+        numerical_values = [_to_numerical_array(synthetic_data[f]) for f in self.numerical_fields]
+        key_codes = self._get_key_codes(synthetic_data, numerical_values)
+        primary_values = self._get_primary_values(numerical_values, len(synthetic_data))
+        low_ranks, high_ranks = self._get_primary_ranks(primary_values)
+        matched = np.zeros(len(synthetic_data), dtype=bool)
+        num_cell_codes = 2 * len(self._grid)
+        for cell_offsets in itertools.product([0, -1, 1], repeat=len(self._grid)):
+            neighbor_codes = list(key_codes)
+            for idx, offset in enumerate(cell_offsets):
+                position = len(key_codes) - num_cell_codes + 2 * idx + 1
+                neighbor_codes[position] = key_codes[position] + offset
+
+            key_ids = self._keys.get_indexer(pd.MultiIndex.from_arrays(neighbor_codes))
+            if self._primary is None:
+                matched |= key_ids != -1
+            else:
+                starts, ends = self._get_candidate_ranges(key_ids, low_ranks, high_ranks)
+                self._match_candidates(starts, ends, numerical_values, matched)
+
+        return matched
+
+
+def _initialize_worker(index):
+    _WORKER_DATA['index'] = index
+
+
+def _count_worker_matches(synthetic_data):
+    return int(_WORKER_DATA['index'].match(synthetic_data).sum())
 
 
 class NewRowSynthesis(SingleTableMetric):
@@ -32,6 +225,34 @@ class NewRowSynthesis(SingleTableMetric):
     min_value = 0
     max_value = 1
 
+    @staticmethod
+    def _count_matches(index, synthetic_data, chunk_size, n_jobs):
+        """Count the synthetic rows that match a real row, processing them in chunks."""
+        chunk_size = chunk_size or max(len(synthetic_data), 1)
+        chunks = (
+            synthetic_data.iloc[start : start + chunk_size]
+            for start in range(0, len(synthetic_data), chunk_size)
+        )
+        if n_jobs is None or n_jobs == 1:
+            return sum(int(index.match(chunk).sum()) for chunk in chunks)
+
+        max_workers = os.cpu_count() if n_jobs == -1 else n_jobs
+        num_matched_rows = 0
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_initialize_worker, initargs=(index,)
+        ) as executor:
+            pending = set()
+            for chunk in chunks:
+                if len(pending) >= 2 * max_workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    num_matched_rows += sum(future.result() for future in done)
+
+                pending.add(executor.submit(_count_worker_matches, chunk))
+
+            num_matched_rows += sum(future.result() for future in wait(pending).done)
+
+        return num_matched_rows
+
     @classmethod
     def compute_breakdown(
         cls,
@@ -40,6 +261,8 @@ class NewRowSynthesis(SingleTableMetric):
         metadata=None,
         numerical_match_tolerance=0.01,
         synthetic_sample_size=None,
+        chunk_size=None,
+        n_jobs=None,
     ):
         """Compute this metric.
 
@@ -62,6 +285,15 @@ class NewRowSynthesis(SingleTableMetric):
                 of synthetic data. Note that the final score may not be as precise if
                 your sample size is low. Defaults to ``None``, which does not sample,
                 and uses all of the provided rows.
+            chunk_size (int):
+                The number of synthetic rows to match at a time. Use this to bound the memory
+                used when the synthetic data is very large. Defaults to ``None``, which
+                matches all the synthetic rows at once.
+            n_jobs (int):
+                The number of processes used to match the chunks of synthetic rows. The index
+                of the real data is built once and shared with every process. If ``None`` or
+                ``1``, the chunks are matched sequentially. If ``-1``, all the processors are
+                used. Defaults to ``None``.
 
         Returns:
             dict:
@@ -70,6 +302,11 @@ class NewRowSynthesis(SingleTableMetric):
         real_data, synthetic_data, metadata = cls._validate_inputs(
             real_data, synthetic_data, metadata
         )
+        if chunk_size is not None and (not isinstance(chunk_size, int) or chunk_size <= 0):
+            raise ValueError('`chunk_size` must be None or an integer greater than zero.')
+
+        if n_jobs is not None and (not isinstance(n_jobs, int) or (n_jobs <= 0 and n_jobs != -1)):
+            raise ValueError('`n_jobs` must be None, -1 or an integer greater than zero.')
 
         if synthetic_sample_size is not None:
             if synthetic_sample_size > len(synthetic_data):
@@ -100,60 +337,11 @@ class NewRowSynthesis(SingleTableMetric):
         except IncomputableMetricError:
             categorical_fields = []
 
-        for column_name in real_data.columns:
-            new_column_name = strip_characters(['\n', '.', "'"], column_name)
-            if new_column_name != column_name:
-                if new_column_name in real_data.columns:
-                    while new_column_name in real_data.columns:
-                        new_column_name += '_'
-
-                real_data = real_data.rename(columns={column_name: new_column_name})
-                synthetic_data = synthetic_data.rename(columns={column_name: new_column_name})
-                if column_name in numerical_fields:
-                    numerical_fields.remove(column_name)
-                    numerical_fields.append(new_column_name)
-                elif column_name in categorical_fields:
-                    categorical_fields.remove(column_name)
-                    categorical_fields.append(new_column_name)
-
-        num_unique_rows = 0
-        for index, row in synthetic_data.iterrows():
-            row_filter = []
-            for field in real_data.columns:
-                if field not in numerical_fields and field not in categorical_fields:
-                    continue
-
-                if pd.isna(row[field]):
-                    field_filter = f'`{field}`.isnull()'
-                elif field in numerical_fields:
-                    field_filter = (
-                        f'abs(`{field}` - {row[field]}) <= '
-                        f'{abs(numerical_match_tolerance * row[field])}'
-                    )
-                elif field in categorical_fields:
-                    if real_data[field].dtype == 'O':
-                        field_filter = f'`{field}` == {repr(row[field])}'
-                    else:
-                        field_filter = f'`{field}` == {row[field]}'
-
-                row_filter.append(field_filter)
-
-            engine = None
-            if len(row_filter) >= 32:  # Limit set by NPY_MAXARGS
-                engine = 'python'
-            try:
-                matches = real_data.query(' and '.join(row_filter), engine=engine)
-            except TypeError:
-                if len(real_data) > 10000:
-                    warnings.warn(
-                        'Unable to optimize query. For better formance, set the '
-                        '`synthetic_sample_size` parameter or upgrade to Python 3.8'
-                    )
-
-                matches = real_data.query(' and '.join(row_filter), engine='python')
-
-            if matches is None or matches.empty:
-                num_unique_rows += 1
+        index = _RealDataIndex(
+            real_data, numerical_fields, categorical_fields, numerical_match_tolerance
+        )
+        num_matched_rows = cls._count_matches(index, synthetic_data, chunk_size, n_jobs)
+        num_unique_rows = len(synthetic_data) - num_matched_rows
 
         return {
             'score': num_unique_rows / len(synthetic_data),
@@ -169,6 +357,8 @@ class NewRowSynthesis(SingleTableMetric):
         metadata=None,
         numerical_match_tolerance=0.01,
         synthetic_sample_size=None,
+        chunk_size=None,
+        n_jobs=None,
     ):
         """Compute this metric.
 
@@ -191,6 +381,15 @@ class NewRowSynthesis(SingleTableMetric):
                 of synthetic data. Note that the final score may not be as precise if
                 your sample size is low. Defaults to ``None``, which does not sample,
                 and uses all of the provided rows.
+            chunk_size (int):
+                The number of synthetic rows to match at a time. Use this to bound the memory
+                used when the synthetic data is very large. Defaults to ``None``, which
+                matches all the synthetic rows at once.
+            n_jobs (int):
+                The number of processes used to match the chunks of synthetic rows. The index
+                of the real data is built once and shared with every process. If ``None`` or
+                ``1``, the chunks are matched sequentially. If ``-1``, all the processors are
+                used. Defaults to ``None``.
 
         Returns:
             float:
@@ -202,6 +401,8 @@ class NewRowSynthesis(SingleTableMetric):
             metadata,
             numerical_match_tolerance,
             synthetic_sample_size,
+            chunk_size,
+            n_jobs,
         )['score']
 
     @classmethod
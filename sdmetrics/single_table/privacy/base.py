@@ -144,31 +144,22 @@ class CategoricalPrivacyMetric(SingleTableMetric):
 
         if cls.ACCURACY_BASE:  # calculate privacy score based on prediction accuracy
             count = len(real_data)
-            match = 0
-            for idx in range(count):
-                key_data = tuple(real_data[key_fields].iloc[idx])
-                sensitive_data = tuple(real_data[sensitive_fields].iloc[idx])
-                pred_sensitive = model.predict(key_data)
-                if pred_sensitive == sensitive_data:
-                    match += 1
+            predictions = model.predict_batch(real_data[key_fields])
+            sensitive_rows = real_data[sensitive_fields].itertuples(index=False, name=None)
+            match = sum(
+                pred_sensitive == sensitive_data
+                for pred_sensitive, sensitive_data in zip(predictions, sensitive_rows)
+            )
 
             return 1.0 - match / count
 
         else:  # calculate privacy score based on posterior prob of the correct sensitive data
-            count = 0
-            score = 0
-            for idx in range(len(real_data)):
-                key_data = tuple(real_data[key_fields].iloc[idx])
-                sensitive_data = tuple(real_data[sensitive_fields].iloc[idx])
-                row_score = model.score(key_data, sensitive_data)
-                if row_score is not None:
-                    count += 1
-                    score += row_score
-
-            if count == 0:
+            scores = model.score_batch(real_data[key_fields], real_data[sensitive_fields])
+            scores = scores[~np.isnan(scores)]
+            if len(scores) == 0:
                 return np.nan
 
-            return 1.0 - score / count
+            return 1.0 - float(scores.sum()) / len(scores)
 
 
 class NumericalPrivacyMetric(SingleTableMetric):
@@ -311,15 +302,10 @@ class NumericalPrivacyMetric(SingleTableMetric):
 
         loss_function.fit(real_data, sensitive_fields)
 
-        count = len(real_data)
-        score = 0
-        for idx in range(count):
-            key_data = tuple(real_data[key_fields].iloc[idx])
-            sensitive_data = tuple(real_data[sensitive_fields].iloc[idx])
-            pred_sensitive = model.predict(key_data)
-            score += loss_function.measure(pred_sensitive, sensitive_data)
+        predictions = model.predict_batch(real_data[key_fields])
+        losses = loss_function.measure_batch(predictions, real_data[sensitive_fields].to_numpy())
 
-        return score / count
+        return float(np.sum(losses)) / len(real_data)
 
 
 class PrivacyAttackerModel:
@@ -356,6 +342,22 @@ class PrivacyAttackerModel:
         """
         raise NotImplementedError('Please implement predict method of attackers')
 
+    def predict_batch(self, key_data):
+        """Make a prediction of the sensitive data for every row of the given keys.
+
+        By default this calls ``predict`` once per row. Attackers that can make all the
+        predictions at once should override it.
+
+        Args:
+            key_data (pandas.DataFrame):
+                The key columns of the rows to predict.
+
+        Returns:
+            list[tuple]:
+                The predicted sensitive data of each row.
+        """
+        return [self.predict(key_row) for key_row in key_data.itertuples(index=False, name=None)]
+
     def score(self, key_data, sensitive_data):
         """Score based on the belief of the attacker, in the form P(sensitive_data|key|data).
 
@@ -368,3 +370,30 @@ class PrivacyAttackerModel:
         raise NotImplementedError(
             'Posterior probability based scoring not supportedfor this attacker!'
         )
+
+    def score_batch(self, key_data, sensitive_data):
+        """Score every row of the given data based on the belief of the attacker.
+
+        By default this calls ``score`` once per row. Attackers that can score all the
+        rows at once should override it.
+
+        Args:
+            key_data (pandas.DataFrame):
+                The key columns of the rows to score.
+            sensitive_data (pandas.DataFrame):
+                The sensitive columns of the rows to score.
+
+        Returns:
+            numpy.ndarray:
+                The score of each row, with ``NaN`` for the rows that the attacker ignores.
+        """
+        scores = []
+        rows = zip(
+            key_data.itertuples(index=False, name=None),
+            sensitive_data.itertuples(index=False, name=None),
+        )
+        for key_row, sensitive_row in rows:
+            row_score = self.score(key_row, sensitive_row)
+            scores.append(np.nan if row_score is None else row_score)
+
+        return np.array(scores, dtype=float)
@@ -2,14 +2,26 @@
 
 import warnings
 
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
 from sdmetrics.single_table.privacy.base import CategoricalPrivacyMetric, PrivacyAttackerModel
-from sdmetrics.single_table.privacy.util import closest_neighbors, count_frequency, majority
+from sdmetrics.single_table.privacy.util import (
+    closest_neighbors,
+    closest_neighbors_mask,
+    count_frequency,
+    factorize_columns,
+    factorize_rows,
+    majority,
+)
 
 DEPRECATION_MSG = (
     'Computing CAP metrics directly is deprecated. For improved privacy metrics, '
     "please use the 'DisclosureProtection' and 'DisclosureProtectionEstimate' "
     'metrics instead.'
 )
+HAMMING_BLOCK_SIZE = 2**22
 
 
 class CAPAttacker(PrivacyAttackerModel):
@@ -23,6 +35,8 @@ class CAPAttacker(PrivacyAttackerModel):
 
     def __init__(self):
         self.synthetic_dict = {}  # {key attribute: [sensitive attribute]}
+        self._synthetic_keys = None
+        self._synthetic_sensitive = None
 
     def fit(self, synthetic_data, key_fields, sensitive_fields):
         """Fit the attacker on the synthetic data.
@@ -35,9 +49,13 @@ class CAPAttacker(PrivacyAttackerModel):
             sensitive_fields (list(str)):
                 Name of the column(s) to use as the sensitive attributes.
         """
-        for idx in range(len(synthetic_data)):
-            key_value = tuple(synthetic_data[key_fields].iloc[idx])
-            sensitive_value = tuple(synthetic_data[sensitive_fields].iloc[idx])
+        self._synthetic_keys = synthetic_data[key_fields].reset_index(drop=True)
+        self._synthetic_sensitive = synthetic_data[sensitive_fields].reset_index(drop=True)
+        rows = zip(
+            self._synthetic_keys.itertuples(index=False, name=None),
+            self._synthetic_sensitive.itertuples(index=False, name=None),
+        )
+        for key_value, sensitive_value in rows:
             if key_value in self.synthetic_dict:
                 self.synthetic_dict[key_value].append(sensitive_value)
             else:
@@ -78,6 +96,42 @@ class CAPAttacker(PrivacyAttackerModel):
         else:
             return None
 
+    def score_batch(self, key_data, sensitive_data):
+        """Score every row of the given data based on the belief of the attacker.
+
+        The key and sensitive values of the real and synthetic rows are encoded as integer
+        codes, the frequency of every sensitive value for each key is counted with a single
+        ``groupby`` over the synthetic data and then joined to the real rows.
+
+        Args:
+            key_data (pandas.DataFrame):
+                The key columns of the rows to score.
+            sensitive_data (pandas.DataFrame):
+                The sensitive columns of the rows to score.
+
+        Returns:
+            numpy.ndarray:
+                The frequency of the correct sensitive entry for each row.
+                It is ``NaN`` for the rows whose key is not in the data.
+        """
+        real_keys, synthetic_keys = factorize_rows(key_data, self._synthetic_keys)
+        real_sensitive, synthetic_sensitive = factorize_rows(
+            sensitive_data, self._synthetic_sensitive
+        )
+        synthetic = pd.DataFrame({'key': synthetic_keys, 'sensitive': synthetic_sensitive})
+        frequencies = synthetic.groupby(['key', 'sensitive']).size().rename('count').reset_index()
+
+        real = pd.DataFrame({'key': real_keys, 'sensitive': real_sensitive})
+        matches = real.merge(frequencies, on=['key', 'sensitive'], how='left')['count']
+        matches = matches.fillna(0).to_numpy()
+        key_counts = np.bincount(synthetic_keys, minlength=len(real_keys) + len(synthetic_keys))
+        totals = key_counts[real_keys]
+
+        scores = np.full(len(real_keys), np.nan)
+        found = totals > 0
+        scores[found] = matches[found] / totals[found]
+        return scores
+
 
 class CategoricalCAP(CategoricalPrivacyMetric):
     """The Categorical CAP privacy metric. Scored based on the CAPAttacker."""
@@ -185,6 +239,24 @@ class ZeroCAPAttacker(CAPAttacker):
         else:
             return 0
 
+    def score_batch(self, key_data, sensitive_data):
+        """Score every row of the given data based on the belief of the attacker.
+
+        Args:
+            key_data (pandas.DataFrame):
+                The key columns of the rows to score.
+            sensitive_data (pandas.DataFrame):
+                The sensitive columns of the rows to score.
+
+        Returns:
+            numpy.ndarray:
+                The frequency of the correct sensitive entry for each row.
+                It is ``0`` for the rows whose key is not in the data.
+        """
+        scores = super().score_batch(key_data, sensitive_data)
+        scores[np.isnan(scores)] = 0
+        return scores
+
 
 class CategoricalZeroCAP(CategoricalPrivacyMetric):
     """The Categorical 0CAP privacy metric. Scored based on the ZeroCAPAttacker."""
@@ -314,6 +386,56 @@ class GeneralizedCAPAttacker(CAPAttacker):
 
         return count_frequency(ref_sensitive_attributes, sensitive_data)
 
+    def score_batch(self, key_data, sensitive_data):
+        """Score every row of the given data based on the belief of the attacker.
+
+        The key columns are encoded as integer codes and the closest synthetic keys of
+        every distinct real row are searched in blocks, using a matrix of hamming distances.
+        The sensitive values of each synthetic key are precomputed as a sparse histogram, so
+        the score of a row is a reduction over the histograms of its closest keys.
+
+        Args:
+            key_data (pandas.DataFrame):
+                The key columns of the rows to score.
+            sensitive_data (pandas.DataFrame):
+                The sensitive columns of the rows to score.
+
+        Returns:
+            numpy.ndarray:
+                The frequency of the correct sensitive entry for each row.
+        """
+        real_keys, synthetic_keys = factorize_columns(key_data, self._synthetic_keys)
+        real_sensitive, synthetic_sensitive = factorize_rows(
+            sensitive_data, self._synthetic_sensitive
+        )
+        unique_keys, key_index = np.unique(synthetic_keys, axis=0, return_inverse=True)
+        key_index = key_index.reshape(-1)
+        num_sensitive = max(real_sensitive.max(initial=-1), synthetic_sensitive.max()) + 1
+        histograms = sparse.csc_matrix(
+            (np.ones(len(key_index)), (key_index, synthetic_sensitive)),
+            shape=(len(unique_keys), num_sensitive),
+        )
+        key_counts = np.bincount(key_index, minlength=len(unique_keys))
+
+        real_rows = np.column_stack([real_sensitive, real_keys])
+        unique_rows, row_index = np.unique(real_rows, axis=0, return_inverse=True)
+        row_index = row_index.reshape(-1)
+        block_size = max(1, HAMMING_BLOCK_SIZE // len(unique_keys))
+        scores = np.empty(len(unique_rows))
+        for start in range(0, len(unique_rows), block_size):
+            block = unique_rows[start : start + block_size]
+            closest = closest_neighbors_mask(unique_keys, block[:, 1:])
+            matches = np.zeros(len(block))
+            for sensitive in np.unique(block[:, 0]):
+                rows = block[:, 0] == sensitive
+                column = slice(histograms.indptr[sensitive], histograms.indptr[sensitive + 1])
+                keys = histograms.indices[column]
+                matches[rows] = closest[np.ix_(rows, keys)] @ histograms.data[column]
+
+            scores[start : start + block_size] = matches / (closest @ key_counts)
+
+        return scores[row_index]
+
 
 class CategoricalGeneralizedCAP(CategoricalPrivacyMetric):
     """The GeneralizedCAP privacy metric. Scored based on the ZeroCAPAttacker."""
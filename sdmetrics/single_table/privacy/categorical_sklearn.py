@@ -92,6 +92,38 @@ class CategoricalSklearnAttacker(PrivacyAttackerModel):
         sensitives = self.sensitive_processor.inverse_transform(sensitive_pred)
         return tuple(sensitives[0])
 
+    def predict_batch(self, key_data):
+        """Make a prediction of the sensitive data for every row of the given keys.
+
+        The keys are encoded and passed to the predictor all at once. The rows with
+        attributes that haven't appeared in the synthetic data are predicted as ``None``.
+
+        Args:
+            key_data (pandas.DataFrame):
+                The key columns of the rows to predict.
+
+        Returns:
+            list[tuple]:
+                The predicted sensitive data of each row.
+        """
+        keys = allow_nan(key_data.reset_index(drop=True))
+        is_known = np.ones(len(keys), dtype=bool)
+        for column, categories in zip(keys, self.key_processor.categories_):
+            is_known &= keys[column].isin(categories).to_numpy()
+
+        predictions = [None] * len(keys)
+        if not is_known.any():
+            return predictions
+
+        keys_transform = self.key_processor.transform(keys[is_known])
+        sensitive_pred = np.asarray(self.predictor.predict(keys_transform))
+        sensitive_pred = sensitive_pred.reshape(keys_transform.shape[0], -1)
+        sensitives = self.sensitive_processor.inverse_transform(sensitive_pred)
+        for row, sensitive_row in zip(np.flatnonzero(is_known), sensitives):
+            predictions[row] = tuple(sensitive_row)
+
+        return predictions
+
 
 class SVCWrapper:
     """A wrapper arround `sklearn.svm.SVC` to support multidimensional y."""
@@ -1,6 +1,8 @@
 """Disclosure protection metrics."""
 
-import warnings
+import numbers
+import os
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 import pandas as pd
@@ -14,13 +16,50 @@ from sdmetrics.single_table.privacy.cap import (
     CategoricalZeroCAP,
 )
 
-MAX_NUM_ROWS = 10000
-
 CAP_METHODS = {
     'CAP': CategoricalCAP,
     'ZERO_CAP': CategoricalZeroCAP,
     'GENERALIZED_CAP': CategoricalGeneralizedCAP,
 }
+CONFIDENCE_Z_SCORE = 1.96  # Two-sided 95% confidence interval
+MIN_TOLERANCE_ITERATIONS = 10  # Subsamples needed before the standard error can stop
+_WORKER_DATA = {}
+
+
+def _compute_subsample_cap_protection(
+    real_data,
+    synthetic_data,
+    known_column_names,
+    sensitive_column_names,
+    computation_method,
+    num_rows_subsample,
+    seed,
+):
+    random_state = np.random.RandomState(seed)
+    real_data_samp = real_data.sample(
+        min(num_rows_subsample, len(real_data)), random_state=random_state
+    )
+    synth_data_samp = synthetic_data.sample(
+        min(num_rows_subsample, len(synthetic_data)), random_state=random_state
+    )
+    cap_metric = CAP_METHODS.get(computation_method)
+    return cap_metric._compute(
+        real_data_samp,
+        synth_data_samp,
+        key_fields=known_column_names,
+        sensitive_fields=sensitive_column_names,
+    )
+
+
+def _initialize_worker(real_data, synthetic_data):
+    _WORKER_DATA['real_data'] = real_data
+    _WORKER_DATA['synthetic_data'] = synthetic_data
+
+
+def _compute_worker_cap_protection(*args):
+    return _compute_subsample_cap_protection(
+        _WORKER_DATA['real_data'], _WORKER_DATA['synthetic_data'], *args
+    )
 
 
 class DisclosureProtection(SingleTableMetric):
@@ -210,12 +249,6 @@ class DisclosureProtection(SingleTableMetric):
         )
 
         computation_method = computation_method.upper()
-        if len(real_data) > MAX_NUM_ROWS or len(synthetic_data) > MAX_NUM_ROWS:
-            warnings.warn(
-                f'Data exceeds {MAX_NUM_ROWS} rows, perfomance may be slow. '
-                'Consider using the `DisclosureProtectionEstimate` for faster computation.'
-            )
-
         real_data, synthetic_data = cls._discretize_and_fillna(
             real_data,
             synthetic_data,
@@ -314,6 +347,9 @@ class DisclosureProtectionEstimate(DisclosureProtection):
         num_discrete_bins,
         num_rows_subsample,
         num_iterations,
+        n_jobs=None,
+        random_state=None,
+        tolerance=None,
     ):
         super()._validate_inputs(
             real_data,
@@ -330,6 +366,44 @@ class DisclosureProtectionEstimate(DisclosureProtection):
         if not isinstance(num_iterations, int) or num_iterations <= 0:
             raise ValueError('`num_iterations` must be an integer greater than zero.')
 
+        if n_jobs is not None and (not isinstance(n_jobs, int) or (n_jobs <= 0 and n_jobs != -1)):
+            raise ValueError('`n_jobs` must be None, -1 or an integer greater than zero.')
+
+        if random_state is not None and (
+            not isinstance(random_state, numbers.Integral) or isinstance(random_state, bool)
+        ):
+            raise ValueError('`random_state` must be None or an integer.')
+
+        if tolerance is not None and (
+            not isinstance(tolerance, (int, float)) or isinstance(tolerance, bool) or tolerance <= 0
+        ):
+            raise ValueError('`tolerance` must be None or a number greater than zero.')
+
+    @classmethod
+    def _iterate_cap_protection(cls, real_data, synthetic_data, seeds, n_jobs, args):
+        """Yield the CAP protection of each subsample, in the order of the seeds."""
+        if n_jobs is None or n_jobs == 1:
+            for seed in seeds:
+                yield _compute_subsample_cap_protection(real_data, synthetic_data, *args, seed)
+
+            return
+
+        max_workers = os.cpu_count() if n_jobs == -1 else n_jobs
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_initialize_worker,
+            initargs=(real_data, synthetic_data),
+        ) as executor:
+            futures = [
+                executor.submit(_compute_worker_cap_protection, *args, seed) for seed in seeds
+            ]
+            try:
+                for future in futures:
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
     @classmethod
     def _compute_estimated_cap_metric(
         cls,
@@ -342,24 +416,36 @@ class DisclosureProtectionEstimate(DisclosureProtection):
         num_rows_subsample,
         num_iterations,
         verbose,
+        n_jobs=None,
+        random_state=None,
+        tolerance=None,
     ):
         estimation_iterator = tqdm.tqdm(range(num_iterations), disable=(not verbose))
         if verbose:
             description = 'Estimating Disclosure Protection (Score={score:.3f})'
             estimation_iterator.set_description(description.format(score=0))
 
-        cap_metric = CAP_METHODS.get(computation_method)
+        seeds = np.random.RandomState(random_state).randint(
+            np.iinfo(np.int32).max, size=num_iterations
+        )
+        cap_protections = cls._iterate_cap_protection(
+            real_data,
+            synthetic_data,
+            seeds,
+            n_jobs,
+            (
+                known_column_names,
+                sensitive_column_names,
+                computation_method,
+                num_rows_subsample,
+            ),
+        )
+        estimated_scores = []
         estimated_score_sum = 0
+        standard_error = np.nan
         for i in estimation_iterator:
-            real_data_samp = real_data.sample(min(num_rows_subsample, len(real_data)))
-            synth_data_samp = synthetic_data.sample(min(num_rows_subsample, len(synthetic_data)))
-
-            estimated_cap_protection = cap_metric._compute(
-                real_data_samp,
-                synth_data_samp,
-                key_fields=known_column_names,
-                sensitive_fields=sensitive_column_names,
-            )
+            estimated_cap_protection = next(cap_protections)
+            estimated_scores.append(estimated_cap_protection)
             estimated_score_sum += estimated_cap_protection
             average_computed_score = estimated_score_sum / (i + 1.0)
             if baseline_protection == 0:
@@ -370,7 +456,21 @@ class DisclosureProtectionEstimate(DisclosureProtection):
             if verbose:
                 estimation_iterator.set_description(description.format(score=average_score))
 
-        return average_score, average_computed_score
+            if i > 0:
+                standard_error = np.std(estimated_scores, ddof=1) / np.sqrt(i + 1.0)
+                min_iterations = min(num_iterations, MIN_TOLERANCE_ITERATIONS)
+                if tolerance is not None and i + 1 >= min_iterations and standard_error < tolerance:
+                    break
+
+        cap_protections.close()
+        estimation_iterator.close()
+        margin = CONFIDENCE_Z_SCORE * standard_error
+        confidence_interval = (
+            float(average_computed_score - margin),
+            float(average_computed_score + margin),
+        )
+
+        return average_score, average_computed_score, confidence_interval
 
     @classmethod
     def compute_breakdown(
@@ -385,6 +485,9 @@ class DisclosureProtectionEstimate(DisclosureProtection):
         num_rows_subsample=1000,
         num_iterations=10,
         verbose=True,
+        n_jobs=None,
+        random_state=None,
+        tolerance=None,
     ):
         """Compute this metric breakdown.
 
@@ -416,12 +519,25 @@ class DisclosureProtectionEstimate(DisclosureProtection):
                 The number of iterations to do for different subsample. Defaults to 10.
             verbose (bool, optional):
                 Whether to show the progress bar. Defaults to True.
+            n_jobs (int, optional):
+                The number of processes used to run the iterations in parallel. If ``None`` or
+                ``1``, the iterations run sequentially. If ``-1``, all the processors are used.
+                Defaults to None.
+            random_state (int, optional):
+                Seed used to draw the subsamples, so that the results are reproducible
+                regardless of ``n_jobs``. Defaults to None.
+            tolerance (float, optional):
+                If given, stop iterating as soon as the standard error of the estimated CAP
+                protection is lower than this value, after at least 10 iterations.
+                Defaults to None.
 
         Returns:
             dict
                 Mapping of the metric output with the keys:
                     - 'score': The overall score for the metric.
                     - 'cap_protection': The protection score from the selected computation method.
+                    - 'cap_protection_confidence_interval': The 95% confidence interval of the
+                      estimated protection score, as a ``(lower, upper)`` tuple.
                     - 'baseline_protection': The baseline protection for the columns.
         """
         cls._validate_inputs(
@@ -434,6 +550,9 @@ class DisclosureProtectionEstimate(DisclosureProtection):
             num_discrete_bins,
             num_rows_subsample,
             num_iterations,
+            n_jobs,
+            random_state,
+            tolerance,
         )
         computation_method = computation_method.upper()
         real_data, synthetic_data = cls._discretize_and_fillna(
@@ -449,21 +568,27 @@ class DisclosureProtectionEstimate(DisclosureProtection):
         baseline_protection = cls._compute_baseline(real_data, sensitive_column_names)
 
         # Compute estimated CAP metric
-        average_score, average_computed_score = cls._compute_estimated_cap_metric(
-            real_data,
-            synthetic_data,
-            baseline_protection=baseline_protection,
-            known_column_names=known_column_names,
-            sensitive_column_names=sensitive_column_names,
-            computation_method=computation_method,
-            num_rows_subsample=num_rows_subsample,
-            num_iterations=num_iterations,
-            verbose=verbose,
+        average_score, average_computed_score, confidence_interval = (
+            cls._compute_estimated_cap_metric(
+                real_data,
+                synthetic_data,
+                baseline_protection=baseline_protection,
+                known_column_names=known_column_names,
+                sensitive_column_names=sensitive_column_names,
+                computation_method=computation_method,
+                num_rows_subsample=num_rows_subsample,
+                num_iterations=num_iterations,
+                verbose=verbose,
+                n_jobs=n_jobs,
+                random_state=random_state,
+                tolerance=tolerance,
+            )
         )
 
         return {
             'score': average_score,
             'cap_protection': average_computed_score,
+            'cap_protection_confidence_interval': confidence_interval,
             'baseline_protection': baseline_protection,
         }
 
@@ -480,6 +605,9 @@ class DisclosureProtectionEstimate(DisclosureProtection):
         num_rows_subsample=1000,
         num_iterations=10,
         verbose=True,
+        n_jobs=None,
+        random_state=None,
+        tolerance=None,
     ):
         """Compute the DisclosureProtectionEstimate metric.
 
@@ -511,6 +639,17 @@ class DisclosureProtectionEstimate(DisclosureProtection):
                 The number of iterations to do for different subsample. Defaults to 10.
             verbose (bool, optional):
                 Whether to show the progress bar. Defaults to True.
+            n_jobs (int, optional):
+                The number of processes used to run the iterations in parallel. If ``None`` or
+                ``1``, the iterations run sequentially. If ``-1``, all the processors are used.
+                Defaults to None.
+            random_state (int, optional):
+                Seed used to draw the subsamples, so that the results are reproducible
+                regardless of ``n_jobs``. Defaults to None.
+            tolerance (float, optional):
+                If given, stop iterating as soon as the standard error of the estimated CAP
+                protection is lower than this value, after at least 10 iterations.
+                Defaults to None.
 
         Returns:
             float:
@@ -524,5 +663,11 @@ class DisclosureProtectionEstimate(DisclosureProtection):
             computation_method,
             continuous_column_names,
             num_discrete_bins,
+            num_rows_subsample,
+            num_iterations,
+            verbose,
+            n_jobs,
+            random_state,
+            tolerance,
         )
         return score_breakdown['score']
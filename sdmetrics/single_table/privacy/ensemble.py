@@ -1,7 +1,10 @@
 """CategoricalEnsemble module and its attacker."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 from sdmetrics.single_table.privacy.base import CategoricalPrivacyMetric, PrivacyAttackerModel
-from sdmetrics.single_table.privacy.util import majority
+from sdmetrics.single_table.privacy.util import majority, majority_batch
 
 
 class CategoricalEnsembleAttacker(PrivacyAttackerModel):
@@ -9,10 +12,21 @@ class CategoricalEnsembleAttacker(PrivacyAttackerModel):
 
     It will predict the majority of the specified sub-attackers's predicions, and the privacy
     score will be calculated based on the accuracy of its prediction.
+
+    Args:
+        attackers (list[Class]):
+            The sub-attacker classes to use.
+        n_jobs (int):
+            The number of threads used to fit the sub-attackers. If ``None`` or ``1``, they are
+            fitted sequentially. If ``-1``, all the processors are used. Defaults to ``None``.
     """
 
-    def __init__(self, attackers=[]):
+    def __init__(self, attackers=[], n_jobs=None):
+        if n_jobs is not None and (not isinstance(n_jobs, int) or (n_jobs <= 0 and n_jobs != -1)):
+            raise ValueError('`n_jobs` must be None, -1 or an integer greater than zero.')
+
         self.attackers = [attacker() for attacker in attackers]
+        self.n_jobs = n_jobs
 
     def fit(self, synthetic_data, key_fields, sensitive_fields):
         """Fit the CategoricalEnsembleAttacker on the synthetic data.
@@ -25,8 +39,20 @@ class CategoricalEnsembleAttacker(PrivacyAttackerModel):
             sensitive_fields(list[str]):
                 The names of the sensitive columns.
         """
-        for attacker in self.attackers:
-            attacker.fit(synthetic_data, key_fields, sensitive_fields)
+        if self.n_jobs is None or self.n_jobs == 1:
+            for attacker in self.attackers:
+                attacker.fit(synthetic_data, key_fields, sensitive_fields)
+
+            return
+
+        max_workers = os.cpu_count() if self.n_jobs == -1 else self.n_jobs
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(attacker.fit, synthetic_data, key_fields, sensitive_fields)
+                for attacker in self.attackers
+            ]
+            for future in futures:
+                future.result()
 
     def predict(self, key_data):
         """Make a prediction of the sensitive data given keys.
@@ -42,6 +68,26 @@ class CategoricalEnsembleAttacker(PrivacyAttackerModel):
         predictions = [attacker.predict(key_data) for attacker in self.attackers]
         return majority(predictions)
 
+    def predict_batch(self, key_data):
+        """Make a prediction of the sensitive data for every row of the given keys.
+
+        Every sub-attacker predicts all the rows at once, and then the majority vote
+        is computed for all the rows together.
+
+        Args:
+            key_data (pandas.DataFrame):
+                The key columns of the rows to predict.
+
+        Returns:
+            list[tuple]:
+                The predicted sensitive data of each row.
+        """
+        predictions = [attacker.predict_batch(key_data) for attacker in self.attackers]
+        if not predictions:
+            return [None] * len(key_data)
+
+        return majority_batch(predictions)
+
 
 class CategoricalEnsemble(CategoricalPrivacyMetric):
     """The Categorical Ensemble privacy metric. Scored based on the CategoricalEnsembleAttacker.
@@ -1,9 +1,126 @@
 """Utilities for the single_table.privacy modules."""
 
+import hashlib
+import threading
+from collections import OrderedDict
+
 import numpy as np
 from copulas.univariate.base import Univariate
 
 
+def _fingerprint(values):
+    """Get a fingerprint of the values of a numerical column."""
+    values = np.ascontiguousarray(values, dtype=float)
+    return hashlib.blake2b(values.tobytes(), digest_size=16).hexdigest()
+
+
+class CDFCache:
+    """Least recently used cache of fitted CDFs and of the CDF values of real columns.
+
+    The loss functions that share a cache fit and evaluate the CDF of each real column
+    only once. The cache is bounded by the number of bytes of the CDF values it keeps and
+    it can be used from several threads.
+
+    Args:
+        max_bytes (int):
+            The maximum number of bytes of CDF values to keep. Defaults to 64 MiB.
+        max_cdfs (int):
+            The maximum number of fitted CDFs to keep. Defaults to 64.
+    """
+
+    def __init__(self, max_bytes=64 * 2**20, max_cdfs=64):
+        self.max_bytes = max_bytes
+        self.max_cdfs = max_cdfs
+        self.num_bytes = 0
+        self._cdfs = OrderedDict()
+        self._columns = OrderedDict()
+        self._lock = threading.Lock()
+
+    def clear(self):
+        """Drop all the cached CDFs and CDF values."""
+        with self._lock:
+            self._cdfs.clear()
+            self._columns.clear()
+            self.num_bytes = 0
+
+    def _lookup(self, cache, key):
+        with self._lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+
+        return None
+
+    def get_cdf(self, fingerprint, fit):
+        """Get the CDF fitted to a column, fitting it if it is not cached.
+
+        Args:
+            fingerprint (str):
+                The fingerprint of the column.
+            fit (callable):
+                Function that fits the CDF.
+
+        Returns:
+            copulas.univariate.Univariate:
+                The fitted CDF.
+        """
+        dist_model = self._lookup(self._cdfs, fingerprint)
+        if dist_model is None:
+            dist_model = fit()
+            with self._lock:
+                self._cdfs[fingerprint] = dist_model
+                while len(self._cdfs) > self.max_cdfs:
+                    self._cdfs.popitem(last=False)
+
+        return dist_model
+
+    def get_column(self, key, compute):
+        """Get the CDF values of a column, computing them if they are not cached.
+
+        Args:
+            key (tuple):
+                The fingerprints of the CDF and of the column.
+            compute (callable):
+                Function that computes the read-only CDF values.
+
+        Returns:
+            numpy.ndarray:
+                The CDF values.
+        """
+        percentiles = self._lookup(self._columns, key)
+        if percentiles is None:
+            percentiles = compute()
+            with self._lock:
+                if key not in self._columns and percentiles.nbytes <= self.max_bytes:
+                    self._columns[key] = percentiles
+                    self.num_bytes += percentiles.nbytes
+                    while self.num_bytes > self.max_bytes:
+                        _, dropped = self._columns.popitem(last=False)
+                        self.num_bytes -= dropped.nbytes
+
+        return percentiles
+
+
+CDF_CACHE = CDFCache()
+
+
+def clear_cdf_cache():
+    """Drop the CDFs and CDF values cached by the numerical privacy metrics."""
+    CDF_CACHE.clear()
+
+
+def _fit_univariate(values):
+    dist_model = Univariate()
+    dist_model.fit(values)
+    return dist_model
+
+
+def _compute_cdf(dist_model, values):
+    percentiles = dist_model.cdf(values)
+    percentiles.flags.writeable = False
+    return percentiles
+
+
 class LossFunction:
     """Base class for a loss function."""
 
@@ -28,6 +145,30 @@ class LossFunction:
         """
         raise NotImplementedError('Please implement the loss measuring algorithm!')
 
+    def measure_batch(self, pred, real):
+        """Calculate the loss of every prediction.
+
+        By default this calls ``measure`` once per row. Loss functions that can measure
+        all the rows at once should override it.
+
+        Args:
+            pred (numpy.ndarray):
+                The predicted values, with one row per prediction.
+            real (numpy.ndarray):
+                The actual values, with one row per prediction.
+
+        Returns:
+            numpy.ndarray:
+                The loss of each prediction.
+        """
+        return np.array(
+            [
+                self.measure(tuple(pred_row), tuple(real_row))
+                for pred_row, real_row in zip(pred, real)
+            ],
+            dtype=float,
+        )
+
 
 class InverseCDFDistance(LossFunction):
     """Measure the distance between continuous key fields.
@@ -39,15 +180,23 @@ class InverseCDFDistance(LossFunction):
     Args:
         p (float):
             The p parameter in L_p metric. Must be positive.
+        cache (CDFCache or None):
+            Cache of the fitted CDFs and of the CDF values of the real columns. Defaults
+            to None, which uses the cache shared by all the loss functions, ``CDF_CACHE``.
     """
 
-    def __init__(self, p=2):
+    def __init__(self, p=2, cache=None):
         self.p = p
+        self.cache = CDF_CACHE if cache is None else cache
         self.cdfs = []
+        self._cdf_fingerprints = []
 
     def fit(self, data, cols):
         """Fits univariate distributions (automatically selected).
 
+        The fitted distributions are cached by a fingerprint of the column data, so fitting
+        on the same column again (for example from another metric) reuses them.
+
         Args:
             data (DataFrame):
                 Data, where each column in `cols` is a continuous column.
@@ -56,9 +205,39 @@ class InverseCDFDistance(LossFunction):
         """
         for col in cols:
             col_data = np.array(data[col])
-            dist_model = Univariate()
-            dist_model.fit(col_data)
+            fingerprint = _fingerprint(col_data)
+            dist_model = self.cache.get_cdf(fingerprint, lambda: _fit_univariate(col_data))
             self.cdfs.append(dist_model)
+            self._cdf_fingerprints.append(fingerprint)
+
+    def transform(self, data, cache=True):
+        """Map the values of each fitted column to their CDF values.
+
+        When ``cache`` is True, the CDF values of each column are cached, so transforming
+        the same column with the same fitted distribution again does not evaluate the CDF.
+
+        Args:
+            data (numpy.ndarray):
+                Two dimensional array with one column for each column specified in fit.
+            cache (bool):
+                Whether to cache the CDF values. Should be False for values that are only
+                transformed once, such as predictions. Defaults to True.
+
+        Returns:
+            numpy.ndarray:
+                The CDF value of each entry, with the same shape as ``data``.
+        """
+        data = np.asarray(data, dtype=float).reshape(-1, len(self.cdfs))
+        percentiles = np.empty_like(data)
+        for idx, (cdf, cdf_fingerprint) in enumerate(zip(self.cdfs, self._cdf_fingerprints)):
+            values = data[:, idx]
+            if cache:
+                key = (cdf_fingerprint, _fingerprint(values))
+                percentiles[:, idx] = self.cache.get_column(key, lambda: _compute_cdf(cdf, values))
+            else:
+                percentiles[:, idx] = cdf.cdf(values)
+
+        return percentiles
 
     def measure(self, pred, real):
         """Compute the distance (L_p norm) between the pred and real values.
@@ -85,3 +264,24 @@ class InverseCDFDistance(LossFunction):
             dist += abs(percentiles[0] - percentiles[1]) ** self.p
 
         return dist
+
+    def measure_batch(self, pred, real):
+        """Compute the distance (L_p norm) between every pair of pred and real values.
+
+        Args:
+            pred (numpy.ndarray):
+                Predicted values, with one column for each column specified in fit.
+            real (numpy.ndarray):
+                Real values, with one column for each column specified in fit.
+
+        Returns:
+            numpy.ndarray:
+                The L_p norm of the CDF values of each row.
+        """
+        pred_percentiles = self.transform(pred, cache=False)
+        differences = np.abs(pred_percentiles - self.transform(real)) ** self.p
+        dist = np.zeros(len(differences))
+        for idx in range(differences.shape[1]):
+            dist += differences[:, idx]
+
+        return dist
@@ -58,6 +58,20 @@ class NumericalSklearnAttacker(PrivacyAttackerModel):
 
         return tuple(sensitive_pred[0])
 
+    def predict_batch(self, key_data):
+        """Make a prediction of the sensitive data for every row of the given keys.
+
+        Args:
+            key_data (pandas.DataFrame):
+                The key columns of the rows to predict.
+
+        Returns:
+            numpy.ndarray:
+                The predicted sensitive data, with one row per key.
+        """
+        sensitive_pred = np.asarray(self.predictor.predict(np.array(key_data)))
+        return sensitive_pred.reshape(len(key_data), -1)
+
 
 class SVRWrapper:
     """A wrapper arround `sklearn.svm.SVR` to support multidimensional y."""
@@ -1,10 +1,14 @@
 """RadiusNearestNeighbor module and its attacker/utilities."""
 
 import numpy as np
+import pandas as pd
+from sklearn.neighbors import KDTree
 
 from sdmetrics.single_table.privacy.base import NumericalPrivacyMetric, PrivacyAttackerModel
 from sdmetrics.single_table.privacy.loss import InverseCDFDistance
 
+NEIGHBOR_BLOCK_SIZE = 2**22
+
 
 class NumericalRadiusNearestNeighborAttacker(PrivacyAttackerModel):
     """The Radius Nearest Neighbor Attacker.
@@ -29,10 +33,16 @@ class NumericalRadiusNearestNeighborAttacker(PrivacyAttackerModel):
         self.key = None
         self.sensitive_fields = None
         self.key_fields = None
+        self._tree = None
+        self._synthetic_sensitive = None
 
     def fit(self, synthetic_data, key_fields, sensitive_fields):
         """Fit the NumericalRadiusNearestNeighborAttacker on the synthetic data.
 
+        If the weight function is an ``InverseCDFCutoff``, the synthetic keys are mapped
+        to their CDF values once and indexed in a KD-tree, so that the neighbors of
+        each key can be found with a single radius query.
+
         Args:
             synthetic_data(pandas.DataFrame):
                 The synthetic data table used for adverserial learning.
@@ -45,6 +55,76 @@ class NumericalRadiusNearestNeighborAttacker(PrivacyAttackerModel):
         self.synthetic_data = synthetic_data
         self.key_fields = key_fields
         self.sensitive_fields = sensitive_fields
+        self._tree = None
+        if isinstance(self.weight_func, InverseCDFCutoff) and self.weight_func.p >= 1:
+            percentiles = self.weight_func.transform(synthetic_data[key_fields])
+            is_valid = ~np.isnan(percentiles).any(axis=1)
+            self._tree = KDTree(percentiles[is_valid], metric='minkowski', p=self.weight_func.p)
+            sensitive_data = synthetic_data[sensitive_fields].to_numpy(dtype=float)
+            self._synthetic_sensitive = sensitive_data[is_valid]
+
+    def _predict_neighbors(self, key_data):
+        """Average the sensitive values of the synthetic rows within the cutoff of each key."""
+        percentiles = self.weight_func.transform(key_data)
+        predictions = np.zeros((len(percentiles), len(self.sensitive_fields)))
+        num_synthetic_rows = self._tree.data.shape[0]
+        if num_synthetic_rows == 0:
+            return predictions
+
+        # The tree uses the p-norm, so its radius is slightly widened and the exact
+        # distance of each candidate is compared against the cutoff afterwards.
+        radius = self.weight_func.cutoff ** (1 / self.weight_func.p)
+        radius = radius * (1 + 1e-9) + 1e-12
+        synthetic_percentiles = np.asarray(self._tree.data)
+        block_size = max(1, NEIGHBOR_BLOCK_SIZE // num_synthetic_rows)
+        for start in range(0, len(percentiles), block_size):
+            block = percentiles[start : start + block_size]
+            is_valid = ~np.isnan(block).any(axis=1)
+            if not is_valid.any():
+                continue
+
+            neighbors = self._tree.query_radius(block[is_valid], radius)
+            counts = np.array([len(indices) for indices in neighbors], dtype=int)
+            rows = np.repeat(np.flatnonzero(is_valid), counts)
+            if len(rows) == 0:
+                continue
+
+            indices = np.concatenate(neighbors)
+            distances = np.zeros(len(rows))
+            for column in range(percentiles.shape[1]):
+                differences = block[rows, column] - synthetic_percentiles[indices, column]
+                distances += np.abs(differences) ** self.weight_func.p
+
+            is_neighbor = distances < self.weight_func.cutoff
+            rows = rows[is_neighbor]
+            indices = indices[is_neighbor]
+            weights = np.bincount(rows, minlength=len(block))
+            has_neighbors = weights > 0
+            for column in range(len(self.sensitive_fields)):
+                sums = np.bincount(
+                    rows, weights=self._synthetic_sensitive[indices, column], minlength=len(block)
+                )
+                predictions[start : start + len(block), column][has_neighbors] = (
+                    sums[has_neighbors] / weights[has_neighbors]
+                )
+
+        return predictions
+
+    def predict_batch(self, key_data):
+        """Make a prediction of the sensitive data for every row of the given keys.
+
+        Args:
+            key_data (pandas.DataFrame):
+                The key columns of the rows to predict.
+
+        Returns:
+            numpy.ndarray:
+                The predicted sensitive data, with one row per key.
+        """
+        if self._tree is None:
+            return np.array(super().predict_batch(key_data), dtype=float)
+
+        return self._predict_neighbors(key_data)
 
     def predict(self, key_data):
         """Make a prediction of the sensitive data given keys.
@@ -57,19 +137,19 @@ class NumericalRadiusNearestNeighborAttacker(PrivacyAttackerModel):
             tuple:
                 The predicted sensitive data.
         """
+        if self._tree is not None:
+            key_data = pd.DataFrame([key_data], columns=self.key_fields)
+            return tuple(self._predict_neighbors(key_data)[0])
+
         weights = 0
-        summ = None
-        modified = False
-        for idx in range(len(self.synthetic_data)):
-            ref_key = tuple(self.synthetic_data[self.key_fields].iloc[idx])
-            sensitive_data = np.array(self.synthetic_data[self.sensitive_fields].iloc[idx])
+        summ = np.zeros(len(self.sensitive_fields))
+        for ref_key, sensitive_data in zip(
+            self.synthetic_data[self.key_fields].itertuples(index=False, name=None),
+            self.synthetic_data[self.sensitive_fields].to_numpy(dtype=float),
+        ):
             weight = self.weight_func.measure(key_data, ref_key)
             weights += weight
-            if not modified:
-                summ = sensitive_data.copy()
-                modified = True
-            else:
-                summ += sensitive_data
+            summ += weight * sensitive_data
 
         if weights == 0:
             return (0,) * len(self.sensitive_fields)
@@ -85,9 +165,8 @@ class InverseCDFCutoff(InverseCDFDistance):
     Then weight = 1 if and only if (sum |c_i(ki) - c_i(ki')|**p) / n <= cutoff**p.
     """
 
-    def __init__(self, p=2, cutoff=0.1):
-        self.p = p
-        self.cdfs = []
+    def __init__(self, p=2, cutoff=0.1, cache=None):
+        super().__init__(p, cache=cache)
         self.cutoff = cutoff**p
 
     def fit(self, data, cols):
@@ -122,6 +201,22 @@ class InverseCDFCutoff(InverseCDFDistance):
         dist = InverseCDFDistance.measure(self, pred, real)
         return 1 if dist < self.cutoff else 0
 
+    def measure_batch(self, pred, real):
+        """Compute the weight between every pair of pred and real values.
+
+        Args:
+            pred (numpy.ndarray):
+                Predicted values, with one column for each column specified in fit.
+            real (numpy.ndarray):
+                Real values, with one column for each column specified in fit.
+
+        Returns:
+            numpy.ndarray:
+                1 for the rows whose distance is below the cutoff and 0 otherwise.
+        """
+        dist = InverseCDFDistance.measure_batch(self, pred, real)
+        return (dist < self.cutoff).astype(int)
+
 
 class NumericalRadiusNearestNeighbor(NumericalPrivacyMetric):
     """The Radius Nearest Neighbor privacy metric.
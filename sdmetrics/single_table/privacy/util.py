@@ -1,6 +1,7 @@
 """Utils for the single_table.privacy modules."""
 
 import numpy as np
+import pandas as pd
 
 
 def majority(samples, ignore_none=True):
@@ -34,6 +35,44 @@ def majority(samples, ignore_none=True):
     return most_freq_ele
 
 
+def majority_batch(predictions):
+    """Find the most frequent element of every row of predictions.
+
+    This gives the same result as calling ``majority`` on each row, ignoring ``None``. If
+    several elements are tied, the one that reached the highest frequency first wins.
+
+    Arguments:
+        predictions (list[list]):
+            One list of predictions per predictor, with one hashable element per row.
+
+    Returns:
+        list:
+            The most frequent element of each row, or ``None`` if all of them are ``None``.
+    """
+    num_predictors = len(predictions)
+    if num_predictors == 0:
+        return []
+
+    num_rows = len(predictions[0])
+    values = np.empty(num_rows * num_predictors, dtype=object)
+    for idx, predictor_predictions in enumerate(predictions):
+        values[idx::num_predictors] = pd.Series(predictor_predictions, dtype=object).to_numpy()
+
+    codes, uniques = pd.factorize(values)
+    codes = codes.reshape(num_rows, num_predictors)
+    is_equal = codes[:, :, None] == codes[:, None, :]
+    counts = is_equal.sum(axis=2)
+    last_positions = num_predictors - 1 - np.argmax(is_equal[:, :, ::-1], axis=2)
+
+    # An element wins when it has the highest count and, among those, reached it first.
+    priority = counts * num_predictors + (num_predictors - 1 - last_positions)
+    priority[codes < 0] = -1
+    winners = np.argmax(priority, axis=1)
+    winner_codes = codes[np.arange(num_rows), winners]
+
+    return [None if code < 0 else uniques[code] for code in winner_codes]
+
+
 def count_frequency(samples, target):
     """Calculate how frequent an target attribute appear in a list.
 
@@ -108,6 +147,81 @@ def closest_neighbors(samples, target):
     return ret
 
 
+def _factorize_column(column):
+    """Encode a column as integer codes, giving missing values their own code."""
+    codes, uniques = pd.factorize(column)
+    codes[codes == -1] = len(uniques)
+    return codes
+
+
+def factorize_columns(*data):
+    """Encode the columns of several dataframes as integer codes shared across all of them.
+
+    Equal values of a column get the same code in every dataframe. Missing values are
+    treated as equal to each other.
+
+    Arguments:
+        *data (pandas.DataFrame):
+            The dataframes to encode. They must all have the same columns.
+
+    Returns:
+        list[numpy.ndarray]:
+            A 2D array with the codes of each dataframe, with one column per dataframe column.
+    """
+    combined = pd.concat([df.reset_index(drop=True) for df in data], ignore_index=True)
+    codes = np.empty((len(combined), len(combined.columns)), dtype=np.int64)
+    for idx, column in enumerate(combined.columns):
+        codes[:, idx] = _factorize_column(combined[column])
+
+    split_points = np.cumsum([len(df) for df in data])[:-1]
+    return np.split(codes, split_points)
+
+
+def factorize_rows(*data):
+    """Encode the rows of several dataframes as integer codes shared across all of them.
+
+    Two rows get the same code if they are equal column by column. Missing values
+    are treated as equal to each other.
+
+    Arguments:
+        *data (pandas.DataFrame):
+            The dataframes to encode. They must all have the same columns.
+
+    Returns:
+        list[numpy.ndarray]:
+            The row codes of each dataframe.
+    """
+    codes = pd.DataFrame(np.concatenate(factorize_columns(*data)))
+    row_codes = codes.groupby(list(codes.columns), sort=False).ngroup().to_numpy()
+    split_points = np.cumsum([len(df) for df in data])[:-1]
+    return np.split(row_codes, split_points)
+
+
+def closest_neighbors_mask(samples, targets):
+    """Find the samples that are closest to each target in hamming distance.
+
+    This is the vectorized version of ``closest_neighbors`` for integer coded data.
+
+    Arguments:
+        samples (numpy.ndarray):
+            A 2D array with one sample per row.
+        targets (numpy.ndarray):
+            A 2D array with one target per row. Must have as many columns as samples.
+
+    Returns:
+        numpy.ndarray:
+            A boolean matrix with one row per target and one column per sample, which is
+            ``True`` for the samples that are closest to the target.
+    """
+    sample_columns = np.ascontiguousarray(samples.T)
+    dtype = np.min_scalar_type(len(sample_columns))
+    distances = np.zeros((len(targets), len(samples)), dtype=dtype)
+    for column, sample_column in enumerate(sample_columns):
+        distances += targets[:, [column]] != sample_column
+
+    return distances == distances.min(axis=1, keepdims=True)
+
+
 def allow_nan(df):
     """Replace all invalid (`nan` and `None`) entries in a dataframe with valid placeholders.
 
@@ -120,11 +234,10 @@ def allow_nan(df):
             A modified dataframe.
     """
     df_copy = df.copy()
-    for i in df_copy:
-        for j in range(len(df_copy[i])):
-            entry = df_copy[i][j]
-            if (isinstance(entry, float) and np.isnan(entry)) or entry is None:
-                df_copy[i][j] = 'place_holder_for_nan'
+    for column in df_copy:
+        is_nan = df_copy[column].isna()
+        if is_nan.any():
+            df_copy[column] = df_copy[column].astype(object).where(~is_nan, 'place_holder_for_nan')
 
     return df_copy
 
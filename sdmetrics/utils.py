@@ -1,6 +1,6 @@
 """SDMetrics utils to be used across all the project."""
 
-from collections import Counter
+import threading
 from datetime import datetime
 
 import numpy as np
@@ -41,6 +41,69 @@ def nested_attrs_meta(nested):
     return Metaclass
 
 
+def _factorize_values(real, synthetic):
+    """Integer-code real and synthetic values together, in the order they first appear.
+
+    The rows of a ``pandas.DataFrame`` are coded as tuples of the values of its columns.
+    Missing values are coded as a value of their own.
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray, int]:
+            The real codes, the synthetic codes and the number of codes.
+    """
+    if isinstance(real, pd.DataFrame):
+        codes = np.zeros(len(real) + len(synthetic), dtype=np.int64)
+        for column in real.columns:
+            values = pd.concat([real[column], synthetic[column]], ignore_index=True)
+            column_codes, uniques = pd.factorize(values, use_na_sentinel=False)
+            codes, _ = pd.factorize(codes * len(uniques) + column_codes)
+
+        num_codes = codes.max() + 1 if len(codes) else 0
+    else:
+        real, synthetic = (
+            values if isinstance(values, (pd.Series, np.ndarray)) else list(values)
+            for values in (real, synthetic)
+        )
+        values = pd.concat([pd.Series(real), pd.Series(synthetic)], ignore_index=True)
+        codes, uniques = pd.factorize(values, use_na_sentinel=False)
+        num_codes = len(uniques)
+
+    return codes[: len(real)], codes[len(real) :], num_codes
+
+
+def get_frequency_arrays(real, synthetic):
+    """Get the observed and expected frequencies of every value, in linear time.
+
+    The values are integer-coded and counted with ``numpy.bincount``. The frequencies are
+    exactly the ones of ``get_frequencies``, in the same order: the real values in the order
+    they first appear, followed by the values that are only in the synthetic data.
+
+    Args:
+        real (pandas.Series, pandas.DataFrame, numpy.ndarray or list):
+            The real values, or the real rows of a table.
+        synthetic (pandas.Series, pandas.DataFrame, numpy.ndarray or list):
+            The synthetic values, or the synthetic rows of a table.
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray]:
+            The observed and expected frequencies (as a percent).
+    """
+    real_codes, synthetic_codes, num_codes = _factorize_values(real, synthetic)
+    real_counts = np.bincount(real_codes, minlength=num_codes)
+    synthetic_counts = np.bincount(synthetic_codes, minlength=num_codes)
+    if num_codes and not len(synthetic_codes):
+        raise ZeroDivisionError('division by zero')
+
+    # The codes of the values that are only in the synthetic data come after the real ones.
+    # Their regularization term is added one at a time, so the total is exactly the same.
+    num_synthetic_only = num_codes - (real_codes.max() + 1 if len(real_codes) else 0)
+    regularization = np.full(num_synthetic_only, 1e-6)  # Regularization to prevent NaN.
+    real_total = np.cumsum(np.concatenate([[float(len(real_codes))], regularization]))[-1]
+    real_counts = np.concatenate([real_counts[: num_codes - num_synthetic_only], regularization])
+
+    return synthetic_counts / len(synthetic_codes), real_counts / real_total
+
+
 def get_frequencies(real, synthetic):
     """Get percentual frequencies for each possible real categorical value.
 
@@ -59,17 +122,8 @@ def get_frequencies(real, synthetic):
         tuble[list, list]:
             The observed and expected frequencies (as a percent).
     """
-    f_obs, f_exp = [], []
-    real, synthetic = Counter(real), Counter(synthetic)
-    for value in synthetic:
-        if value not in real:
-            real[value] += 1e-6  # Regularization to prevent NaN.
-
-    for value in real:
-        f_obs.append(synthetic[value] / sum(synthetic.values()))  # noqa: PD011
-        f_exp.append(real[value] / sum(real.values()))  # noqa: PD011
-
-    return f_obs, f_exp
+    f_obs, f_exp = get_frequency_arrays(real, synthetic)
+    return f_obs.tolist(), f_exp.tolist()
 
 
 def get_missing_percentage(data_column):
@@ -248,6 +302,449 @@ class HyperTransformer:
         return self.transform(data)
 
 
+class QuantileSketch:
+    """Mergeable summary of the distribution of a numerical column with a bounded rank error.
+
+    The values are kept in levels where each value of level ``h`` stands for ``2 ** h``
+    values. When a level holds more than ``size`` values, they are sorted and every other
+    value is moved to the next level. Each of these compactions changes the rank of any
+    value by at most the weight of the compacted level, so the sum of those weights is a
+    guaranteed bound of the rank error of the sketch.
+
+    Args:
+        size (int):
+            The number of values that a level can hold before being compacted.
+            Defaults to 1024.
+    """
+
+    def __init__(self, size=1024):
+        self.size = size
+        self.count = 0
+        self.max_rank_error = 0
+        self._levels = []
+        self._offsets = []
+
+    def _compact(self):
+        level = 0
+        while level < len(self._levels):
+            values = self._levels[level]
+            if len(values) > self.size:
+                values = np.sort(values)
+                remainder = values[len(values) - len(values) % 2 :]
+                values = values[: len(values) - len(values) % 2]
+                offset = self._offsets[level]
+                self._offsets[level] = 1 - offset
+                if level + 1 == len(self._levels):
+                    self._levels.append(np.empty(0))
+                    self._offsets.append(0)
+
+                self._levels[level + 1] = np.concatenate([
+                    self._levels[level + 1],
+                    values[offset::2],
+                ])
+                self._levels[level] = remainder
+                self.max_rank_error += 2**level
+
+            level += 1
+
+    def update(self, values):
+        """Add values to the sketch. Missing values are ignored.
+
+        Args:
+            values (numpy.ndarray or pandas.Series):
+                The numerical values to add.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return
+
+        if not self._levels:
+            self._levels.append(np.empty(0))
+            self._offsets.append(0)
+
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self.count += len(values)
+        self._compact()
+
+    def merge(self, other):
+        """Add the values summarized by another sketch to this sketch.
+
+        Args:
+            other (QuantileSketch):
+                The sketch to merge into this one.
+        """
+        for level, values in enumerate(other._levels):
+            if level == len(self._levels):
+                self._levels.append(np.empty(0))
+                self._offsets.append(0)
+
+            self._levels[level] = np.concatenate([self._levels[level], values])
+
+        self.count += other.count
+        self.max_rank_error += other.max_rank_error
+        self._compact()
+
+    def to_dict(self):
+        """Get the sketch as a dictionary that can be saved as JSON.
+
+        Returns:
+            dict:
+                The size, count, rank error and levels of the sketch.
+        """
+        return {
+            'size': self.size,
+            'count': self.count,
+            'max_rank_error': self.max_rank_error,
+            'levels': [level_values.tolist() for level_values in self._levels],
+            'offsets': list(self._offsets),
+        }
+
+    @classmethod
+    def from_dict(cls, sketch_dict):
+        """Load a sketch from the dictionary given by ``to_dict``.
+
+        Args:
+            sketch_dict (dict):
+                The dictionary of the sketch.
+
+        Returns:
+            QuantileSketch:
+                The sketch.
+        """
+        sketch = cls(sketch_dict['size'])
+        sketch.count = sketch_dict['count']
+        sketch.max_rank_error = sketch_dict['max_rank_error']
+        sketch._levels = [
+            np.array(level_values, dtype=np.float64) for level_values in sketch_dict['levels']
+        ]
+        sketch._offsets = list(sketch_dict['offsets'])
+        return sketch
+
+    def _get_weighted_values(self):
+        values = np.concatenate(self._levels) if self._levels else np.empty(0)
+        weights = np.concatenate(
+            [
+                np.full(len(level_values), 2.0**level)
+                for level, level_values in enumerate(self._levels)
+            ]
+            or [np.empty(0)]
+        )
+        order = np.argsort(values, kind='stable')
+        return values[order], np.cumsum(weights[order])
+
+    def cdf(self, values):
+        """Estimate the fraction of the summarized values that are lower or equal to the values.
+
+        Args:
+            values (numpy.ndarray):
+                The values to evaluate the empirical CDF at.
+
+        Returns:
+            numpy.ndarray:
+                The estimated empirical CDF, within ``rank_error`` of the exact one.
+        """
+        sorted_values, cumulative_weights = self._get_weighted_values()
+        positions = np.searchsorted(sorted_values, values, side='right')
+        cumulative_weights = np.concatenate([[0.0], cumulative_weights])
+        return cumulative_weights[positions] / self.count
+
+    @property
+    def rank_error(self):
+        """float: The bound of the error of the CDF, as a fraction of the number of values."""
+        return self.max_rank_error / self.count if self.count else 0.0
+
+    def ks_statistic(self, other):
+        """Estimate the Kolmogorov-Smirnov statistic between the values of two sketches.
+
+        Args:
+            other (QuantileSketch):
+                The sketch to compare with.
+
+        Returns:
+            tuple[float, float]:
+                The estimated statistic and the bound of its error.
+        """
+        if not self.count or not other.count:
+            return np.nan, 0.0
+
+        values = np.concatenate([self._get_weighted_values()[0], other._get_weighted_values()[0]])
+        statistic = np.abs(self.cdf(values) - other.cdf(values)).max()
+        return float(statistic), self.rank_error + other.rank_error
+
+
+class ColumnProfile:
+    """Statistics of a column, shared by the column metrics.
+
+    The number of rows and of missing values are counted when the column is profiled, and
+    the minimum and maximum of numerical, datetime and boolean columns are computed with
+    one reduction each. The count of each distinct value needs to hash the column, so it is
+    only computed the first time the categorical or key metrics use it, and the profiled
+    values are kept until then. Large columns can be profiled one chunk at a time.
+
+    Args:
+        name (str or None):
+            The name of the column. Defaults to None.
+    """
+
+    def __init__(self, name=None):
+        self.name = name
+        self.num_rows = 0
+        self.num_nulls = 0
+        self._minimums = []
+        self._maximums = []
+        self._pending_chunks = []
+        self._value_counts = pd.Series(dtype=np.int64)
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        """Pickle the profile without its lock."""
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        """Restore the profile and create a new lock."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_column(cls, column, chunk_size=None):
+        """Profile a column.
+
+        Args:
+            column (pandas.Series, numpy.ndarray or ColumnProfile):
+                The values of the column. A profile is returned as is.
+            chunk_size (int or None):
+                The number of rows profiled at a time. Defaults to None, which profiles the
+                whole column at once.
+
+        Returns:
+            ColumnProfile:
+                The profile of the column.
+        """
+        if isinstance(column, cls):
+            return column
+
+        column = pd.Series(column) if not isinstance(column, pd.Series) else column
+        profile = cls(column.name)
+        if chunk_size is None:
+            profile.update(column)
+        else:
+            for start in range(0, max(len(column), 1), chunk_size):
+                profile.update(column.iloc[start : start + chunk_size])
+
+        return profile
+
+    def update(self, column):
+        """Add the values of a chunk of the column to the profile.
+
+        Args:
+            column (pandas.Series):
+                The chunk of the column.
+        """
+        with self._lock:
+            self.num_rows += len(column)
+            self.num_nulls += column.isna().sum()
+            if column.dtype.kind in 'biufmM':
+                self._minimums.append(column.min())
+                self._maximums.append(column.max())
+
+            self._pending_chunks.append(column)
+
+    @staticmethod
+    def _count_values(column):
+        codes, uniques = pd.factorize(column)
+        codes = codes[codes >= 0]
+        return pd.Series(np.bincount(codes, minlength=len(uniques)), index=uniques)
+
+    @staticmethod
+    def _add_value_counts(value_counts, other_value_counts):
+        if value_counts.empty:
+            return other_value_counts
+
+        if other_value_counts.empty:
+            return value_counts
+
+        return pd.concat([value_counts, other_value_counts]).groupby(level=0, sort=False).sum()
+
+    def merge(self, other):
+        """Add the values profiled by another profile of the same column.
+
+        Args:
+            other (ColumnProfile):
+                The profile to merge into this one.
+        """
+        with other._lock:
+            other_state = (
+                other.num_rows,
+                other.num_nulls,
+                list(other._minimums),
+                list(other._maximums),
+                list(other._pending_chunks),
+                other._value_counts,
+            )
+
+        num_rows, num_nulls, minimums, maximums, pending_chunks, value_counts = other_state
+        with self._lock:
+            self.num_rows += num_rows
+            self.num_nulls += num_nulls
+            self._minimums.extend(minimums)
+            self._maximums.extend(maximums)
+            self._pending_chunks.extend(pending_chunks)
+            self._value_counts = self._add_value_counts(self._value_counts, value_counts)
+
+    @property
+    def value_counts(self):
+        """pandas.Series: The number of rows of each distinct value that is not missing."""
+        with self._lock:
+            for chunk in self._pending_chunks:
+                self._value_counts = self._add_value_counts(
+                    self._value_counts, self._count_values(chunk)
+                )
+
+            self._pending_chunks = []
+            return self._value_counts
+
+    @property
+    def categories(self):
+        """pandas.Index: The distinct values of the column that are not missing."""
+        return self.value_counts.index
+
+    @staticmethod
+    def _reduce(values, reduction):
+        valid_values = [value for value in values if not pd.isna(value)]
+        return reduction(valid_values) if valid_values else values[0]
+
+    @property
+    def minimum(self):
+        """The minimum of the values that are not missing."""
+        if self._minimums:
+            return self._reduce(self._minimums, min)
+
+        return self.categories.min()
+
+    @property
+    def maximum(self):
+        """The maximum of the values that are not missing."""
+        if self._maximums:
+            return self._reduce(self._maximums, max)
+
+        return self.categories.max()
+
+    @property
+    def num_duplicates(self):
+        """int: The number of values that are not missing and repeat an earlier value."""
+        return self.num_rows - self.num_nulls - len(self.value_counts)
+
+    def count_between(self, minimum, maximum):
+        """Count the values that are between two bounds, both included.
+
+        Args:
+            minimum:
+                The lower bound.
+            maximum:
+                The upper bound.
+
+        Returns:
+            int:
+                The number of values between the bounds. Missing values are never counted.
+        """
+        with self._lock:
+            chunks = list(self._pending_chunks)
+            value_counts = self._value_counts
+
+        num_values = sum(chunk.between(minimum, maximum).sum() for chunk in chunks)
+        if not value_counts.empty:
+            values = value_counts.index
+            num_values += value_counts[(values >= minimum) & (values <= maximum)].sum()
+
+        return num_values
+
+
+def _normalize_key(value):
+    if isinstance(value, (bool, int, float, np.bool_, np.number)) and float(value).is_integer():
+        return int(value)
+
+    if isinstance(value, (float, np.floating)):
+        return float(value)
+
+    return value
+
+
+def _normalize_keys(values):
+    """Map the values that compare equal to the same value, so they get the same fingerprint.
+
+    The fingerprints of ``0.0`` and ``-0.0`` are different, and so are those of ``1``, ``1.0``
+    and ``True`` in an object column, while the values are equal.
+    """
+    if values.dtype.kind == 'f':
+        return values + 0.0
+
+    if values.dtype == object and pd.api.types.infer_dtype(values, skipna=True) != 'string':
+        return values.map(_normalize_key)
+
+    return values
+
+
+def count_duplicate_keys(column, chunk_size=100_000, verify=True):
+    """Count the missing and duplicated values of a key column with little memory.
+
+    Instead of building a hash table of the values, each value is hashed to a 64-bit
+    fingerprint one chunk at a time, and the duplicates are counted by sorting the
+    fingerprints, which takes a few bytes per row. Different values may share a
+    fingerprint, so the values with a repeated fingerprint are compared again. They are
+    compared in batches of about ``chunk_size`` values, each holding whole groups of
+    values with the same fingerprint, so the hash table of each batch stays small.
+
+    Args:
+        column (pandas.Series or numpy.ndarray):
+            The values of the key column.
+        chunk_size (int):
+            The number of rows hashed, and of values compared, at a time.
+            Defaults to 100000.
+        verify (bool):
+            Whether to compare the values with repeated fingerprints to discard the
+            collisions of different values. If False, a collision is counted as a
+            duplicate. Defaults to True.
+
+    Returns:
+        tuple[int, int]:
+            The number of missing values and the number of values that are not missing and
+            repeat an earlier value.
+    """
+    column = pd.Series(column) if not isinstance(column, pd.Series) else column
+    fingerprints = np.zeros(len(column), dtype=np.uint64)
+    is_null = np.empty(len(column), dtype=bool)
+    for start in range(0, len(column), chunk_size):
+        chunk = column.iloc[start : start + chunk_size]
+        chunk_is_null = chunk.isna().to_numpy()
+        is_null[start : start + len(chunk)] = chunk_is_null
+        fingerprints[start : start + len(chunk)][~chunk_is_null] = pd.util.hash_pandas_object(
+            _normalize_keys(chunk[~chunk_is_null]), index=False, categorize=False
+        ).to_numpy()
+
+    sorted_fingerprints = np.sort(fingerprints[~is_null])
+    is_repeated = sorted_fingerprints[1:] == sorted_fingerprints[:-1]
+    num_duplicates = int(is_repeated.sum())
+    if verify and num_duplicates:
+        repeated_fingerprints = np.unique(sorted_fingerprints[1:][is_repeated])
+        del sorted_fingerprints, is_repeated
+        positions = np.flatnonzero(~is_null & np.isin(fingerprints, repeated_fingerprints))
+        positions = positions[np.argsort(fingerprints[positions], kind='stable')]
+        candidate_fingerprints = fingerprints[positions]
+        num_duplicates = 0
+        start = 0
+        while start < len(positions):
+            end = min(start + chunk_size, len(positions))
+            end = np.searchsorted(candidate_fingerprints, candidate_fingerprints[end - 1], 'right')
+            candidates = _normalize_keys(column.iloc[positions[start:end]])
+            num_duplicates += int(candidates.duplicated().sum())
+            start = end
+
+    return int(is_null.sum()), num_duplicates
+
+
 def get_columns_from_metadata(metadata):
     """Get the column info from a metadata dict.
 
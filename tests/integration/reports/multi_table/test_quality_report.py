@@ -376,3 +376,47 @@ def test_quality_report_with_no_relationships():
     properties = report.get_properties()
     pd.testing.assert_frame_equal(properties, expected_properties)
     assert score == 0.6271818780763356
+
+
+def test_quality_report_concurrency():
+    """Test the concurrent properties give the same report as computing them one at a time."""
+    # Setup
+    real_data, synthetic_data, metadata = load_demo(modality='multi_table')
+    report = QualityReport()
+    report.generate(real_data, synthetic_data, metadata, verbose=False)
+
+    for concurrency in ['thread', 'process']:
+        concurrent_report = QualityReport()
+
+        # Run
+        concurrent_report.generate(
+            real_data, synthetic_data, metadata, verbose=False, concurrency=concurrency
+        )
+
+        # Assert
+        assert concurrent_report.get_score() == report.get_score()
+        pd.testing.assert_frame_equal(concurrent_report.get_properties(), report.get_properties())
+        for property_name in report._properties:
+            pd.testing.assert_frame_equal(
+                concurrent_report.get_details(property_name), report.get_details(property_name)
+            )
+
+
+def test_quality_report_max_column_pairs_random_state():
+    """Test the estimated score is the same for two reports with the same ``random_state``."""
+    # Setup
+    real_data, synthetic_data, metadata = load_demo(modality='multi_table')
+    reports = [QualityReport(), QualityReport()]
+
+    # Run
+    for report in reports:
+        report.generate(
+            real_data, synthetic_data, metadata, False, max_column_pairs=3, random_state=0
+        )
+
+    # Assert
+    first_report, second_report = reports
+    estimates = first_report.get_info()['property_estimates']
+    assert 'Intertable Trends' in estimates
+    assert estimates == second_report.get_info()['property_estimates']
+    assert first_report.get_score() == second_report.get_score()
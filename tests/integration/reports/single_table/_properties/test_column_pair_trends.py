@@ -164,3 +164,18 @@ class TestColumnPairTrends:
 
         # Assert
         assert score == 1.0
+
+    def test_get_score_n_jobs(self):
+        """Test the ``get_score`` method gives the same results on a process pool."""
+        # Setup
+        real_data, synthetic_data, metadata = load_demo(modality='single_table')
+
+        # Run
+        sequential = ColumnPairTrends()
+        sequential_score = sequential.get_score(real_data, synthetic_data, metadata)
+        parallel = ColumnPairTrends(n_jobs=2)
+        parallel_score = parallel.get_score(real_data, synthetic_data, metadata)
+
+        # Assert
+        assert parallel_score == sequential_score
+        pd.testing.assert_frame_equal(parallel.details, sequential.details)
@@ -221,6 +221,26 @@ class TestDiagnosticReport:
             report.get_details('Data Structure'), expected_details_data_structure
         )
 
+    def test_generate_key_row_threshold(self):
+        """Test the keys checked from fingerprints get the same scores as with a hash table."""
+        # Setup
+        real_data, synthetic_data, metadata = load_demo(modality='single_table')
+        synthetic_data['student_id'] = synthetic_data['student_id'].mod(50)
+        report = DiagnosticReport()
+        report.generate(real_data, synthetic_data, metadata, verbose=False)
+        low_memory_report = DiagnosticReport()
+
+        # Run
+        low_memory_report.generate(
+            real_data, synthetic_data, metadata, verbose=False, key_row_threshold=100
+        )
+
+        # Assert
+        assert low_memory_report._properties['Data Validity'].key_row_threshold == 100
+        pd.testing.assert_frame_equal(
+            low_memory_report.get_details('Data Validity'), report.get_details('Data Validity')
+        )
+
     def test_generate_multiple_times(self):
         """The results should be the same both times."""
         # Setup
@@ -1,10 +1,13 @@
+import re
 import time
 from datetime import date, datetime
 
 import numpy as np
 import pandas as pd
+import pytest
 
 from sdmetrics.demos import load_demo
+from sdmetrics.reports import RealDataProfile
 from sdmetrics.reports.single_table import QualityReport
 from tests.utils import get_error_type
 
@@ -239,6 +242,52 @@ class TestQualityReport:
         )
         assert report.get_score() == 0.8393750143888287
 
+    def test_report_real_data_profile(self):
+        """Test the reports generated from a real data profile match the regular report."""
+        # Setup
+        real_data, synthetic_data, metadata = load_demo(modality='single_table')
+        expected_report = QualityReport()
+        expected_report.generate(real_data.copy(), synthetic_data.copy(), metadata, verbose=False)
+        profile = RealDataProfile(real_data, metadata)
+
+        # Run
+        reports = []
+        for _ in range(2):
+            report = QualityReport()
+            report.generate(profile, synthetic_data.copy(), metadata, verbose=False)
+            reports.append(report)
+
+        # Assert
+        assert profile.get_real_cache()
+        for report in reports:
+            assert report.get_score() == expected_report.get_score()
+            for property_name in ['Column Shapes', 'Column Pair Trends']:
+                pd.testing.assert_frame_equal(
+                    report.get_details(property_name), expected_report.get_details(property_name)
+                )
+
+    def test_generate_many(self):
+        """Test the scores of ``generate_many`` match generating each report on its own."""
+        # Setup
+        real_data, synthetic_data, metadata = load_demo(modality='single_table')
+        candidates = {
+            f'sample_{idx}': synthetic_data.sample(frac=1, replace=True, random_state=idx)
+            for idx in range(3)
+        }
+
+        # Run
+        result = QualityReport.generate_many(
+            real_data, candidates, metadata, verbose=False, n_jobs=2
+        )
+
+        # Assert
+        assert result['Synthetic Data'].tolist() == list(candidates)
+        for row in result.itertuples(index=False):
+            report = QualityReport()
+            report.generate(real_data, candidates[row[0]], metadata, verbose=False)
+            properties = report.get_properties()
+            assert row[1:] == (report.get_score(), *properties['Score'])
+
     def test_report_end_to_end_with_errors(self):
         """Test the quality report end to end with errors in the properties computation."""
         # Setup
@@ -557,3 +606,98 @@ class TestQualityReport:
             "ConstantInputError: The synthetic data in columns 'col1, col2' contains "
             'a constant value. Correlation is undefined for constant data.'
         )
+
+    def test_generate_streaming(self):
+        """Test the streaming report gives the scores of the report on the whole tables."""
+        # Setup
+        real_data, synthetic_data, metadata = load_demo(modality='single_table')
+        report = QualityReport()
+        report.generate(real_data.copy(), synthetic_data.copy(), metadata, verbose=False)
+        streaming_report = QualityReport()
+
+        # Run
+        streaming_report.generate_streaming(
+            real_data,
+            lambda: (synthetic_data.iloc[start : start + 50] for start in range(0, 215, 50)),
+            metadata,
+            verbose=False,
+            chunk_size=30,
+        )
+
+        # Assert
+        assert streaming_report.get_score() == pytest.approx(report.get_score())
+        for property_name in ['Column Shapes', 'Column Pair Trends']:
+            details = report.get_details(property_name)
+            streaming_details = streaming_report.get_details(property_name)
+            assert streaming_details.columns.tolist() == details.columns.tolist()
+            np.testing.assert_allclose(streaming_details['Score'], details['Score'])
+
+        info = streaming_report.get_info()
+        assert info['num_rows_real_data'] == 215
+        assert info['num_rows_synthetic_data'] == 215
+        assert info['ks_error_bounds']['salary'] == 0
+
+    def test_generate_streaming_single_pass_data(self):
+        """Test an error is raised if data that can be read once needs a second pass."""
+        # Setup
+        real_data, synthetic_data, metadata = load_demo(modality='single_table')
+        expected_message = re.escape(
+            '`synthetic_data` can only be read once, but the metadata has pairs of continuous'
+            ' and discrete columns that need a second pass over the data. Please pass a'
+            ' function that returns the chunks instead.'
+        )
+
+        # Run and Assert
+        with pytest.raises(ValueError, match=expected_message):
+            QualityReport().generate_streaming(real_data, iter([synthetic_data]), metadata)
+
+    def test_generate_ks_row_threshold(self):
+        """Test the KSComplement of the large columns is estimated within its error bound."""
+        # Setup
+        real_data, synthetic_data, metadata = load_demo(modality='single_table')
+        report = QualityReport()
+        report.generate(real_data.copy(), synthetic_data.copy(), metadata, verbose=False)
+        approximate_report = QualityReport()
+
+        # Run
+        approximate_report.generate(
+            real_data, synthetic_data, metadata, verbose=False, ks_row_threshold=100
+        )
+
+        # Assert
+        details = report.get_details('Column Shapes').set_index('Column')['Score']
+        approximate_details = approximate_report.get_details('Column Shapes')
+        approximate_details = approximate_details.set_index('Column')['Score']
+        ks_error_bounds = approximate_report.get_info()['ks_error_bounds']
+        assert 'ks_error_bounds' not in report.get_info()
+        assert set(ks_error_bounds) == {
+            column_name
+            for column_name, column_meta in metadata['columns'].items()
+            if column_meta['sdtype'] in ('numerical', 'datetime')
+        }
+        for column_name, error_bound in ks_error_bounds.items():
+            difference = abs(approximate_details[column_name] - details[column_name])
+            assert difference <= error_bound + 1e-12
+
+    def test_generate_max_column_pairs_random_state(self):
+        """Test the estimated score is the same for two reports with the same ``random_state``."""
+        # Setup
+        real_data, synthetic_data, metadata = load_demo(modality='single_table')
+        reports = [QualityReport(), QualityReport()]
+
+        # Run
+        for report in reports:
+            report.generate(
+                real_data, synthetic_data, metadata, False, max_column_pairs=20, random_state=0
+            )
+
+        # Assert
+        first_report, second_report = reports
+        estimates = first_report.get_info()['property_estimates']
+        assert 'Column Pair Trends' in estimates
+        assert estimates == second_report.get_info()['property_estimates']
+        assert first_report.get_score() == second_report.get_score()
+        pd.testing.assert_frame_equal(
+            first_report.get_details('Column Pair Trends'),
+            second_report.get_details('Column Pair Trends'),
+        )
@@ -1,8 +1,10 @@
 import numpy as np
 import pandas as pd
 import pytest
+from scipy.stats import ks_2samp
 
-from sdmetrics.single_column.statistical.kscomplement import KSComplement
+from sdmetrics.single_column.statistical.kscomplement import MAX_EXACT_ROWS, KSComplement
+from sdmetrics.utils import QuantileSketch
 
 
 @pytest.mark.parametrize('array_like', [np.array, pd.Series])
@@ -59,3 +61,103 @@ def test_one_float_value():
 
     # Assert
     assert output == 1
+
+
+def test_compute_breakdown_approximate():
+    """Test the approximate score is within its error bound of the exact score."""
+    # Setup
+    random_state = np.random.RandomState(0)
+    real = pd.Series(random_state.normal(size=20000))
+    synth = pd.Series(random_state.normal(loc=0.1, size=10000))
+    real[::10] = np.nan
+
+    # Run
+    exact = KSComplement.compute_breakdown(real, synth)
+    approximate = KSComplement.compute_breakdown(real, synth, approximate=True, sketch_size=128)
+
+    # Assert
+    assert set(exact) == {'score'}
+    assert 0 < approximate['error_bound'] < 0.2
+    assert abs(approximate['score'] - exact['score']) <= approximate['error_bound']
+
+
+def test_compute_breakdown_approximate_saved_sketch():
+    """Test a saved sketch of the real data can be reused in place of the real data."""
+    # Setup
+    real = pd.Series(pd.date_range('2020-01-01', periods=500, freq='D'))
+    synth = pd.Series(pd.date_range('2020-06-01', periods=300, freq='D'))
+    sketch_dict = KSComplement.build_sketch(real).to_dict()
+
+    # Run
+    breakdown = KSComplement.compute_breakdown(
+        QuantileSketch.from_dict(sketch_dict), synth, approximate=True
+    )
+
+    # Assert
+    assert breakdown == {
+        'score': pytest.approx(KSComplement.compute(real, synth)),
+        'error_bound': 0,
+    }
+
+
+def test_compute_columns():
+    """Test every column gets the score of ``compute`` and the sorted real columns are kept."""
+    # Setup
+    random_state = np.random.RandomState(0)
+    real = pd.DataFrame({
+        'num': random_state.normal(size=300),
+        'date': pd.Series(pd.date_range('2020-01-01', periods=300, freq='h')),
+    })
+    real.loc[::7, 'num'] = np.nan
+    synth = pd.DataFrame({
+        'num': random_state.normal(0.3, size=200),
+        'date': pd.Series(pd.date_range('2020-01-03', periods=200, freq='h')),
+    })
+    real_sorted_columns = {}
+
+    # Run
+    scores = KSComplement.compute_columns(real, synth, real_sorted_columns=real_sorted_columns)
+    sorted_num = real_sorted_columns['num']
+    new_scores = KSComplement.compute_columns(
+        real, synth.iloc[:50], real_sorted_columns=real_sorted_columns
+    )
+
+    # Assert
+    for column_name in ['num', 'date']:
+        assert scores[column_name] == KSComplement.compute(real[column_name], synth[column_name])
+        assert new_scores[column_name] == KSComplement.compute(
+            real[column_name], synth[column_name].iloc[:50]
+        )
+
+    assert real_sorted_columns['num'] is sorted_num
+    assert len(sorted_num) == 257
+
+
+def test_compute_sorted_empty():
+    """Test the score is NaN when one of the columns is empty."""
+    # Run
+    score = KSComplement.compute_sorted(np.array([1.0, 2.0]), np.array([]))
+
+    # Assert
+    assert np.isnan(score)
+
+
+@pytest.mark.parametrize('num_real_rows', [MAX_EXACT_ROWS, MAX_EXACT_ROWS + 1])
+def test_compute_sorted_matches_ks_2samp(num_real_rows):
+    """Test the score matches ``ks_2samp`` on both sides of ``MAX_EXACT_ROWS``.
+
+    ``ks_2samp`` rounds the statistic only when it computes the exact p-value, which it
+    does up to ``MAX_EXACT_ROWS`` rows. The values have ties, so that rounding the statistic
+    changes it on both sides, and a change of this behavior in scipy makes this test fail.
+    """
+    # Setup
+    random_state = np.random.RandomState(0)
+    real = np.sort(random_state.randint(0, 50, size=num_real_rows).astype(float))
+    synth = np.sort(random_state.randint(0, 50, size=7001).astype(float))
+
+    # Run
+    score = KSComplement.compute_sorted(real, synth)
+
+    # Assert
+    assert score == 1 - ks_2samp(real, synth).statistic
+    assert score == KSComplement.compute(real, synth)
@@ -167,7 +167,12 @@ class TestDisclosureProtectionEstimate:
         )
 
         # Assert
-        assert score_breakdown == {'score': 1, 'cap_protection': 1, 'baseline_protection': 0.98}
+        assert score_breakdown == {
+            'score': 1,
+            'cap_protection': 1,
+            'cap_protection_confidence_interval': (1.0, 1.0),
+            'baseline_protection': 0.98,
+        }
 
     @pytest.mark.parametrize('cap_method', ['cap', 'zero_cap', 'generalized_cap'])
     def test_all_cap_methods(self, cap_method, real_data, perfect_synthetic_data):
@@ -193,5 +198,33 @@ class TestDisclosureProtectionEstimate:
         assert score_breakdown == {
             'score': 1.0,
             'cap_protection': 1.0,
+            'cap_protection_confidence_interval': (1.0, 1.0),
             'baseline_protection': 0.98,
         }
+
+    def test_end_to_end_parallel_early_stopping(self, real_data, good_synthetic_data):
+        """Test DisclosureProtectionEstimate in parallel with a seed and a tolerance."""
+        # Setup
+        kwargs = {
+            'sensitive_column_names': ['sensitive1'],
+            'known_column_names': ['key1'],
+            'num_rows_subsample': 20,
+            'num_iterations': 20,
+            'random_state': 0,
+            'tolerance': 0.05,
+            'verbose': False,
+        }
+
+        # Run
+        sequential = DisclosureProtectionEstimate.compute_breakdown(
+            real_data, good_synthetic_data, **kwargs
+        )
+        parallel = DisclosureProtectionEstimate.compute_breakdown(
+            real_data, good_synthetic_data, n_jobs=2, **kwargs
+        )
+
+        # Assert
+        assert sequential == parallel
+        lower, upper = sequential['cap_protection_confidence_interval']
+        assert lower <= sequential['cap_protection'] <= upper
+        assert upper - lower < 2 * 1.96 * 0.05
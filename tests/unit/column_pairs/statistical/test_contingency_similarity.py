@@ -1,6 +1,7 @@
 import re
 from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -102,6 +103,61 @@ class TestContingencySimilarity:
         # Assert
         assert result == expected_score
 
+    def test_compute_pairs(self):
+        """Test ``compute_pairs`` matches computing every pair separately."""
+        # Setup
+        random_state = np.random.RandomState(0)
+        real_data = pd.DataFrame({
+            'col1': random_state.choice(['a', 'b', None], 100),
+            'col2': random_state.randint(0, 5, 100),
+            'col3': random_state.choice([True, False], 100),
+        })
+        synthetic_data = pd.DataFrame({
+            'col1': random_state.choice(['a', 'c'], 80),
+            'col2': random_state.randint(0, 7, 80).astype(float),
+            'col3': random_state.choice([True, False], 80),
+        })
+        synthetic_data.loc[[0, 5], 'col2'] = np.nan
+        column_pairs = [('col1', 'col2'), ('col1', 'col3'), ('col2', 'col3')]
+
+        # Run
+        result = ContingencySimilarity.compute_pairs(real_data, synthetic_data, column_pairs)
+
+        # Assert
+        assert list(result) == column_pairs
+        for column_pair, score in result.items():
+            assert score == ContingencySimilarity.compute(
+                real_data[list(column_pair)], synthetic_data[list(column_pair)]
+            )
+
+    @patch('sdmetrics.column_pairs.statistical.contingency_similarity.MAX_DENSE_CELLS', 10)
+    def test_compute_sparse_cells(self):
+        """Test the high cardinality pairs are counted sparsely with the same result."""
+        # Setup
+        random_state = np.random.RandomState(0)
+        real_data = pd.DataFrame({
+            'col1': random_state.randint(0, 30, 200),
+            'col2': random_state.randint(0, 30, 200),
+        })
+        synthetic_data = pd.DataFrame({
+            'col1': random_state.randint(0, 35, 150),
+            'col2': random_state.randint(0, 25, 150),
+        })
+        contingency_real = real_data.groupby(['col1', 'col2']).size() / len(real_data)
+        contingency_synthetic = synthetic_data.groupby(['col1', 'col2']).size() / len(
+            synthetic_data
+        )
+        contingency_real, contingency_synthetic = contingency_real.align(
+            contingency_synthetic, fill_value=0
+        )
+        expected_score = 1 - (contingency_real - contingency_synthetic).abs().sum() / 2
+
+        # Run
+        result = ContingencySimilarity.compute(real_data, synthetic_data)
+
+        # Assert
+        assert result == pytest.approx(expected_score)
+
     @patch('sdmetrics.column_pairs.statistical.contingency_similarity.ColumnPairsMetric.normalize')
     def test_normalize(self, normalize_mock):
         """Test the ``normalize`` method.
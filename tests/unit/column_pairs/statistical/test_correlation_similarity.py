@@ -1,6 +1,7 @@
 from datetime import datetime
 from unittest.mock import Mock, call, patch
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -115,6 +116,121 @@ class TestCorrelationSimilarity:
         with pytest.raises(ConstantInputError, match=error_msg):
             metric.compute_breakdown(real_data, synthetic_data, coefficient='Pearson')
 
+    @pytest.mark.parametrize('coefficient', ['Pearson', 'Spearman'])
+    def test_compute_matrix_breakdown(self, coefficient):
+        """Test the matrices match computing the breakdown of every pair."""
+        # Setup
+        random_state = np.random.RandomState(0)
+        real_data = pd.DataFrame({
+            'col1': random_state.normal(size=30),
+            'col2': random_state.normal(size=30),
+            'col3': pd.date_range('2020-01-01', periods=30)
+            + pd.to_timedelta(random_state.randint(0, 100, 30), unit='D'),
+        })
+        real_data.loc[[2, 5], 'col1'] = np.nan
+        real_data.loc[[5, 9], 'col3'] = pd.NaT
+        synthetic_data = pd.DataFrame({
+            'col1': random_state.normal(size=20),
+            'col2': random_state.normal(size=20),
+            'col3': pd.date_range('2020-01-01', periods=20),
+        })
+
+        # Run
+        result = CorrelationSimilarity.compute_matrix_breakdown(
+            real_data, synthetic_data, coefficient=coefficient
+        )
+
+        # Assert
+        for column_1, column_2 in [('col1', 'col2'), ('col1', 'col3'), ('col2', 'col3')]:
+            expected = CorrelationSimilarity.compute_breakdown(
+                real_data[[column_1, column_2]],
+                synthetic_data[[column_1, column_2]],
+                coefficient=coefficient,
+            )
+            for key in ['score', 'real', 'synthetic']:
+                assert result[key].loc[column_1, column_2] == pytest.approx(expected[key])
+                assert result[key].loc[column_2, column_1] == pytest.approx(expected[key])
+
+    def test_compute_matrix_breakdown_constant_input(self):
+        """Test the pairs with a constant column are ``NaN``."""
+        # Setup
+        real_data = pd.DataFrame({'col1': [1.0, 1.0, 1.0], 'col2': [2.0, 3.0, 5.0]})
+        synthetic_data = pd.DataFrame({'col1': [0.9, 1.8, 3.1], 'col2': [2, 3, 4]})
+
+        # Run
+        result = CorrelationSimilarity.compute_matrix_breakdown(real_data, synthetic_data)
+
+        # Assert
+        assert np.isnan(result['score'].loc['col1', 'col2'])
+        assert np.isnan(result['real'].loc['col2', 'col1'])
+
+    def test_compute_matrix_breakdown_real_correlation(self):
+        """Test the real correlation matrix is not computed again when it is given."""
+        # Setup
+        random_state = np.random.RandomState(0)
+        real_data = pd.DataFrame({
+            'col1': random_state.normal(size=30),
+            'col2': random_state.normal(size=30),
+        })
+        synthetic_data = pd.DataFrame({
+            'col1': random_state.normal(size=20),
+            'col2': random_state.normal(size=20),
+        })
+        expected = CorrelationSimilarity.compute_matrix_breakdown(real_data, synthetic_data)
+        real_correlation = CorrelationSimilarity.compute_correlation_matrix(real_data)
+
+        # Run
+        with patch.object(
+            CorrelationSimilarity,
+            '_get_correlation_matrix',
+            wraps=CorrelationSimilarity._get_correlation_matrix,
+        ) as get_correlation_matrix_mock:
+            result = CorrelationSimilarity.compute_matrix_breakdown(
+                real_data, synthetic_data, real_correlation=real_correlation
+            )
+
+        # Assert
+        get_correlation_matrix_mock.assert_called_once()
+        for key in ['score', 'real', 'synthetic']:
+            pd.testing.assert_frame_equal(result[key], expected[key])
+
+    def test_compute_matrix_breakdown_column_pairs(self):
+        """Test only the given pairs are computed when ``column_pairs`` is passed."""
+        # Setup
+        random_state = np.random.RandomState(0)
+        real_data = pd.DataFrame(random_state.normal(size=(30, 4)), columns=list('abcd'))
+        synthetic_data = pd.DataFrame(random_state.normal(size=(20, 4)), columns=list('abcd'))
+        expected = CorrelationSimilarity.compute_matrix_breakdown(real_data, synthetic_data)
+
+        # Run
+        with patch.object(
+            CorrelationSimilarity, '_correlate', wraps=CorrelationSimilarity._correlate
+        ) as correlate_mock:
+            result = CorrelationSimilarity.compute_matrix_breakdown(
+                real_data, synthetic_data, column_pairs=[('a', 'b'), ('d', 'c')]
+            )
+
+        # Assert
+        assert correlate_mock.call_count == 4
+        for column_1, column_2 in [('a', 'b'), ('c', 'd')]:
+            assert (
+                result['score'].loc[column_1, column_2] == expected['score'].loc[column_1, column_2]
+            )
+            assert (
+                result['real'].loc[column_2, column_1] == expected['real'].loc[column_2, column_1]
+            )
+
+        assert np.isnan(result['score'].loc['a', 'c'])
+
+    def test_compute_matrix_breakdown_invalid_coefficient(self):
+        """Test an error is raised when the coefficient is not valid."""
+        # Setup
+        data = pd.DataFrame({'col1': [1.0, 2.0], 'col2': [2.0, 1.0]})
+
+        # Run and Assert
+        with pytest.raises(ValueError, match='requested coefficient Kendall is not valid'):
+            CorrelationSimilarity.compute_matrix_breakdown(data, data, coefficient='Kendall')
+
     def test_compute(self):
         """Test the ``compute`` method.
 
@@ -92,6 +92,13 @@ class TestBaseMultiTableProperty:
         base_property._num_iteration_case = 'inter_table_column_pair'
         assert base_property._get_num_iterations(metadata) == 11
 
+        base_property._single_table_property_kwargs = {'max_column_pairs': 2}
+        base_property._num_iteration_case = 'column_pair'
+        assert base_property._get_num_iterations(metadata) == 2
+
+        base_property._num_iteration_case = 'inter_table_column_pair'
+        assert base_property._get_num_iterations(metadata) == 5
+
     def test__extract_tuple(self):
         """Test the ``_extract_tuple`` method."""
         # Setup
@@ -170,12 +177,14 @@ class TestBaseMultiTableProperty:
             DataFrameMatcher(synthetic_data['Table_1']),
             metadata['tables']['Table_1'],
             progress_bar_mock,
+            context=None,
         )
         property_table_2.get_score.assert_called_once_with(
             DataFrameMatcher(real_data['Table_2']),
             DataFrameMatcher(synthetic_data['Table_2']),
             metadata['tables']['Table_2'],
             progress_bar_mock,
+            context=None,
         )
 
         pd.testing.assert_frame_equal(base_property.details, expected_details)
@@ -199,6 +208,36 @@ class TestBaseMultiTableProperty:
         base_property.details = pd.DataFrame({'Column': ['a', 'b', 'c']})
         assert np.isnan(base_property._compute_average())
 
+    def test__get_estimate(self):
+        """Test the estimates of the tables are combined with the exact scores of the others."""
+        # Setup
+        base_property = BaseMultiTableProperty()
+        estimated_property = Mock()
+        estimated_property._get_estimate.return_value = {
+            'score': 0.5,
+            'standard_error': 0.1,
+            'num_column_pairs': 30,
+            'num_computed_column_pairs': 10,
+        }
+        exact_property = Mock()
+        exact_property._get_estimate.return_value = None
+        exact_property.details = pd.DataFrame({'Score': [1.0] * 9 + [np.nan]})
+        base_property._properties = {'table1': estimated_property, 'table2': exact_property}
+
+        # Run
+        estimate = base_property._get_estimate()
+
+        # Assert
+        assert estimate == {
+            'score': pytest.approx(0.75 * 0.5 + 0.25 * 1.0),
+            'standard_error': pytest.approx(0.75 * 0.1),
+            'num_column_pairs': 40,
+            'num_computed_column_pairs': 20,
+        }
+        exact_property._get_estimate.return_value = None
+        estimated_property._get_estimate.return_value = None
+        assert base_property._get_estimate() is None
+
     def test_get_score(self):
         """Test the ``get_score`` method."""
         # Setup
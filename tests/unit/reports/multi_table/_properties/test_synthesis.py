@@ -1,5 +1,7 @@
 """Test Synthesis multi-table class."""
 
+import pandas as pd
+
 from sdmetrics.reports.multi_table._properties import Synthesis
 from sdmetrics.reports.single_table._properties import Synthesis as SingleTableSynthesis
 
@@ -13,3 +15,27 @@ def test__init__():
     assert synthesis._properties == {}
     assert synthesis._single_table_property == SingleTableSynthesis
     assert synthesis._num_iteration_case == 'table'
+    assert synthesis._single_table_property_kwargs == {
+        'synthetic_sample_size': 10000,
+        'chunk_size': None,
+        'n_jobs': None,
+    }
+
+
+def test__generate_details_forwards_options():
+    """Test the options are used to create the single table properties."""
+    # Setup
+    synthesis = Synthesis(synthetic_sample_size=None, chunk_size=100)
+    real_data = {'table': pd.DataFrame({'col': range(10)})}
+    synthetic_data = {'table': pd.DataFrame({'col': range(5, 15)})}
+    metadata = {'tables': {'table': {'columns': {'col': {'sdtype': 'numerical'}}}}}
+
+    # Run
+    synthesis.get_score(real_data, synthetic_data, metadata)
+
+    # Assert
+    table_property = synthesis._properties['table']
+    assert table_property.synthetic_sample_size is None
+    assert table_property.chunk_size == 100
+    assert table_property.n_jobs is None
+    assert table_property.details['Num Matched Rows'].iloc[0] == 5
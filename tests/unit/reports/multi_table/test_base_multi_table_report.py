@@ -225,7 +225,7 @@ class TestBaseReport:
 
         # Assert
         assert report.table_names == ['Table_1', 'Table_2']
-        mock_generate.assert_called_once_with(real_data, synthetic_data, metadata, True)
+        mock_generate.assert_called_once_with(real_data, synthetic_data, metadata, True, None)
 
     def test__check_table_names(self):
         """Test the ``_check_table_names`` method."""
@@ -1,3 +1,5 @@
+from unittest.mock import Mock, patch
+
 from sdmetrics.reports.multi_table import QualityReport
 from sdmetrics.reports.multi_table._properties import (
     Cardinality,
@@ -21,3 +23,37 @@ class TestQualityReport:
         assert isinstance(report._properties['Column Pair Trends'], ColumnPairTrends)
         assert isinstance(report._properties['Cardinality'], Cardinality)
         assert isinstance(report._properties['Intertable Trends'], InterTableTrends)
+
+    @patch('sdmetrics.reports.multi_table.quality_report.BaseMultiTableReport.generate')
+    def test_generate(self, generate_mock):
+        """Test ``generate`` passes the column pair options to the column pair properties."""
+        # Setup
+        report = QualityReport()
+        executor = Mock()
+
+        # Run
+        report.generate(
+            'real',
+            'synthetic',
+            'metadata',
+            False,
+            n_jobs=-1,
+            executor=executor,
+            max_column_pairs=10,
+            time_budget=5,
+            random_state=0,
+        )
+
+        # Assert
+        generate_mock.assert_called_once_with('real', 'synthetic', 'metadata', False, None)
+        expected_kwargs = {
+            'n_jobs': -1,
+            'executor': executor,
+            'max_column_pairs': 10,
+            'time_budget': 5,
+            'random_state': 0,
+        }
+        column_pair_trends = report._properties['Column Pair Trends']
+        assert column_pair_trends._single_table_property_kwargs == expected_kwargs
+        inter_table_trends = report._properties['Intertable Trends']
+        assert inter_table_trends._single_table_property_kwargs == expected_kwargs
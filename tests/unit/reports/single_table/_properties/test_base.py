@@ -7,6 +7,7 @@ import pandas as pd
 import pytest
 
 from sdmetrics.reports.single_table._properties import BaseSingleTableProperty
+from sdmetrics.reports.utils import PreprocessingContext
 
 
 class TestBaseSingleTableProperty:
@@ -93,3 +94,28 @@ class TestBaseSingleTableProperty:
             real_data, synthetic_data, metadata, progress_bar
         )
         mock_compute_average.assert_called_once()
+
+    def test_get_score_context(self):
+        """Test ``get_score`` makes the given context available while generating the details."""
+        # Setup
+        real_data = pd.DataFrame({'col': [1, 2]})
+        synthetic_data = pd.DataFrame({'col': [1, 2]})
+        metadata = {'columns': {'col': {'sdtype': 'numerical'}}}
+        context = PreprocessingContext(real_data, synthetic_data, metadata)
+        base_property = BaseSingleTableProperty()
+        base_property._compute_average = Mock()
+        contexts = []
+
+        def generate_details(real_data, synthetic_data, metadata, progress_bar):
+            contexts.append(base_property._get_context(real_data, synthetic_data, metadata))
+            contexts.append(base_property._get_context(real_data.copy(), synthetic_data, metadata))
+
+        base_property._generate_details = generate_details
+
+        # Run
+        base_property.get_score(real_data, synthetic_data, metadata, context=context)
+
+        # Assert
+        assert contexts[0] is context
+        assert contexts[1] is not context
+        assert base_property._context is None
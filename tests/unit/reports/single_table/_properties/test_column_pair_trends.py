@@ -1,13 +1,38 @@
 import itertools
+import re
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 
 import numpy as np
 import pandas as pd
+import pytest
 
+from sdmetrics.column_pairs.statistical import CorrelationSimilarity
 from sdmetrics.reports.single_table._properties.column_pair_trends import ColumnPairTrends
+from sdmetrics.reports.utils import PreprocessingCache, PreprocessingContext
 
 
 class TestColumnPairTrends:
+    def test___init__invalid_n_jobs(self):
+        """Test an error is raised when ``n_jobs`` is not valid."""
+        # Run and Assert
+        expected_message = re.escape('`n_jobs` must be None, -1 or an integer greater than zero.')
+        with pytest.raises(ValueError, match=expected_message):
+            ColumnPairTrends(n_jobs=0)
+
+    def test___init__invalid_budget(self):
+        """Test an error is raised when ``max_column_pairs`` or ``time_budget`` is not valid."""
+        # Run and Assert
+        expected_message = re.escape(
+            '`max_column_pairs` must be None or an integer greater than zero.'
+        )
+        with pytest.raises(ValueError, match=expected_message):
+            ColumnPairTrends(max_column_pairs=0)
+
+        expected_message = re.escape('`time_budget` must be None or a number greater than zero.')
+        with pytest.raises(ValueError, match=expected_message):
+            ColumnPairTrends(time_budget=-1)
+
     def test__convert_datetime_columns_to_numeric(self):
         """Test the ``_convert_datetime_columns_to_numeric`` method."""
         # Setup
@@ -33,11 +58,13 @@ class TestColumnPairTrends:
         cpt_property = ColumnPairTrends()
 
         # Run
-        cpt_property._convert_datetime_columns_to_numeric(data, metadata)
+        result = cpt_property._convert_datetime_columns_to_numeric(data, metadata)
 
         # Assert
-        assert data['col4'].dtype == np.int64
-        assert data['col5'].dtype == np.float64
+        assert result['col4'].dtype == np.int64
+        assert result['col5'].dtype == np.float64
+        assert result['col6'].equals(data['col6'])
+        assert data['col4'].dtype == 'datetime64[ns]'
         assert 'col6' in list(cpt_property._columns_datetime_conversion_failed.keys())
 
     def test__discretize_column(self):
@@ -155,6 +182,30 @@ class TestColumnPairTrends:
         pd.testing.assert_frame_equal(processed_data, expected_processed_data)
         pd.testing.assert_frame_equal(discrete_data, expected_discrete_data)
 
+    def test__get_processed_data_real_cache(self):
+        """Test the real data is only discretized once for the contexts of a real cache."""
+        # Setup
+        real_data = pd.DataFrame({'num': [1.0, 2.0, 3.0, np.nan], 'cat': ['a', 'b', 'a', 'b']})
+        metadata = {'columns': {'num': {'sdtype': 'numerical'}, 'cat': {'sdtype': 'categorical'}}}
+        real_cache = PreprocessingCache()
+        expected = ColumnPairTrends()._get_processed_data(real_data, metadata)
+
+        # Run
+        cpt_property = ColumnPairTrends()
+        with patch.object(
+            cpt_property, '_discretize_column', wraps=cpt_property._discretize_column
+        ) as discretize_mock:
+            for _ in range(2):
+                context = PreprocessingContext(
+                    real_data, real_data.copy(), metadata, real_cache=real_cache
+                )
+                result = cpt_property._get_processed_data(real_data, metadata, context)
+
+        # Assert
+        discretize_mock.assert_called_once()
+        pd.testing.assert_frame_equal(result[0], expected[0])
+        pd.testing.assert_frame_equal(result[1], expected[1])
+
     def test_get_columns_data_and_metric(self):
         """Test the ``_get_columns_data_and_metric`` method.
 
@@ -316,6 +367,8 @@ class TestColumnPairTrends:
         })
 
         cpt_property = ColumnPairTrends()
+        cpt_property._get_continuous_correlations = Mock(return_value=None)
+        cpt_property._get_contingency_scores = Mock(return_value={})
 
         # Run
         cpt_property._generate_details(real_data, synthetic_data, metadata, None)
@@ -339,11 +392,310 @@ class TestColumnPairTrends:
             pd.concat([processed_synthetic['col2'], discrete_synthetic['col4']], axis=1),
             pd.concat([processed_synthetic['col3'], discrete_synthetic['col4']], axis=1),
         ]
+        assert contingency_compute_mock.call_count == 5
         for idx, call1 in enumerate(contingency_compute_mock.call_args_list):
             _, contingency_kwargs = call1
             assert contingency_kwargs['real_data'].equals(expected_real_data[idx])
             assert contingency_kwargs['synthetic_data'].equals(expected_synthetic_data[idx])
 
+    def test__generate_details_correlation_matrices(self):
+        """Test the continuous pairs get the same results from the correlation matrices."""
+        # Setup
+        random_state = np.random.RandomState(0)
+        real_data = pd.DataFrame({
+            'col1': random_state.normal(size=50),
+            'col2': random_state.normal(size=50),
+            'col3': pd.to_datetime('2020-01-01') + pd.to_timedelta(np.arange(50), unit='D'),
+            'col4': [1.0] * 50,
+            'col5': random_state.choice(['a', 'b'], 50),
+        })
+        real_data.loc[[3, 7, 20], 'col1'] = np.nan
+        real_data.loc[[3, 10], 'col3'] = pd.NaT
+        synthetic_data = pd.DataFrame({
+            'col1': random_state.normal(size=40),
+            'col2': random_state.normal(size=40),
+            'col3': pd.to_datetime('2020-01-01') + pd.to_timedelta(np.arange(40) ** 2, unit='D'),
+            'col4': random_state.normal(size=40),
+            'col5': random_state.choice(['a', 'b'], 40),
+        })
+        synthetic_data.loc[[1, 2], 'col2'] = np.nan
+        metadata = {
+            'columns': {
+                'col1': {'sdtype': 'numerical'},
+                'col2': {'sdtype': 'numerical'},
+                'col3': {'sdtype': 'datetime'},
+                'col4': {'sdtype': 'numerical'},
+                'col5': {'sdtype': 'categorical'},
+            }
+        }
+        expected_property = ColumnPairTrends()
+        expected_property._get_continuous_correlations = Mock(return_value=None)
+        expected = expected_property._generate_details(real_data, synthetic_data, metadata)
+
+        # Run
+        result = ColumnPairTrends()._generate_details(real_data, synthetic_data, metadata)
+
+        # Assert
+        pd.testing.assert_frame_equal(result, expected)
+        assert result['Error'].str.startswith('ConstantInputError').sum() == 3
+
+    def test__generate_details_contingency_scores(self):
+        """Test the pairs with a discrete column get the same results from the pair engine."""
+        # Setup
+        random_state = np.random.RandomState(0)
+        real_data = pd.DataFrame({
+            'col1': random_state.normal(size=50),
+            'col2': random_state.choice(['a', 'b', None], 50),
+            'col3': pd.to_datetime('2020-01-01') + pd.to_timedelta(np.arange(50), unit='D'),
+            'col4': random_state.choice([True, False], 50),
+            'col5': random_state.randint(0, 20, 50),
+        })
+        real_data.loc[[3, 7, 20], 'col1'] = np.nan
+        synthetic_data = pd.DataFrame({
+            'col1': random_state.normal(size=40),
+            'col2': random_state.choice(['a', 'b', 'c'], 40),
+            'col3': pd.to_datetime('2020-01-01') + pd.to_timedelta(np.arange(40) ** 2, unit='D'),
+            'col4': random_state.choice([True, False], 40),
+            'col5': random_state.randint(0, 25, 40),
+        })
+        metadata = {
+            'columns': {
+                'col1': {'sdtype': 'numerical'},
+                'col2': {'sdtype': 'categorical'},
+                'col3': {'sdtype': 'datetime'},
+                'col4': {'sdtype': 'boolean'},
+                'col5': {'sdtype': 'categorical'},
+            }
+        }
+        expected_property = ColumnPairTrends()
+        expected_property._get_contingency_scores = Mock(return_value={})
+        expected = expected_property._generate_details(real_data, synthetic_data, metadata)
+
+        # Run
+        cpt_property = ColumnPairTrends()
+        result = cpt_property._generate_details(real_data, synthetic_data, metadata)
+
+        # Assert
+        pd.testing.assert_frame_equal(result, expected)
+        assert (result['Metric'] == 'ContingencySimilarity').sum() == 9
+
+    @patch(
+        'sdmetrics.reports.single_table._properties.column_pair_trends.PAIR_CHUNK_SIZE',
+        2,
+    )
+    def test__generate_details_executor(self):
+        """Test the pairs computed on an executor in chunks give the same results."""
+        # Setup
+        random_state = np.random.RandomState(0)
+        real_data = pd.DataFrame({
+            'col1': random_state.normal(size=50),
+            'col2': random_state.choice(['a', 'b', None], 50),
+            'col3': pd.to_datetime('2020-01-01') + pd.to_timedelta(np.arange(50), unit='D'),
+            'col4': random_state.choice([True, False], 50),
+            'col5': [1.0] * 50,
+            'col6': random_state.choice(['x', 'y'], 50),
+        })
+        synthetic_data = pd.DataFrame({
+            'col1': random_state.normal(size=40),
+            'col2': random_state.choice(['a', 'b', 'c'], 40),
+            'col3': pd.to_datetime('2020-01-01') + pd.to_timedelta(np.arange(40) ** 2, unit='D'),
+            'col4': random_state.choice([True, False], 40),
+            'col5': random_state.normal(size=40),
+            'col6': random_state.choice(['x', 'y'], 40),
+        })
+        metadata = {
+            'columns': {
+                'col1': {'sdtype': 'numerical'},
+                'col2': {'sdtype': 'categorical'},
+                'col3': {'sdtype': 'datetime'},
+                'col4': {'sdtype': 'boolean'},
+                'col5': {'sdtype': 'numerical'},
+                'col6': {'sdtype': 'id'},
+            }
+        }
+        expected = ColumnPairTrends()._generate_details(real_data, synthetic_data, metadata)
+        progress_bar = Mock()
+
+        # Run
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            cpt_property = ColumnPairTrends(executor=executor)
+            cpt_property._get_continuous_correlations = Mock(return_value=None)
+            cpt_property._get_contingency_scores = Mock(return_value={})
+            result = cpt_property._generate_details(
+                real_data, synthetic_data, metadata, progress_bar=progress_bar
+            )
+
+        # Assert
+        pd.testing.assert_frame_equal(result, expected)
+        num_updates = sum(
+            call.args[0] if call.args else 1 for call in progress_bar.update.call_args_list
+        )
+        assert num_updates == 15
+        assert result['Error'].str.startswith('ConstantInputError').sum() == 2
+
+    def test__get_stratified_pairs(self):
+        """Test every prefix of the shuffled pairs is proportional to the size of the strata."""
+        # Setup
+        metadata = {
+            'columns': {
+                **{f'num{idx}': {'sdtype': 'numerical'} for idx in range(3)},
+                **{f'cat{idx}': {'sdtype': 'categorical'} for idx in range(3)},
+                'id': {'sdtype': 'id'},
+            }
+        }
+        column_pairs = list(itertools.combinations(metadata['columns'], 2))
+        cpt_property = ColumnPairTrends(random_state=0)
+
+        # Run
+        shuffled_pairs, pair_strata = cpt_property._get_stratified_pairs(column_pairs, metadata)
+
+        # Assert
+        assert sorted(shuffled_pairs) == sorted(pair_strata)
+        assert len(shuffled_pairs) == 15
+        strata = pd.Series(pair_strata).value_counts().to_dict()
+        assert strata == {'mixed': 9, 'continuous': 3, 'discrete': 3}
+        assert {pair_strata[pair] for pair in shuffled_pairs[:3]} == set(strata)
+        for num_pairs in (5, 10):
+            sampled_strata = pd.Series([pair_strata[pair] for pair in shuffled_pairs[:num_pairs]])
+            for stratum, size in strata.items():
+                expected_size = size * num_pairs / 15
+                assert abs((sampled_strata == stratum).sum() - expected_size) <= 1
+
+        assert cpt_property._get_stratified_pairs(column_pairs, metadata)[0] == shuffled_pairs
+
+    def test__get_stratified_estimate(self):
+        """Test the estimate weights the mean score of each stratum by its size."""
+        # Setup
+        pair_strata = {
+            ('a', 'b'): 'continuous',
+            ('a', 'c'): 'continuous',
+            ('a', 'd'): 'mixed',
+            ('b', 'c'): 'continuous',
+            ('b', 'd'): 'mixed',
+            ('c', 'd'): 'mixed',
+        }
+        rows = [
+            ('a', 'b', 'CorrelationSimilarity', 0.6, None, None, None),
+            ('a', 'c', 'CorrelationSimilarity', 0.8, None, None, None),
+            ('a', 'd', 'ContingencySimilarity', 0.9, None, None, None),
+            ('b', 'd', 'ContingencySimilarity', np.nan, None, None, 'Error'),
+        ]
+
+        # Run
+        estimate = ColumnPairTrends._get_stratified_estimate(rows, pair_strata)
+
+        # Assert
+        expected_variance = 0.25 * (1 - 2 / 3) * 0.02 / 2
+        assert estimate == {
+            'score': pytest.approx(0.5 * 0.7 + 0.5 * 0.9),
+            'standard_error': pytest.approx(np.sqrt(expected_variance)),
+            'num_column_pairs': 6,
+            'num_computed_column_pairs': 4,
+        }
+
+    def test_get_score_max_column_pairs(self):
+        """Test only a sample of the pairs is computed and the score is an estimate."""
+        # Setup
+        random_state = np.random.RandomState(0)
+        real_data = pd.DataFrame({
+            **{f'num{idx}': random_state.normal(size=50) for idx in range(4)},
+            **{f'cat{idx}': random_state.choice(['a', 'b', 'c'], 50) for idx in range(4)},
+        })
+        synthetic_data = pd.DataFrame({
+            **{f'num{idx}': random_state.normal(size=40) for idx in range(4)},
+            **{f'cat{idx}': random_state.choice(['a', 'b', 'c'], 40) for idx in range(4)},
+        })
+        metadata = {
+            'columns': {
+                **{f'num{idx}': {'sdtype': 'numerical'} for idx in range(4)},
+                **{f'cat{idx}': {'sdtype': 'categorical'} for idx in range(4)},
+            }
+        }
+        exhaustive_property = ColumnPairTrends()
+        exhaustive_property.get_score(real_data, synthetic_data, metadata)
+        progress_bar = Mock()
+
+        # Run
+        cpt_property = ColumnPairTrends(max_column_pairs=14, random_state=0)
+        score = cpt_property.get_score(real_data, synthetic_data, metadata, progress_bar)
+        all_pairs_property = ColumnPairTrends(max_column_pairs=28)
+        all_pairs_score = all_pairs_property.get_score(real_data, synthetic_data, metadata)
+
+        # Assert
+        assert len(cpt_property.details) == 14
+        assert cpt_property._get_num_iterations(metadata) == 14
+        assert progress_bar.update.call_count == 14
+        assert score == cpt_property._get_estimate()['score']
+        assert cpt_property._get_estimate()['num_column_pairs'] == 28
+        assert cpt_property._get_estimate()['standard_error'] > 0
+        expected = exhaustive_property.details.merge(cpt_property.details[['Column 1', 'Column 2']])
+        pd.testing.assert_frame_equal(cpt_property.details, expected)
+        assert all_pairs_property._get_estimate() is None
+        assert all_pairs_score == exhaustive_property._compute_average()
+        pd.testing.assert_frame_equal(all_pairs_property.details, exhaustive_property.details)
+
+    @patch('sdmetrics.reports.single_table._properties.column_pair_trends.BUDGET_BATCH_SIZE', 4)
+    def test_get_score_sampled_correlations_bounded(self):
+        """Test only the correlations of the sampled pairs are computed, and only once."""
+        # Setup
+        random_state = np.random.RandomState(0)
+        real_data = pd.DataFrame(
+            random_state.normal(size=(50, 20)), columns=[f'num{idx}' for idx in range(20)]
+        )
+        synthetic_data = pd.DataFrame(
+            random_state.normal(size=(40, 20)), columns=[f'num{idx}' for idx in range(20)]
+        )
+        metadata = {'columns': {column: {'sdtype': 'numerical'} for column in real_data}}
+        sampled_property = ColumnPairTrends(max_column_pairs=10, random_state=0)
+        budget_property = ColumnPairTrends(max_column_pairs=30, time_budget=60, random_state=0)
+
+        # Run
+        with patch.object(
+            CorrelationSimilarity, '_correlate', wraps=CorrelationSimilarity._correlate
+        ) as correlate_mock:
+            sampled_property.get_score(real_data, synthetic_data, metadata)
+            num_sampled_calls = correlate_mock.call_count
+            budget_property.get_score(real_data, synthetic_data, metadata)
+
+        # Assert
+        assert num_sampled_calls == 2 * 10
+        assert correlate_mock.call_count - num_sampled_calls == 2 * 30
+        assert len(budget_property.details) == 30
+
+    @patch('sdmetrics.reports.single_table._properties.column_pair_trends.BUDGET_BATCH_SIZE', 2)
+    @patch('sdmetrics.reports.single_table._properties.column_pair_trends.time')
+    def test_get_score_time_budget(self, time_mock):
+        """Test the pairs stop being computed once the time budget is spent."""
+        # Setup
+        time_mock.time.side_effect = [0, 1, 3]
+        real_data = pd.DataFrame({
+            'num1': [1.0, 2.0, 3.0, 4.0],
+            'num2': [1.0, 3.0, 2.0, 4.0],
+            'cat1': ['a', 'b', 'a', 'b'],
+            'cat2': ['a', 'a', 'b', 'b'],
+        })
+        metadata = {
+            'columns': {
+                'num1': {'sdtype': 'numerical'},
+                'num2': {'sdtype': 'numerical'},
+                'cat1': {'sdtype': 'categorical'},
+                'cat2': {'sdtype': 'categorical'},
+            }
+        }
+        progress_bar = Mock()
+        cpt_property = ColumnPairTrends(time_budget=2, random_state=0)
+
+        # Run
+        cpt_property.get_score(real_data, real_data, metadata, progress_bar)
+
+        # Assert
+        assert len(cpt_property.details) == 4
+        assert cpt_property._get_estimate()['num_computed_column_pairs'] == 4
+        num_updates = sum(
+            call.args[0] if call.args else 1 for call in progress_bar.update.call_args_list
+        )
+        assert num_updates == 6
+
     def test__get_correlation_matrix_score(self):
         """Test the ``_get_correlation_matrix`` method to generate the ``Score`` heatmap."""
         # Setup
@@ -1,14 +1,16 @@
-from unittest.mock import Mock, call, patch
+from unittest.mock import Mock, patch
 
 import numpy as np
 import pandas as pd
+import pytest
 from packaging import version
 
 from sdmetrics.reports.single_table._properties.column_shapes import ColumnShapes
+from sdmetrics.single_column import KSComplement, TVComplement
 
 
 class TestColumnShapes:
-    @patch('sdmetrics.reports.single_table._properties.column_shapes.KSComplement.compute')
+    @patch('sdmetrics.reports.single_table._properties.column_shapes.KSComplement.compute_sorted')
     @patch('sdmetrics.reports.single_table._properties.column_shapes.TVComplement.compute')
     def test__generate_details(self, tv_complement_compute_mock, ks_complement_compute_mock):
         """Test the ``_generate_details`` method."""
@@ -39,19 +41,29 @@ class TestColumnShapes:
         column_shape_property._generate_details(real_data, synthetic_data, metadata)
 
         # Assert
-        expected_calls_ksc = [
-            call(real_data['col1'], synthetic_data['col1']),
-            call(real_data['col4'], synthetic_data['col4']),
-        ]
-        expected_calls_tvc = [
-            call(real_data['col2'], synthetic_data['col2']),
-            call(real_data['col3'], synthetic_data['col3']),
-        ]
-
-        ks_complement_compute_mock.assert_has_calls(expected_calls_ksc)
-        tv_complement_compute_mock.assert_has_calls(expected_calls_tvc)
-
-    @patch('sdmetrics.reports.single_table._properties.column_shapes.KSComplement.compute')
+        expected_columns_ksc = ['col1', 'col4']
+        expected_columns_tvc = ['col2', 'col3']
+        assert ks_complement_compute_mock.call_count == len(expected_columns_ksc)
+        for (real_sorted, synthetic_sorted), column_name in zip(
+            [mock_call.args for mock_call in ks_complement_compute_mock.call_args_list],
+            expected_columns_ksc,
+        ):
+            np.testing.assert_array_equal(
+                real_sorted, KSComplement.sort_column(real_data[column_name])
+            )
+            np.testing.assert_array_equal(
+                synthetic_sorted, KSComplement.sort_column(synthetic_data[column_name])
+            )
+
+        assert tv_complement_compute_mock.call_count == len(expected_columns_tvc)
+        for (real_column, synthetic_column), column_name in zip(
+            [mock_call.args for mock_call in tv_complement_compute_mock.call_args_list],
+            expected_columns_tvc,
+        ):
+            pd.testing.assert_series_equal(real_column, real_data[column_name].dropna())
+            pd.testing.assert_series_equal(synthetic_column, synthetic_data[column_name].dropna())
+
+    @patch('sdmetrics.reports.single_table._properties.column_shapes.KSComplement.compute_sorted')
     @patch('sdmetrics.reports.single_table._properties.column_shapes.TVComplement.compute')
     def test__generate_details_with_nans(
         self, tv_complement_compute_mock, ks_complement_compute_mock
@@ -84,17 +96,27 @@ class TestColumnShapes:
         column_shape_property._generate_details(real_data, synthetic_data, metadata)
 
         # Assert
-        expected_calls_ksc = [
-            call(real_data['col1'], synthetic_data['col1']),
-            call(real_data['col4'], synthetic_data['col4']),
-        ]
-        expected_calls_tvc = [
-            call(real_data['col2'], synthetic_data['col2']),
-            call(real_data['col3'], synthetic_data['col3']),
-        ]
-
-        ks_complement_compute_mock.assert_has_calls(expected_calls_ksc)
-        tv_complement_compute_mock.assert_has_calls(expected_calls_tvc)
+        expected_columns_ksc = ['col1', 'col4']
+        expected_columns_tvc = ['col2', 'col3']
+        assert ks_complement_compute_mock.call_count == len(expected_columns_ksc)
+        for (real_sorted, synthetic_sorted), column_name in zip(
+            [mock_call.args for mock_call in ks_complement_compute_mock.call_args_list],
+            expected_columns_ksc,
+        ):
+            np.testing.assert_array_equal(
+                real_sorted, KSComplement.sort_column(real_data[column_name])
+            )
+            np.testing.assert_array_equal(
+                synthetic_sorted, KSComplement.sort_column(synthetic_data[column_name])
+            )
+
+        assert tv_complement_compute_mock.call_count == len(expected_columns_tvc)
+        for (real_column, synthetic_column), column_name in zip(
+            [mock_call.args for mock_call in tv_complement_compute_mock.call_args_list],
+            expected_columns_tvc,
+        ):
+            pd.testing.assert_series_equal(real_column, real_data[column_name].dropna())
+            pd.testing.assert_series_equal(synthetic_column, synthetic_data[column_name].dropna())
 
     def test__generate_details_error(self):
         """Test the ``_generate_details`` method with the error column."""
@@ -122,6 +144,41 @@ class TestColumnShapes:
         assert column_names_nan == ['col1']
         assert error_message == [expected_message]
 
+    def test___init___invalid_ks_row_threshold(self):
+        """Test an error is raised if the row threshold is not a positive integer."""
+        # Setup
+        expected_message = '`ks_row_threshold` must be None or an integer greater than zero.'
+
+        # Run and Assert
+        with pytest.raises(ValueError, match=expected_message):
+            ColumnShapes(ks_row_threshold=0)
+
+    def test__generate_details_ks_row_threshold(self):
+        """Test the columns above the row threshold are scored from sketches."""
+        # Setup
+        random_state = np.random.RandomState(0)
+        real_data = pd.DataFrame({
+            'col1': random_state.normal(size=3000),
+            'col2': random_state.choice(['a', 'b'], size=3000),
+        })
+        synthetic_data = pd.DataFrame({
+            'col1': random_state.normal(0.2, size=3000),
+            'col2': random_state.choice(['a', 'b'], size=3000),
+        })
+        metadata = {'columns': {'col1': {'sdtype': 'numerical'}, 'col2': {'sdtype': 'categorical'}}}
+        column_shape_property = ColumnShapes(ks_row_threshold=1000, sketch_size=64)
+
+        # Run
+        result = column_shape_property._generate_details(real_data, synthetic_data, metadata)
+
+        # Assert
+        exact_score = KSComplement.compute(real_data['col1'], synthetic_data['col1'])
+        error_bound = column_shape_property.ks_error_bounds['col1']
+        assert list(column_shape_property.ks_error_bounds) == ['col1']
+        assert 0 < error_bound < 0.2
+        assert abs(result['Score'][0] - exact_score) <= error_bound
+        assert result['Score'][1] == TVComplement.compute(real_data['col2'], synthetic_data['col2'])
+
     @patch('sdmetrics.reports.single_table._properties.column_shapes.px')
     def test_get_visualization(self, mock_px):
         """Test the ``get_visualization`` method."""
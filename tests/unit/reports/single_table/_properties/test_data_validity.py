@@ -1,6 +1,7 @@
-from unittest.mock import Mock, call, patch
+from unittest.mock import Mock, patch
 
 import pandas as pd
+import pytest
 
 from sdmetrics.reports.single_table._properties.data_validity import DataValidity
 
@@ -48,21 +49,56 @@ class TestDataValidity:
         data_validity_property._generate_details(real_data, synthetic_data, metadata)
 
         # Assert
-        expected_calls_ba = [
-            call(real_data['col1'], synthetic_data['col1']),
-            call(real_data['col4'], synthetic_data['col4']),
+        calls_ba = [call_args.args for call_args in boundary_a_compute_mock.call_args_list]
+        assert [(real.name, synthetic.name) for real, synthetic in calls_ba] == [
+            ('col1', 'col1'),
+            ('col4', 'col4'),
         ]
-        expected_calls_ca = [
-            call(real_data['col2'], synthetic_data['col2']),
-            call(real_data['col3'], synthetic_data['col3']),
+        calls_ca = [call_args.args for call_args in category_a_compute_mock.call_args_list]
+        assert [(real.name, synthetic.name) for real, synthetic in calls_ca] == [
+            ('col2', 'col2'),
+            ('col3', 'col3'),
         ]
-        expected_calls_key = [
-            call(real_data['col5'], synthetic_data['col5']),
-            call(real_data['col6'], synthetic_data['col6']),
+        calls_key = [call_args.args for call_args in key_uniqueness_mock.call_args_list]
+        assert [(real.name, synthetic.name) for real, synthetic in calls_key] == [
+            ('col5', 'col5'),
+            ('col6', 'col6'),
         ]
-        boundary_a_compute_mock.assert_has_calls(expected_calls_ba)
-        category_a_compute_mock.assert_has_calls(expected_calls_ca)
-        key_uniqueness_mock.assert_has_calls(expected_calls_key)
+
+    def test___init___invalid_key_row_threshold(self):
+        """Test an error is raised if the row threshold is not a positive integer."""
+        # Setup
+        expected_message = '`key_row_threshold` must be None or an integer greater than zero.'
+
+        # Run and Assert
+        with pytest.raises(ValueError, match=expected_message):
+            DataValidity(key_row_threshold=1.5)
+
+    @patch('sdmetrics.reports.single_table._properties.data_validity.KeyUniqueness.compute')
+    def test__generate_details_key_row_threshold(self, key_uniqueness_mock):
+        """Test the keys of the tables above the row threshold use the low memory mode."""
+        # Setup
+        real_data = pd.DataFrame({'id': [1, 2, 3], 'alt': ['a', 'b', 'c']})
+        synthetic_data = pd.DataFrame({'id': [1, 2, 2], 'alt': ['a', 'b', 'b']})
+        metadata = {
+            'primary_key': 'id',
+            'alternate_keys': ['alt'],
+            'columns': {'id': {'sdtype': 'id'}, 'alt': {'sdtype': 'id'}},
+        }
+        key_uniqueness_mock.return_value = 0.5
+        data_validity_property = DataValidity(key_row_threshold=2)
+
+        # Run
+        details = data_validity_property._generate_details(real_data, synthetic_data, metadata)
+
+        # Assert
+        assert key_uniqueness_mock.call_count == 2
+        for (real_column, synthetic_column), kwargs in key_uniqueness_mock.call_args_list:
+            pd.testing.assert_series_equal(real_column, real_data[real_column.name])
+            pd.testing.assert_series_equal(synthetic_column, synthetic_data[real_column.name])
+            assert kwargs == {'low_memory': True}
+
+        assert details['Score'].tolist() == [0.5, 0.5]
 
     def test__generate_details_error(self):
         """Test the ``_generate_details`` method with the error column."""
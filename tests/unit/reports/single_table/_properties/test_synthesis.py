@@ -39,12 +39,16 @@ class TestSynthesis:
                 synthetic_data=synthetic_data_20000,
                 metadata=metadata,
                 synthetic_sample_size=10000,
+                chunk_size=None,
+                n_jobs=None,
             ),
             call(
                 real_data=real_data,
                 synthetic_data=synthetic_data,
                 metadata=metadata,
                 synthetic_sample_size=4,
+                chunk_size=None,
+                n_jobs=None,
             ),
         ]
 
@@ -62,6 +66,33 @@ class TestSynthesis:
 
         pd.testing.assert_frame_equal(details, expected__details)
 
+    @patch('sdmetrics.reports.single_table._properties.synthesis.NewRowSynthesis.compute_breakdown')
+    def test__generate_details_all_rows_in_chunks(self, newrowsynthesis_mock):
+        """Test the ``_generate_details`` method does not sample when the sample size is None."""
+        # Setup
+        real_data = Mock()
+        synthetic_data = [1] * 20000
+        metadata = Mock()
+        newrowsynthesis_mock.return_value = {
+            'score': 0.5,
+            'num_matched_rows': 10000,
+            'num_new_rows': 10000,
+        }
+
+        # Run
+        synthesis_property = Synthesis(synthetic_sample_size=None, chunk_size=5000, n_jobs=2)
+        synthesis_property._generate_details(real_data, synthetic_data, metadata)
+
+        # Assert
+        newrowsynthesis_mock.assert_called_once_with(
+            real_data=real_data,
+            synthetic_data=synthetic_data,
+            metadata=metadata,
+            synthetic_sample_size=20000,
+            chunk_size=5000,
+            n_jobs=2,
+        )
+
     @patch('sdmetrics.reports.single_table._properties.synthesis.NewRowSynthesis.compute_breakdown')
     def test__generate_details_error(self, newrowsynthesis_mock):
         """Test the ``_generate_details`` method when the metric raises an error."""
@@ -81,6 +112,8 @@ class TestSynthesis:
             synthetic_data=synthetic_data,
             metadata=metadata,
             synthetic_sample_size=4,
+            chunk_size=None,
+            n_jobs=None,
         )
 
         expected_details = pd.DataFrame(
@@ -1,3 +1,5 @@
+from unittest.mock import Mock, patch
+
 from sdmetrics.reports.single_table import QualityReport
 from sdmetrics.reports.single_table._properties import ColumnPairTrends, ColumnShapes
 
@@ -13,3 +15,32 @@ class TestQualityReport:
         assert not report.is_generated
         assert isinstance(report._properties['Column Shapes'], ColumnShapes)
         assert isinstance(report._properties['Column Pair Trends'], ColumnPairTrends)
+
+    @patch('sdmetrics.reports.single_table.quality_report.BaseReport.generate')
+    def test_generate(self, generate_mock):
+        """Test ``generate`` passes the column pair options to the column pair trends."""
+        # Setup
+        report = QualityReport()
+        executor = Mock()
+
+        # Run
+        report.generate(
+            'real',
+            'synthetic',
+            'metadata',
+            False,
+            n_jobs=2,
+            executor=executor,
+            max_column_pairs=10,
+            time_budget=5,
+            random_state=0,
+        )
+
+        # Assert
+        generate_mock.assert_called_once_with('real', 'synthetic', 'metadata', False, None)
+        column_pair_trends = report._properties['Column Pair Trends']
+        assert column_pair_trends.n_jobs == 2
+        assert column_pair_trends.executor == executor
+        assert column_pair_trends.max_column_pairs == 10
+        assert column_pair_trends.time_budget == 5
+        assert column_pair_trends.random_state == 0
@@ -1,14 +1,16 @@
 import pickle
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from unittest.mock import Mock, call, mock_open, patch
+from unittest.mock import ANY, Mock, call, mock_open, patch
 
 import pandas as pd
 import pytest
 
 from sdmetrics.demos import load_demo
-from sdmetrics.reports.base_report import BaseReport
+from sdmetrics.reports.base_report import BaseReport, _initialize_worker
+from sdmetrics.reports.utils import RealDataProfile
 
 
 class TestBaseReport:
@@ -301,8 +303,11 @@ class TestBaseReport:
         base_report._validate = mock_validate
         base_report._properties['Property 1'] = Mock()
         base_report._properties['Property 1'].get_score.return_value = 1.0
+        base_report._properties['Property 1']._get_estimate.return_value = None
         base_report._properties['Property 2'] = Mock()
         base_report._properties['Property 2'].get_score.return_value = 1.0
+        estimate = {'score': 1.0, 'standard_error': 0.0}
+        base_report._properties['Property 2']._get_estimate.return_value = estimate
 
         real_data = pd.DataFrame({'column1': [1, 2, 3], 'column2': ['a', 'b', 'c']})
         synthetic_data = pd.DataFrame({'column1': [1, 2, 3], 'column2': ['a', 'b', 'c']})
@@ -317,10 +322,10 @@ class TestBaseReport:
         mock_validate.assert_called_once_with(real_data, synthetic_data, metadata)
         mock__print_results.assert_called_once_with(False)
         base_report._properties['Property 1'].get_score.assert_called_with(
-            real_data, synthetic_data, metadata, progress_bar=None
+            real_data, synthetic_data, metadata, progress_bar=None, context=ANY
         )
         base_report._properties['Property 2'].get_score.assert_called_with(
-            real_data, synthetic_data, metadata, progress_bar=None
+            real_data, synthetic_data, metadata, progress_bar=None, context=ANY
         )
         expected_info = {
             'report_type': 'BaseReport',
@@ -329,9 +334,137 @@ class TestBaseReport:
             'num_rows_real_data': 3,
             'num_rows_synthetic_data': 3,
             'generation_time': 5,
+            'property_estimates': {'Property 2': estimate},
         }
         assert base_report.report_info == expected_info
 
+    @patch('sdmetrics.reports.base_report._generate_report')
+    def test_generate_many(self, generate_report_mock):
+        """Test ``generate_many`` scores every synthetic dataset against one real data profile."""
+        # Setup
+        real_data = pd.DataFrame({'column1': [1, 2, 3]})
+        metadata = {'columns': {'column1': {'sdtype': 'numerical'}}}
+        synthetic_data = {'first': Mock(), 'second': Mock()}
+        first_report = Mock()
+        first_report.get_score.return_value = 0.5
+        first_report.get_properties.return_value = pd.DataFrame({
+            'Property': ['Property 1', 'Property 2'],
+            'Score': [0.4, 0.6],
+        })
+        second_report = Mock()
+        second_report.get_score.return_value = 0.8
+        second_report.get_properties.return_value = pd.DataFrame({
+            'Property': ['Property 1', 'Property 2'],
+            'Score': [0.7, 0.9],
+        })
+        generate_report_mock.side_effect = [first_report, second_report]
+
+        # Run
+        result = BaseReport.generate_many(
+            real_data, synthetic_data, metadata, verbose=False, concurrency='thread'
+        )
+
+        # Assert
+        expected = pd.DataFrame({
+            'Synthetic Data': ['first', 'second'],
+            'Overall Score': [0.5, 0.8],
+            'Property 1': [0.4, 0.7],
+            'Property 2': [0.6, 0.9],
+        })
+        pd.testing.assert_frame_equal(result, expected)
+        first_call, second_call = generate_report_mock.call_args_list
+        assert isinstance(first_call.args[1], RealDataProfile)
+        assert first_call.args[1] is second_call.args[1]
+        assert first_call.args[2] is synthetic_data['first']
+        assert second_call.args[4] == {'concurrency': 'thread'}
+
+    @patch('sdmetrics.reports.base_report.ProcessPoolExecutor')
+    @patch('sdmetrics.reports.base_report._generate_report')
+    def test_generate_many_n_jobs(self, generate_report_mock, executor_mock):
+        """Test the real data profile is sent once to each process."""
+        # Setup
+        executor_mock.side_effect = ThreadPoolExecutor
+        real_data = pd.DataFrame({'column1': [1, 2, 3]})
+        metadata = {'columns': {'column1': {'sdtype': 'numerical'}}}
+        synthetic_data = {'first': Mock(), 'second': Mock(), 'third': Mock()}
+        report = Mock()
+        report.get_score.return_value = 0.5
+        report.get_properties.return_value = pd.DataFrame({'Property': ['P'], 'Score': [0.5]})
+        generate_report_mock.return_value = report
+
+        # Run
+        result = BaseReport.generate_many(
+            real_data, synthetic_data, metadata, verbose=False, n_jobs=2, concurrency='thread'
+        )
+
+        # Assert
+        assert result['Synthetic Data'].tolist() == ['first', 'second', 'third']
+        profile = generate_report_mock.call_args_list[0].args[1]
+        executor_mock.assert_called_once_with(
+            max_workers=2,
+            initializer=_initialize_worker,
+            initargs=(BaseReport, profile, metadata, {'concurrency': 'thread'}),
+        )
+        assert generate_report_mock.call_count == 3
+        for report_call in generate_report_mock.call_args_list:
+            assert report_call.args[1] is profile
+
+    def test_generate_many_invalid_inputs(self):
+        """Test an error is raised when ``n_jobs`` or ``synthetic_data`` is not valid."""
+        # Setup
+        real_data = pd.DataFrame({'column1': [1, 2, 3]})
+        metadata = {'columns': {'column1': {'sdtype': 'numerical'}}}
+
+        # Run and Assert
+        expected_message = re.escape('`n_jobs` must be None, -1 or an integer greater than zero.')
+        with pytest.raises(ValueError, match=expected_message):
+            BaseReport.generate_many(real_data, {'first': real_data}, metadata, n_jobs=0)
+
+        expected_message = re.escape(
+            '`synthetic_data` must be a dictionary mapping the name of each synthetic'
+            ' dataset to its data.'
+        )
+        with pytest.raises(ValueError, match=expected_message):
+            BaseReport.generate_many(real_data, real_data, metadata)
+
+    def test_generate_real_data_profile(self):
+        """Test the properties get the profiled real data and share its real statistics."""
+        # Setup
+        base_report = BaseReport()
+        base_report._print_results = Mock()
+        base_report._properties['Property 1'] = Mock()
+        base_report._properties['Property 1'].get_score.return_value = 1.0
+        base_report._properties['Property 1']._get_estimate.return_value = None
+        real_data = pd.DataFrame({'column1': [1, 2, 3], 'column2': ['a', 'b', 'c']})
+        synthetic_data = pd.DataFrame({'column1': [1, 2, 3], 'column2': ['a', 'b', 'c']})
+        metadata = {
+            'columns': {'column1': {'sdtype': 'numerical'}, 'column2': {'sdtype': 'categorical'}}
+        }
+        profile = RealDataProfile(real_data, metadata)
+
+        # Run
+        base_report.generate(profile, synthetic_data, metadata, verbose=False)
+
+        # Assert
+        args, kwargs = base_report._properties['Property 1'].get_score.call_args
+        assert args[0] is profile.real_data
+        assert kwargs['context']._real_cache is profile.get_real_cache()
+
+    def test_generate_real_data_profile_metadata_mismatch(self):
+        """Test an error is raised if the profile was created with another metadata."""
+        # Setup
+        base_report = BaseReport()
+        real_data = pd.DataFrame({'column1': [1, 2, 3]})
+        profile = RealDataProfile(real_data, {'columns': {'column1': {'sdtype': 'numerical'}}})
+        metadata = {'columns': {'column1': {'sdtype': 'categorical'}}}
+
+        # Run and Assert
+        expected_message = re.escape(
+            'The metadata does not match the metadata used to create the `RealDataProfile`.'
+        )
+        with pytest.raises(ValueError, match=expected_message):
+            base_report.generate(profile, real_data, metadata, verbose=False)
+
     @patch('sdmetrics.reports.base_report.datetime')
     @patch('sdmetrics.reports.base_report.time')
     @patch('sdmetrics.reports.base_report.version')
@@ -352,8 +485,10 @@ class TestBaseReport:
         base_report.convert_datetimes = Mock()
         base_report._properties['Property 1'] = Mock()
         base_report._properties['Property 1'].get_score.return_value = 1.0
+        base_report._properties['Property 1']._get_estimate.return_value = None
         base_report._properties['Property 2'] = Mock()
         base_report._properties['Property 2'].get_score.return_value = 1.0
+        base_report._properties['Property 2']._get_estimate.return_value = None
 
         real_data = {
             'table1': pd.DataFrame({'column1': [1, 2, 3], 'column2': ['a', 'b', 'c']}),
@@ -385,11 +520,15 @@ class TestBaseReport:
 
         # Assert
         base_report._properties['Property 1'].get_score.assert_called_with(
-            real_data, synthetic_data, metadata, progress_bar=None
+            real_data, synthetic_data, metadata, progress_bar=None, context=ANY
         )
         base_report._properties['Property 2'].get_score.assert_called_with(
-            real_data, synthetic_data, metadata, progress_bar=None
+            real_data, synthetic_data, metadata, progress_bar=None, context=ANY
         )
+        _, property_1_kwargs = base_report._properties['Property 1'].get_score.call_args
+        _, property_2_kwargs = base_report._properties['Property 2'].get_score.call_args
+        assert property_1_kwargs['context'] is property_2_kwargs['context']
+        assert property_1_kwargs['context'].matches(real_data, synthetic_data)
         expected_info = {
             'report_type': 'BaseReport',
             'generated_date': '2020-01-05',
@@ -458,6 +597,55 @@ class TestBaseReport:
         mock_tqdm.assert_has_calls(calls, any_order=True)
         base_report._print_results.assert_called_once_with(True)
 
+    def test_generate_invalid_concurrency(self):
+        """Test an error is raised when ``concurrency`` is not valid."""
+        # Setup
+        base_report = BaseReport()
+
+        # Run and Assert
+        expected_message = re.escape("`concurrency` must be None, 'thread' or 'process'.")
+        with pytest.raises(ValueError, match=expected_message):
+            base_report.generate(pd.DataFrame(), pd.DataFrame(), {}, concurrency='async')
+
+    @patch('sys.stdout.write')
+    @patch('tqdm.tqdm')
+    def test_generate_concurrency_thread(self, mock_tqdm, mock_write):
+        """Test ``generate`` computes the properties on threads with a combined progress bar."""
+        # Setup
+        base_report = BaseReport()
+        base_report._validate = Mock()
+        base_report._print_results = Mock()
+        base_report._properties['Property 1'] = Mock()
+        base_report._properties['Property 1'].get_score.return_value = 0.5
+        base_report._properties['Property 1']._get_num_iterations.return_value = 4
+        base_report._properties['Property 2'] = Mock()
+        base_report._properties['Property 2'].get_score.return_value = 1.0
+        base_report._properties['Property 2']._get_num_iterations.return_value = 6
+        real_data = pd.DataFrame({'column1': [1, 2, 3]})
+        synthetic_data = pd.DataFrame({'column1': [1, 2, 3]})
+        metadata = {'columns': {'column1': {'sdtype': 'numerical'}}}
+
+        # Run
+        base_report.generate(
+            real_data, synthetic_data, metadata, verbose=True, concurrency='thread'
+        )
+
+        # Assert
+        mock_tqdm.assert_called_once_with(
+            total=10, bar_format='{desc}|{bar}{r_bar}|', file=sys.stdout
+        )
+        progress_bar = mock_tqdm.return_value
+        for property_name in ['Property 1', 'Property 2']:
+            base_report._properties[property_name].get_score.assert_called_once_with(
+                real_data, synthetic_data, metadata, progress_bar=progress_bar, context=ANY
+            )
+
+        mock_write.assert_has_calls([
+            call('Property 1 Score: 50.0%\n'),
+            call('Property 2 Score: 100.0%\n'),
+        ])
+        assert base_report._overall_score == 0.75
+
     def test__check_report_generated(self):
         """Test the ``check_report_generated`` method."""
         # Setup
@@ -549,8 +737,10 @@ class TestBaseReport:
         base_report.validate = mock_validate
         base_report._properties['Property 1'] = Mock()
         base_report._properties['Property 1'].get_score.return_value = 1.0
+        base_report._properties['Property 1']._get_estimate.return_value = None
         base_report._properties['Property 2'] = Mock()
         base_report._properties['Property 2'].get_score.return_value = 1.0
+        base_report._properties['Property 2']._get_estimate.return_value = None
 
         real_data = pd.DataFrame({'column1': [1, 2, 3], 'column2': ['a', 'b', 'c']})
         synthetic_data = pd.DataFrame({'column1': [1, 2, 3], 'column2': ['a', 'b', 'c']})
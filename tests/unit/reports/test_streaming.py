@@ -0,0 +1,210 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sdmetrics.column_pairs import ContingencySimilarity, CorrelationSimilarity
+from sdmetrics.reports.streaming import (
+    TableStatistics,
+    compute_table_statistics,
+    get_column_pair_trends_details,
+    get_column_shapes_details,
+    is_reiterable,
+    iterate_chunks,
+)
+from sdmetrics.single_column import KSComplement, TVComplement
+
+
+@pytest.fixture
+def metadata():
+    return {
+        'columns': {
+            'num': {'sdtype': 'numerical'},
+            'date': {'sdtype': 'datetime', 'datetime_format': '%Y-%m-%d'},
+            'cat': {'sdtype': 'categorical'},
+            'bool': {'sdtype': 'boolean'},
+            'id': {'sdtype': 'id'},
+        }
+    }
+
+
+@pytest.fixture
+def data():
+    return pd.DataFrame({
+        'num': [1.0, 2.5, np.nan, 4.0, 3.0, 0.5, 2.0],
+        'date': ['2020-01-01', '2020-01-05', None, '2020-02-01', '2020-01-20', '2020-01-02', None],
+        'cat': ['a', 'b', 'a', None, 'c', 'a', 'b'],
+        'bool': [True, False, True, True, np.nan, False, True],
+        'id': range(7),
+    })
+
+
+def test_iterate_chunks(data, tmp_path):
+    """Test the chunks are read from a table, a file, a function or an iterable."""
+    # Setup
+    path = tmp_path / 'data.csv'
+    data.to_csv(path, index=False)
+    chunks = [data.iloc[:4], data.iloc[4:]]
+
+    # Run
+    from_table = list(iterate_chunks(data, chunk_size=3))
+    from_file = list(iterate_chunks(str(path), chunk_size=3))
+    from_function = list(iterate_chunks(lambda: iter(chunks)))
+    from_iterable = list(iterate_chunks(chunks))
+
+    # Assert
+    assert [len(chunk) for chunk in from_table] == [3, 3, 1]
+    assert [len(chunk) for chunk in from_file] == [3, 3, 1]
+    pd.testing.assert_frame_equal(pd.concat(from_table), data)
+    assert len(from_function) == len(from_iterable) == 2
+
+
+def test_is_reiterable(data):
+    """Test only the data that can be read more than once is reiterable."""
+    # Run and Assert
+    assert is_reiterable(data)
+    assert is_reiterable('data.csv')
+    assert is_reiterable(lambda: iter([data]))
+    assert is_reiterable([data])
+    assert not is_reiterable(iter([data]))
+    assert not is_reiterable(chunk for chunk in [data])
+
+
+class TestTableStatistics:
+    def test_update(self, data, metadata):
+        """Test the statistics of several chunks are those of the whole table."""
+        # Setup
+        statistics = TableStatistics(metadata)
+
+        # Run
+        statistics.update(data.iloc[:3])
+        statistics.update(data.iloc[3:])
+
+        # Assert
+        assert statistics.num_rows == 7
+        assert statistics.null_counts == {'num': 1, 'date': 2, 'cat': 1, 'bool': 1}
+        assert statistics.minimums['num'] == 0.5
+        assert statistics.maximums['num'] == 4.0
+        assert statistics.category_counts['cat'].to_dict() == {'a': 3, 'b': 2, 'c': 1}
+        assert statistics.sketches['num'].count == 6
+        assert statistics.sketches['date'].count == 5
+        count, mean_x, mean_y, m2_x, m2_y, c_xy = statistics.comoments['num', 'date']
+        complete = data.dropna(subset=['num', 'date'])
+        dates = pd.to_numeric(pd.to_datetime(complete['date'])).astype(float)
+        assert count == 5
+        assert mean_x == pytest.approx(complete['num'].mean())
+        assert mean_y == pytest.approx(dates.mean())
+        assert c_xy / np.sqrt(m2_x * m2_y) == pytest.approx(
+            np.corrcoef(complete['num'], dates)[0, 1]
+        )
+        expected_counts = data[['cat', 'bool']].value_counts(dropna=False)
+        pd.testing.assert_series_equal(
+            statistics.pair_counts['cat', 'bool'].sort_index(),
+            expected_counts.sort_index(),
+            check_names=False,
+        )
+
+    def test_update_datetime_conversion_failed(self, data, metadata):
+        """Test the error of a datetime column that cannot be converted is stored."""
+        # Setup
+        data['date'] = 'not a date'
+        statistics = TableStatistics(metadata)
+
+        # Run
+        statistics.update(data)
+
+        # Assert
+        assert statistics.errors['date'].startswith('ValueError: ')
+        assert 'date' not in statistics.sketches
+
+    def test_update_columns_do_not_match(self, data, metadata):
+        """Test an error is raised if the columns do not match the metadata."""
+        # Setup
+        statistics = TableStatistics(metadata)
+        expected_message = (
+            'The metadata does not match the data. The following columns are missing in the '
+            'real/synthetic data or in the metadata: id'
+        )
+
+        # Run and Assert
+        with pytest.raises(ValueError, match=expected_message):
+            statistics.update(data.drop(columns='id'))
+
+    def test_update_discretized(self, data, metadata):
+        """Test the mixed pairs are counted with the bins of the whole table."""
+        # Setup
+        statistics = TableStatistics(metadata)
+        statistics.update(data.iloc[:3])
+        statistics.update(data.iloc[3:])
+
+        # Run
+        statistics.update_discretized(data.iloc[:3])
+        statistics.update_discretized(data.iloc[3:])
+
+        # Assert
+        assert statistics.get_mixed_pairs() == [
+            ('num', 'cat'),
+            ('num', 'bool'),
+            ('date', 'cat'),
+            ('date', 'bool'),
+        ]
+        bins = np.histogram_bin_edges(data['num'].dropna())
+        np.testing.assert_array_equal(statistics.get_bin_edges('num'), bins)
+        expected_counts = pd.DataFrame({
+            'num': np.digitize(data['num'], bins=bins),
+            'cat': data['cat'],
+        }).value_counts(dropna=False)
+        pd.testing.assert_series_equal(
+            statistics.pair_counts['num', 'cat'].sort_index(),
+            expected_counts.sort_index(),
+            check_names=False,
+        )
+
+
+def test_get_details(data, metadata):
+    """Test the details match the ones computed by the metrics on the whole tables."""
+    # Setup
+    synthetic_data = data.sample(frac=1, random_state=0).iloc[:5]
+    synthetic_data['num'] = [0.0, 5.0, 1.0, 2.0, np.nan]
+    real_statistics = compute_table_statistics(data, metadata, chunk_size=2)
+    synthetic_statistics = compute_table_statistics(synthetic_data, metadata, chunk_size=3)
+
+    # Run
+    column_shapes, error_bounds = get_column_shapes_details(real_statistics, synthetic_statistics)
+    column_pair_trends = get_column_pair_trends_details(real_statistics, synthetic_statistics)
+
+    # Assert
+    assert column_shapes['Column'].tolist() == ['num', 'date', 'cat', 'bool']
+    assert column_shapes['Metric'].tolist() == [
+        'KSComplement',
+        'KSComplement',
+        'TVComplement',
+        'TVComplement',
+    ]
+    real_dates = pd.to_datetime(data['date'])
+    synthetic_dates = pd.to_datetime(synthetic_data['date'])
+    assert column_shapes['Score'].tolist() == pytest.approx([
+        KSComplement.compute(data['num'], synthetic_data['num']),
+        KSComplement.compute(real_dates, synthetic_dates),
+        TVComplement.compute(data['cat'], synthetic_data['cat']),
+        TVComplement.compute(data['bool'], synthetic_data['bool']),
+    ])
+    assert error_bounds == {'num': 0.0, 'date': 0.0}
+    assert column_pair_trends['Metric'].tolist() == [
+        'CorrelationSimilarity',
+        'ContingencySimilarity',
+        'ContingencySimilarity',
+        'ContingencySimilarity',
+        'ContingencySimilarity',
+        'ContingencySimilarity',
+    ]
+    assert 'Error' not in column_pair_trends
+    correlation = CorrelationSimilarity.compute_breakdown(
+        pd.DataFrame({'num': data['num'], 'date': real_dates}),
+        pd.DataFrame({'num': synthetic_data['num'], 'date': synthetic_dates}),
+    )
+    assert column_pair_trends.loc[0, 'Score'] == pytest.approx(correlation['score'])
+    assert column_pair_trends.loc[0, 'Real Correlation'] == pytest.approx(correlation['real'])
+    contingency = ContingencySimilarity.compute(
+        data[['cat', 'bool']], synthetic_data[['cat', 'bool']]
+    )
+    assert column_pair_trends.loc[5, 'Score'] == pytest.approx(contingency)
@@ -1,9 +1,19 @@
+import pickle
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 from unittest.mock import Mock, call, patch
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from sdmetrics.reports.utils import (
+    PreprocessingCache,
+    PreprocessingContext,
+    RealDataProfile,
     aggregate_metric_results,
     convert_to_datetime,
     discretize_and_apply_metric,
@@ -331,3 +341,204 @@ def test_aggregate_metric_results():
     # Assert
     assert avg_score == 0.45
     assert num_errors == 1
+
+
+class TestPreprocessingCache:
+    def test_get_or_compute_threads(self):
+        """Test a value needed by several threads at once is only computed once."""
+        # Setup
+        cache = PreprocessingCache()
+        barrier = threading.Barrier(4)
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.05)
+            return 'value'
+
+        def get_value(_):
+            barrier.wait()
+            return cache.get_or_compute(('key',), compute)
+
+        # Run
+        with ThreadPoolExecutor(4) as executor:
+            entries = list(executor.map(get_value, range(4)))
+
+        # Assert
+        assert entries == [('value', None)] * 4
+        assert len(calls) == 1
+        assert not cache._key_locks
+
+    def test_get_or_compute_error(self):
+        """Test the error raised while computing a value is cached."""
+        # Setup
+        cache = PreprocessingCache()
+        error = ValueError('error')
+        compute = Mock(side_effect=error)
+
+        # Run
+        cache.get_or_compute(('key',), compute)
+        entry = cache.get_or_compute(('key',), compute)
+
+        # Assert
+        assert entry == (None, error)
+        compute.assert_called_once_with()
+
+    def test_pickle(self):
+        """Test the cache is pickled without its locks."""
+        # Setup
+        cache = PreprocessingCache()
+        cache.get_or_compute(('key',), lambda: 'value')
+
+        # Run
+        loaded = pickle.loads(pickle.dumps(cache))
+
+        # Assert
+        assert dict(loaded) == {('key',): ('value', None)}
+        assert loaded.get_or_compute(('other',), lambda: 1) == (1, None)
+
+
+class TestPreprocessingContext:
+    def test_matches(self):
+        """Test ``matches`` only accepts the data the context was built for."""
+        # Setup
+        real_data = pd.DataFrame({'col': [1, 2]})
+        synthetic_data = pd.DataFrame({'col': [1, 2]})
+        context = PreprocessingContext(real_data, synthetic_data, {'columns': {}})
+
+        # Run and Assert
+        assert context.matches(real_data, synthetic_data)
+        assert not context.matches(real_data.copy(), synthetic_data)
+
+    def test_get_non_null_column(self):
+        """Test ``get_non_null_column`` drops the missing values and caches the result."""
+        # Setup
+        real_data = pd.DataFrame({'col': [1.0, np.nan, 3.0]})
+        synthetic_data = pd.DataFrame({'col': [None, 'b', None]})
+        context = PreprocessingContext(real_data, synthetic_data, {'columns': {}})
+
+        # Run
+        real_column = context.get_non_null_column('col')
+        synthetic_column = context.get_non_null_column('col', synthetic=True)
+
+        # Assert
+        pd.testing.assert_series_equal(real_column, real_data['col'].dropna())
+        pd.testing.assert_series_equal(synthetic_column, synthetic_data['col'].dropna())
+        assert context.get_non_null_column('col') is real_column
+        np.testing.assert_array_equal(context.get_null_mask('col'), [False, True, False])
+
+    def test_get_numeric_column(self):
+        """Test ``get_numeric_column`` parses the datetimes and keeps the missing values."""
+        # Setup
+        real_data = pd.DataFrame({'col': ['2020-01-01', None, '2020-01-03']})
+        synthetic_data = pd.DataFrame({'col': pd.to_datetime(['2020-01-01', '2020-01-02'])})
+        metadata = {'columns': {'col': {'sdtype': 'datetime', 'datetime_format': '%Y-%m-%d'}}}
+        context = PreprocessingContext(real_data, synthetic_data, metadata)
+
+        # Run
+        real_column = context.get_numeric_column('col')
+        synthetic_column = context.get_numeric_column('col', synthetic=True)
+
+        # Assert
+        expected_real_column = pd.Series([1577836800000000000, np.nan, 1578009600000000000])
+        pd.testing.assert_series_equal(real_column, expected_real_column, check_names=False)
+        assert synthetic_column.dtype == np.int64
+        assert synthetic_column.tolist() == [1577836800000000000, 1577923200000000000]
+
+    def test_get_numeric_column_error(self):
+        """Test ``get_numeric_column`` raises the conversion error every time."""
+        # Setup
+        real_data = pd.DataFrame({'col': ['error', '2020-01-02']})
+        metadata = {'columns': {'col': {'sdtype': 'datetime', 'datetime_format': '%Y-%m-%d'}}}
+        context = PreprocessingContext(real_data, real_data, metadata)
+
+        # Run and Assert
+        with pytest.raises(ValueError):
+            context.get_numeric_column('col')
+
+        with pytest.raises(ValueError):
+            context.get_numeric_column('col')
+
+    def test_get_codes(self):
+        """Test ``get_codes`` codes the real and synthetic values together."""
+        # Setup
+        real_data = pd.DataFrame({'col': ['b', None, 'a']})
+        synthetic_data = pd.DataFrame({'col': ['c', 'a']})
+        context = PreprocessingContext(real_data, synthetic_data, {'columns': {}})
+
+        # Run
+        real_codes, synthetic_codes, cardinality = context.get_codes('col')
+
+        # Assert
+        np.testing.assert_array_equal(real_codes, [1, 3, 0])
+        np.testing.assert_array_equal(synthetic_codes, [2, 0])
+        assert cardinality == 4
+
+    def test_real_cache(self):
+        """Test the contexts that share a real cache only compute the real values once."""
+        # Setup
+        real_data = pd.DataFrame({'col': [1.0, np.nan, 3.0]})
+        real_cache = PreprocessingCache()
+        context_1 = PreprocessingContext(real_data, real_data.copy(), {'columns': {}}, real_cache)
+        context_2 = PreprocessingContext(real_data, real_data.copy(), {'columns': {}}, real_cache)
+        compute = Mock(return_value='statistic')
+
+        # Run
+        real_column = context_1.get_non_null_column('col')
+        synthetic_column = context_1.get_non_null_column('col', synthetic=True)
+        statistic = context_1.get_real_statistic(('name',), compute)
+
+        # Assert
+        assert context_2.get_non_null_column('col') is real_column
+        assert context_2.get_non_null_column('col', synthetic=True) is not synthetic_column
+        assert context_2.get_real_statistic(('name',), compute) == statistic == 'statistic'
+        compute.assert_called_once_with()
+
+
+class TestRealDataProfile:
+    def test___init__(self):
+        """Test the datetime columns are converted without changing the given data."""
+        # Setup
+        real_data = pd.DataFrame({'date': ['2020-01-01', '2020-01-02'], 'num': [1, 2]})
+        metadata = {
+            'columns': {
+                'date': {'sdtype': 'datetime', 'datetime_format': '%Y-%m-%d'},
+                'num': {'sdtype': 'numerical'},
+            }
+        }
+
+        # Run
+        profile = RealDataProfile(real_data, metadata)
+
+        # Assert
+        assert profile.real_data['date'].dtype == 'datetime64[ns]'
+        assert real_data['date'].dtype == 'object'
+        pd.testing.assert_series_equal(profile.real_data['num'], real_data['num'])
+        assert profile.get_real_cache() is profile.get_real_cache()
+        assert profile.get_real_cache('table') is not profile.get_real_cache()
+
+    def test___init__multi_table(self):
+        """Test the datetime columns of every table are converted."""
+        # Setup
+        real_data = {'table': pd.DataFrame({'date': ['2020-01-01', '2020-01-02']})}
+        metadata = {'tables': {'table': {'columns': {'date': {'sdtype': 'datetime'}}}}}
+
+        # Run
+        profile = RealDataProfile(real_data, metadata)
+
+        # Assert
+        assert profile.real_data['table']['date'].dtype == 'datetime64[ns]'
+
+    def test_validate_metadata(self):
+        """Test an error is raised if the metadata is not the one of the profile."""
+        # Setup
+        metadata = {'columns': {'col': {'sdtype': 'numerical'}}}
+        profile = RealDataProfile(pd.DataFrame({'col': [1, 2]}), metadata)
+
+        # Run and Assert
+        profile.validate_metadata({'columns': {'col': {'sdtype': 'numerical'}}})
+        expected_message = re.escape(
+            'The metadata does not match the metadata used to create the `RealDataProfile`.'
+        )
+        with pytest.raises(ValueError, match=expected_message):
+            profile.validate_metadata({'columns': {'col': {'sdtype': 'categorical'}}})
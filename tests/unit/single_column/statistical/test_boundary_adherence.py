@@ -5,6 +5,7 @@ import numpy as np
 import pandas as pd
 
 from sdmetrics.single_column.statistical import BoundaryAdherence
+from sdmetrics.utils import ColumnProfile
 
 
 class TestBoundaryAdherence:
@@ -99,6 +100,21 @@ class TestBoundaryAdherence:
         assert result == 0.75
         assert result_ignore_nans == 1
 
+    def test_compute_continuous_does_not_count_values(self):
+        """Test the continuous columns are compared without counting their distinct values."""
+        # Setup
+        real_data = pd.Series(np.random.RandomState(0).normal(size=1000))
+        synthetic_data = pd.Series(np.random.RandomState(1).normal(size=1000) * 2)
+        expected = synthetic_data.between(real_data.min(), real_data.max()).mean()
+
+        # Run
+        with patch.object(ColumnProfile, '_count_values') as count_values_mock:
+            result = BoundaryAdherence.compute(real_data, synthetic_data)
+
+        # Assert
+        count_values_mock.assert_not_called()
+        assert result == expected
+
     @patch('sdmetrics.single_column.statistical.boundary_adherence.SingleColumnMetric.normalize')
     def test_normalize(self, normalize_mock):
         """Test the ``normalize`` method.
@@ -35,6 +35,28 @@ class TestCategoryAdherence:
         # Assert
         assert result == {'score': 0.9}
 
+    def test_compute_breakdown_nullable_dtype(self):
+        """Test the missing values of a nullable dtype are adherent if the real data has them.
+
+        The ``pd.NA`` values are treated as missing values, so the score is the same as the
+        one of the ``object`` columns with the same values.
+        """
+        # Setup
+        real_data = pd.Series([1, 2, None, 1], dtype='Int64')
+        synthetic_data = pd.Series([1, pd.NA, 3, 3], dtype='Int64')
+
+        metric = CategoryAdherence()
+
+        # Run
+        result = metric.compute_breakdown(real_data, synthetic_data)
+        object_result = metric.compute_breakdown(
+            real_data.astype(object), synthetic_data.astype(object)
+        )
+
+        # Assert
+        assert result == {'score': 0.5}
+        assert object_result == result
+
     @patch(
         'sdmetrics.single_column.statistical.category_adherence.CategoryAdherence.compute_breakdown'
     )
@@ -36,6 +36,32 @@ class TestKeyUniqueness:
         expected_message = 'The real data contains NA or duplicate values.'
         logger_mock.info.assert_called_once_with(expected_message)
 
+    @patch('sdmetrics.single_column.statistical.key_uniqueness.LOGGER')
+    def test_compute_breakdown_low_memory(self, logger_mock):
+        """Test the low memory mode gives the same score from the fingerprints."""
+        # Setup
+        real_data = pd.Series(['a', 'b', 'c', None])
+        synthetic_data = pd.Series(['a', 'b', None, 'c', None, 'e', 'b', None, 'f', None])
+
+        # Run
+        result = KeyUniqueness.compute_breakdown(real_data, synthetic_data, low_memory=True)
+
+        # Assert
+        assert result == {'score': 0.5}
+        logger_mock.info.assert_called_once_with('The real data contains NA or duplicate values.')
+
+    def test_compute_breakdown_low_memory_equal_values(self):
+        """Test both modes count the values that are equal but of different types the same."""
+        # Setup
+        floats = pd.Series([0.0, -0.0, 1.0, 2.0])
+        objects = pd.Series([1, 1.0, 'a', 'b'])
+
+        # Run and Assert
+        for data in [floats, objects]:
+            result = KeyUniqueness.compute_breakdown(data, data)
+            low_memory_result = KeyUniqueness.compute_breakdown(data, data, low_memory=True)
+            assert result == low_memory_result == {'score': 0.75}
+
     @patch('sdmetrics.single_column.statistical.key_uniqueness.KeyUniqueness.compute_breakdown')
     def test_compute(self, compute_breakdown_mock):
         """Test the ``compute`` method."""
@@ -49,5 +75,5 @@ class TestKeyUniqueness:
         result = metric.compute(real_data, synthetic_data)
 
         # Assert
-        compute_breakdown_mock.assert_called_once_with(real_data, synthetic_data)
+        compute_breakdown_mock.assert_called_once_with(real_data, synthetic_data, False, True)
         assert result == 0.6
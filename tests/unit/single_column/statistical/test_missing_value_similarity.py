@@ -31,6 +31,31 @@ class TestMissingValueSimilarity:
         # Assert
         assert result == {'score': 0.75, 'real': 0.25, 'synthetic': 0.5}
 
+    def test_compute_breakdown_columns(self):
+        """Test the missing values of many columns are compared at once."""
+        # Setup
+        real_data = pd.DataFrame({
+            'a': [1.0, np.nan, 2.6, 0.8],
+            'b': ['x', None, None, 'y'],
+            'c': [1, 2, 3, 4],
+        })
+        synthetic_data = pd.DataFrame({
+            'a': [0.9, 1.8, None, None],
+            'b': ['x', 'y', 'z', None],
+            'c': [1, 2, 3, 4],
+        })
+
+        # Run
+        result = MissingValueSimilarity.compute_breakdown_columns(
+            real_data, synthetic_data, ['a', 'b']
+        )
+
+        # Assert
+        assert result == {
+            'a': {'score': 0.75, 'real': 0.25, 'synthetic': 0.5},
+            'b': {'score': 0.75, 'real': 0.5, 'synthetic': 0.25},
+        }
+
     def test_compute(self):
         """Test the ``compute`` method.
 
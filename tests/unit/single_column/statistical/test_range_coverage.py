@@ -4,6 +4,7 @@ import numpy as np
 import pandas as pd
 
 from sdmetrics.single_column.statistical import RangeCoverage
+from sdmetrics.utils import ColumnProfile
 
 
 class TestRangeCoverage:
@@ -89,6 +90,20 @@ class TestRangeCoverage:
         # Assert
         assert result == 0.5
 
+    def test_compute_continuous_does_not_count_values(self):
+        """Test the range of continuous columns is computed without counting their values."""
+        # Setup
+        real_data = pd.Series(pd.date_range('2020-01-01', periods=10))
+        synthetic_data = pd.Series(pd.date_range('2020-01-03', periods=10))
+
+        # Run
+        with patch.object(ColumnProfile, '_count_values') as count_values_mock:
+            result = RangeCoverage.compute(real_data, synthetic_data)
+
+        # Assert
+        count_values_mock.assert_not_called()
+        assert result == 7 / 9
+
     @patch('sdmetrics.single_column.statistical.range_coverage.SingleColumnMetric.normalize')
     def test_normalize(self, normalize_mock):
         """Test the ``normalize`` method.
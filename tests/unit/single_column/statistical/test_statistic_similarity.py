@@ -1,3 +1,4 @@
+import warnings
 from unittest.mock import Mock, patch
 
 import numpy as np
@@ -67,6 +68,84 @@ class TestStatisticSimilarity:
         # Assert
         assert result == expected_score_breakdown
 
+    def test_compute_breakdown_columns(self):
+        """Test the breakdown of many columns matches the one of each column."""
+        # Setup
+        real_data = pd.DataFrame({
+            'float': [1.0, np.nan, 2.6, 0.8, 3.3],
+            'int': [1, 5, 2, 8, 3],
+            'constant': [1.0, 1.0, np.nan, 1.0, 1.0],
+            'date': pd.to_datetime(['2020-01-01', None, '2020-03-01', '2021-01-01', '2020-05-01']),
+        })
+        synthetic_data = pd.DataFrame({
+            'float': [0.9, 1.8, np.nan, 3.1],
+            'int': [2, 2, 7, 4],
+            'constant': [0.5, 1.0, 1.5, 2.0],
+            'date': pd.to_datetime(['2020-02-01', '2020-04-01', None, '2020-06-01']),
+        })
+        columns = ['float', 'int', 'constant', 'date']
+
+        # Run
+        with pytest.warns(ConstantInputWarning):
+            result = StatisticSimilarity.compute_breakdown_columns(
+                real_data, synthetic_data, columns, statistic='std'
+            )
+
+        # Assert
+        assert list(result) == columns
+        for column in columns:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', ConstantInputWarning)
+                expected = StatisticSimilarity.compute_breakdown(
+                    real_data[column], synthetic_data[column], statistic='std'
+                )
+
+            assert result[column] == expected
+
+    def test_compute_breakdown_columns_invalid_statistic(self):
+        """Test an error is raised if the statistic is not valid."""
+        # Setup
+        data = pd.DataFrame({'col': [1.0, 2.0]})
+        expected_message = (
+            'requested statistic var is not valid. Please choose either mean, std, or median.'
+        )
+
+        # Run and Assert
+        with pytest.raises(ValueError, match=expected_message):
+            StatisticSimilarity.compute_breakdown_columns(data, data, statistic='var')
+
+    def test_compute_breakdown_columns_store_errors(self):
+        """Test the errors of the columns that can not be reduced are stored."""
+        # Setup
+        real_data = pd.DataFrame({'int': [1, 5, 2], 'str': ['a', 'b', 'c']})
+        synthetic_data = pd.DataFrame({'int': [2, 2, 7], 'str': ['b', 'c', 'd']})
+
+        # Run
+        result = StatisticSimilarity.compute_breakdown_columns(
+            real_data, synthetic_data, store_errors=True
+        )
+
+        # Assert
+        expected = StatisticSimilarity.compute_breakdown(real_data['int'], synthetic_data['int'])
+        assert result['int'] == expected
+        assert list(result['str']) == ['error']
+        assert isinstance(result['str']['error'], Exception)
+
+    def test_compute_breakdown_columns_invalid_statistic_store_errors(self):
+        """Test the error of an invalid statistic is stored for every column."""
+        # Setup
+        data = pd.DataFrame({'a': [1.0, 2.0], 'b': [3.0, 5.0]})
+
+        # Run
+        result = StatisticSimilarity.compute_breakdown_columns(
+            data, data, statistic='var', store_errors=True
+        )
+
+        # Assert
+        assert list(result) == ['a', 'b']
+        for breakdown in result.values():
+            assert isinstance(breakdown['error'], ValueError)
+
     def test_compute(self):
         """Test the ``compute`` method.
 
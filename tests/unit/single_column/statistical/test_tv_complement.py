@@ -82,6 +82,29 @@ class TestTVComplement:
         with pytest.raises(IncomputableMetricError, match=err_msg):
             metric.compute(real_data, synthetic_data)
 
+    def test_compute_columns(self):
+        """Test every column is scored as by ``compute``, with NaN for the empty columns."""
+        # Setup
+        real_data = pd.DataFrame({
+            'col1': ['a', 'b', 'c', 'a', 'a', 'b'],
+            'col2': [True, False, np.nan, True, True, True],
+            'col3': [np.nan] * 6,
+        })
+        synthetic_data = pd.DataFrame({
+            'col1': ['a', 'b', 'c', 'a', 'b', 'c'],
+            'col2': [False, False, True, np.nan, True, True],
+            'col3': ['x', 'y', 'x', 'x', 'y', 'x'],
+        })
+
+        # Run
+        result = TVComplement.compute_columns(real_data, synthetic_data)
+
+        # Assert
+        assert list(result) == ['col1', 'col2', 'col3']
+        assert result['col1'] == TVComplement.compute(real_data['col1'], synthetic_data['col1'])
+        assert result['col2'] == TVComplement.compute(real_data['col2'], synthetic_data['col2'])
+        assert np.isnan(result['col3'])
+
     @patch('sdmetrics.single_column.statistical.tv_complement.SingleColumnMetric.normalize')
     def test_normalize(self, normalize_mock):
         """Test the ``normalize`` method.
@@ -1,12 +1,17 @@
 import re
+from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from sdmetrics.single_table.privacy.cap import (
+    CAPAttacker,
     CategoricalCAP,
     CategoricalGeneralizedCAP,
     CategoricalZeroCAP,
+    GeneralizedCAPAttacker,
+    ZeroCAPAttacker,
 )
 
 
@@ -25,3 +30,148 @@ def test_CAP_deprecation_message(metric):
     )
     with pytest.warns(DeprecationWarning, match=expected_warning):
         metric.compute(real_data, synthetic_data, key_fields=['col1'], sensitive_fields=['col2'])
+
+
+class TestCAPAttacker:
+    def test_score_batch(self):
+        """Test ``score_batch`` matches scoring the rows one by one."""
+        # Setup
+        synthetic_data = pd.DataFrame({
+            'key1': ['a', 'a', 'b', 'b', 'b', 'c', None],
+            'key2': [1, 1, 2, 2, 3, 3, 1],
+            'sensitive': ['x', 'y', 'x', 'x', 'y', 'z', 'x'],
+        })
+        real_data = pd.DataFrame({
+            'key1': ['a', 'b', 'b', 'c', 'd', None],
+            'key2': [1, 2, 3, 3, 1, 1],
+            'sensitive': ['x', 'x', 'x', 'z', 'x', 'x'],
+        })
+        attacker = CAPAttacker()
+        attacker.fit(synthetic_data, ['key1', 'key2'], ['sensitive'])
+
+        # Run
+        scores = attacker.score_batch(real_data[['key1', 'key2']], real_data[['sensitive']])
+
+        # Assert
+        np.testing.assert_array_equal(scores, [0.5, 1.0, 0.0, 1.0, np.nan, 1.0])
+        assert attacker.synthetic_dict[('a', 1)] == [('x',), ('y',)]
+
+    def test_score_batch_no_matching_keys(self):
+        """Test ``score_batch`` when none of the keys are in the synthetic data."""
+        # Setup
+        synthetic_data = pd.DataFrame({'key': ['a', 'b'], 'sensitive': ['x', 'y']})
+        real_data = pd.DataFrame({'key': ['c', 'd'], 'sensitive': ['x', 'y']})
+        attacker = CAPAttacker()
+        attacker.fit(synthetic_data, ['key'], ['sensitive'])
+
+        # Run
+        scores = attacker.score_batch(real_data[['key']], real_data[['sensitive']])
+
+        # Assert
+        np.testing.assert_array_equal(scores, [np.nan, np.nan])
+
+
+class TestZeroCAPAttacker:
+    def test_score_batch(self):
+        """Test ``score_batch`` scores the rows with unknown keys as 0."""
+        # Setup
+        synthetic_data = pd.DataFrame({'key': ['a', 'a', 'b'], 'sensitive': ['x', 'y', 'y']})
+        real_data = pd.DataFrame({'key': ['a', 'b', 'c'], 'sensitive': ['x', 'x', 'x']})
+        attacker = ZeroCAPAttacker()
+        attacker.fit(synthetic_data, ['key'], ['sensitive'])
+
+        # Run
+        scores = attacker.score_batch(real_data[['key']], real_data[['sensitive']])
+
+        # Assert
+        np.testing.assert_array_equal(scores, [0.5, 0.0, 0.0])
+
+
+@pytest.mark.parametrize('metric', [CategoricalCAP, CategoricalZeroCAP, CategoricalGeneralizedCAP])
+def test_CAP_metrics_match_row_by_row_scores(metric):
+    """Test the batched scores give the same result as scoring the rows one by one."""
+    # Setup
+    random_state = np.random.RandomState(0)
+    real_data = pd.DataFrame({
+        'key1': random_state.choice(['a', 'b', 'c', 'd'], 200),
+        'key2': random_state.randint(0, 5, 200),
+        'sensitive': random_state.choice(['x', 'y', 'z'], 200),
+    })
+    synthetic_data = pd.DataFrame({
+        'key1': random_state.choice(['a', 'b', 'c'], 150),
+        'key2': random_state.randint(0, 6, 150),
+        'sensitive': random_state.choice(['x', 'y', 'z'], 150),
+    })
+    attacker = metric.MODEL()
+    attacker.fit(synthetic_data, ['key1', 'key2'], ['sensitive'])
+    expected_scores = []
+    for key, sensitive in zip(
+        real_data[['key1', 'key2']].itertuples(index=False, name=None),
+        real_data[['sensitive']].itertuples(index=False, name=None),
+    ):
+        row_score = attacker.score(key, sensitive)
+        if row_score is not None:
+            expected_scores.append(row_score)
+
+    # Run
+    score = metric._compute(
+        real_data, synthetic_data, key_fields=['key1', 'key2'], sensitive_fields=['sensitive']
+    )
+
+    # Assert
+    assert score == pytest.approx(1.0 - sum(expected_scores) / len(expected_scores))
+
+
+class TestGeneralizedCAPAttacker:
+    def test_score_batch(self):
+        """Test ``score_batch`` uses all the synthetic keys at the minimum hamming distance."""
+        # Setup
+        synthetic_data = pd.DataFrame({
+            'key1': ['a', 'a', 'a', 'b', 'b', 'c'],
+            'key2': [1, 1, 2, 1, 3, 3],
+            'sensitive': ['x', 'y', 'x', 'x', 'y', 'z'],
+        })
+        real_data = pd.DataFrame({
+            'key1': ['a', 'b', 'd', 'c', 'c'],
+            'key2': [1, 2, 3, 3, 3],
+            'sensitive': ['x', 'x', 'y', 'z', 'z'],
+        })
+        attacker = GeneralizedCAPAttacker()
+        attacker.fit(synthetic_data, ['key1', 'key2'], ['sensitive'])
+
+        # Run
+        scores = attacker.score_batch(real_data[['key1', 'key2']], real_data[['sensitive']])
+
+        # Assert
+        np.testing.assert_array_equal(scores, [0.5, 2 / 3, 0.5, 1.0, 1.0])
+
+    @patch('sdmetrics.single_table.privacy.cap.HAMMING_BLOCK_SIZE', 2)
+    def test_score_batch_blocks(self):
+        """Test ``score_batch`` gives the same scores when searching in several blocks."""
+        # Setup
+        random_state = np.random.RandomState(0)
+        synthetic_data = pd.DataFrame({
+            'key1': random_state.choice(['a', 'b', 'c'], 50),
+            'key2': random_state.randint(0, 4, 50),
+            'sensitive': random_state.choice(['x', 'y'], 50),
+        })
+        real_data = pd.DataFrame({
+            'key1': random_state.choice(['a', 'b', 'd'], 30),
+            'key2': random_state.randint(0, 6, 30),
+            'sensitive': random_state.choice(['x', 'y', 'z'], 30),
+        })
+        attacker = GeneralizedCAPAttacker()
+        attacker.fit(synthetic_data, ['key1', 'key2'], ['sensitive'])
+        expected_scores = [
+            attacker.score(key, sensitive)
+            for key, sensitive in zip(
+                real_data[['key1', 'key2']].itertuples(index=False, name=None),
+                real_data[['sensitive']].itertuples(index=False, name=None),
+            )
+        ]
+
+        # Run
+        scores = attacker.score_batch(real_data[['key1', 'key2']], real_data[['sensitive']])
+
+        # Assert
+        np.testing.assert_array_equal(scores, expected_scores)
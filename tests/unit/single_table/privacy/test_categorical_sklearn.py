@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sdmetrics.single_table.privacy.categorical_sklearn import (
+    CategoricalKNNAttacker,
+    CategoricalNBAttacker,
+    CategoricalRFAttacker,
+    CategoricalSVMAttacker,
+)
+
+
+@pytest.mark.parametrize(
+    'attacker_class',
+    [CategoricalNBAttacker, CategoricalKNNAttacker, CategoricalRFAttacker, CategoricalSVMAttacker],
+)
+def test_predict_batch(attacker_class):
+    """Test ``predict_batch`` matches predicting the rows one by one."""
+    # Setup
+    random_state = np.random.RandomState(0)
+    synthetic_data = pd.DataFrame({
+        'key1': random_state.choice(['a', 'b', None], 50),
+        'key2': random_state.randint(0, 3, 50),
+        'sensitive': random_state.choice(['x', 'y'], 50),
+    })
+    real_data = pd.DataFrame(
+        {'key1': ['a', 'b', None, 'c', 'a'], 'key2': [0, 1, 2, 0, 5]},
+        index=[10, 11, 12, 13, 14],
+    )
+    attacker = attacker_class()
+    attacker.fit(synthetic_data, ['key1', 'key2'], ['sensitive'])
+    expected_predictions = [
+        attacker.predict(key) for key in real_data.itertuples(index=False, name=None)
+    ]
+
+    # Run
+    predictions = attacker.predict_batch(real_data)
+
+    # Assert
+    assert predictions == expected_predictions
+    assert predictions[3] is None
+    assert predictions[4] is None
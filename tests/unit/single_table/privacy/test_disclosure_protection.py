@@ -285,53 +285,6 @@ class TestDisclosureProtection:
             'cap_protection': 0.5,
         }
 
-    @patch('sdmetrics.single_table.privacy.disclosure_protection.CAP_METHODS')
-    @patch(
-        'sdmetrics.single_table.privacy.disclosure_protection.DisclosureProtection._compute_baseline'
-    )
-    @patch(
-        'sdmetrics.single_table.privacy.disclosure_protection.DisclosureProtection._discretize_and_fillna'
-    )
-    def test_compute_breakdown_warns_too_large(
-        self, mock_discretize_and_fillna, mock_compute_baseline, CAPMethodsMock
-    ):
-        """Test the ``compute_breakdown`` warns if the data is too large."""
-        # Setup
-        real_data = pd.DataFrame({
-            'col1': np.random.choice(['A', 'B', 'C', 'D'], size=50001),
-            'col2': range(50001),
-        })
-        synthetic_data = pd.DataFrame({
-            'col1': np.random.choice(['A', 'B', 'C', 'D'], size=50001),
-            'col2': range(50001),
-        })
-        CAPMock = Mock()
-        CAPMock._compute.return_value = 0.5
-        CAPMethodsMock.keys.return_value = ['CAP', 'ZERO_CAP', 'GENERALIZED_CAP']
-        CAPMethodsMock.get.return_value = CAPMock
-        mock_compute_baseline.return_value = 0.5
-        mock_discretize_and_fillna.return_value = (real_data, synthetic_data)
-
-        # Run
-        expected_warning = re.escape(
-            'Data exceeds 10000 rows, perfomance may be slow. '
-            'Consider using the `DisclosureProtectionEstimate` for faster computation.'
-        )
-        with pytest.warns(UserWarning, match=expected_warning):
-            score_breakdown = DisclosureProtection.compute_breakdown(
-                real_data=real_data,
-                synthetic_data=synthetic_data,
-                known_column_names=['col1'],
-                sensitive_column_names=['col2'],
-            )
-
-        # Assert
-        assert score_breakdown == {
-            'score': 1,
-            'baseline_protection': 0.5,
-            'cap_protection': 0.5,
-        }
-
     @patch(
         'sdmetrics.single_table.privacy.disclosure_protection.DisclosureProtection.compute_breakdown'
     )
@@ -381,6 +334,10 @@ class TestDisclosureProtectionEstimate:
 
         # Run and Assert
         DisclosureProtectionEstimate._validate_inputs(**default_kwargs)
+        DisclosureProtectionEstimate._validate_inputs(**{
+            **default_kwargs,
+            'random_state': np.int64(42),
+        })
 
         bad_rows_subsample_error = re.escape(
             '`num_rows_subsample` must be an integer greater than zero.'
@@ -400,6 +357,27 @@ class TestDisclosureProtectionEstimate:
                 'num_iterations': bad_num_iterations,
             })
 
+        bad_n_jobs_error = re.escape('`n_jobs` must be None, -1 or an integer greater than zero.')
+        with pytest.raises(ValueError, match=bad_n_jobs_error):
+            DisclosureProtectionEstimate._validate_inputs(**{**default_kwargs, 'n_jobs': 0})
+
+        bad_random_state_error = re.escape('`random_state` must be None or an integer.')
+        with pytest.raises(ValueError, match=bad_random_state_error):
+            DisclosureProtectionEstimate._validate_inputs(**{
+                **default_kwargs,
+                'random_state': 'seed',
+            })
+
+        with pytest.raises(ValueError, match=bad_random_state_error):
+            DisclosureProtectionEstimate._validate_inputs(**{
+                **default_kwargs,
+                'random_state': True,
+            })
+
+        bad_tolerance_error = re.escape('`tolerance` must be None or a number greater than zero.')
+        with pytest.raises(ValueError, match=bad_tolerance_error):
+            DisclosureProtectionEstimate._validate_inputs(**{**default_kwargs, 'tolerance': 0})
+
     @patch('sdmetrics.single_table.privacy.disclosure_protection.tqdm')
     @patch('sdmetrics.single_table.privacy.disclosure_protection.CAP_METHODS')
     def test__compute_estimated_cap_metric(self, CAPMethodsMock, mock_tqdm):
@@ -422,21 +400,28 @@ class TestDisclosureProtectionEstimate:
         mock_tqdm.tqdm.return_value = progress_bar
 
         # Run
-        avg_score, avg_computed_score = DisclosureProtectionEstimate._compute_estimated_cap_metric(
-            real_data,
-            synthetic_data,
-            baseline_protection=0.5,
-            known_column_names=['col1'],
-            sensitive_column_names=['col2'],
-            computation_method='CAP',
-            num_rows_subsample=10,
-            num_iterations=5,
-            verbose=True,
+        avg_score, avg_computed_score, confidence_interval = (
+            DisclosureProtectionEstimate._compute_estimated_cap_metric(
+                real_data,
+                synthetic_data,
+                baseline_protection=0.5,
+                known_column_names=['col1'],
+                sensitive_column_names=['col2'],
+                computation_method='CAP',
+                num_rows_subsample=10,
+                num_iterations=5,
+                verbose=True,
+            )
         )
 
         # Assert
         assert avg_score == 0.76
         assert avg_computed_score == 0.38
+        standard_error = np.std([0.4, 0.5, 0.2, 0.6, 0.2], ddof=1) / np.sqrt(5)
+        assert confidence_interval == pytest.approx((
+            0.38 - 1.96 * standard_error,
+            0.38 + 1.96 * standard_error,
+        ))
         progress_bar.set_description.assert_has_calls([
             call('Estimating Disclosure Protection (Score=0.000)'),
             call('Estimating Disclosure Protection (Score=0.800)'),
@@ -464,22 +449,130 @@ class TestDisclosureProtectionEstimate:
         CAPMethodsMock.get.return_value = CAPMock
 
         # Run
-        avg_score, avg_computed_score = DisclosureProtectionEstimate._compute_estimated_cap_metric(
-            real_data,
-            synthetic_data,
-            baseline_protection=0,
-            known_column_names=['col1'],
-            sensitive_column_names=['col2'],
-            computation_method='CAP',
-            num_rows_subsample=10,
-            num_iterations=5,
-            verbose=False,
+        avg_score, avg_computed_score, _ = (
+            DisclosureProtectionEstimate._compute_estimated_cap_metric(
+                real_data,
+                synthetic_data,
+                baseline_protection=0,
+                known_column_names=['col1'],
+                sensitive_column_names=['col2'],
+                computation_method='CAP',
+                num_rows_subsample=10,
+                num_iterations=5,
+                verbose=False,
+            )
         )
 
         # Assert
         assert np.isnan(avg_score)
         assert avg_computed_score == 0.38
 
+    @patch('sdmetrics.single_table.privacy.disclosure_protection.CAP_METHODS')
+    def test__compute_estimated_cap_metric_tolerance(self, CAPMethodsMock):
+        """Test the iterations stop once the standard error is lower than the tolerance."""
+        # Setup
+        real_data = pd.DataFrame({'col1': ['A', 'B'] * 5, 'col2': ['X', 'Y'] * 5})
+        synthetic_data = pd.DataFrame({'col1': ['A', 'B'] * 5, 'col2': ['X', 'Y'] * 5})
+        CAPMock = Mock()
+        CAPMock._compute.side_effect = [0.4, 0.6] + [0.5] * 10
+        CAPMethodsMock.get.return_value = CAPMock
+
+        # Run
+        _, avg_computed_score, confidence_interval = (
+            DisclosureProtectionEstimate._compute_estimated_cap_metric(
+                real_data,
+                synthetic_data,
+                baseline_protection=0.5,
+                known_column_names=['col1'],
+                sensitive_column_names=['col2'],
+                computation_method='CAP',
+                num_rows_subsample=5,
+                num_iterations=12,
+                verbose=False,
+                tolerance=0.04,
+            )
+        )
+
+        # Assert
+        assert CAPMock._compute.call_count == 10
+        assert avg_computed_score == 0.5
+        assert confidence_interval[1] - confidence_interval[0] < 2 * 1.96 * 0.04
+
+    @patch('sdmetrics.single_table.privacy.disclosure_protection.CAP_METHODS')
+    def test__compute_estimated_cap_metric_tolerance_min_iterations(self, CAPMethodsMock):
+        """Test the tolerance does not stop the iterations before enough subsamples.
+
+        Equal scores have a standard error of zero, which should not stop the iterations
+        after the first two subsamples.
+        """
+        # Setup
+        real_data = pd.DataFrame({'col1': ['A', 'B'] * 5, 'col2': ['X', 'Y'] * 5})
+        synthetic_data = pd.DataFrame({'col1': ['A', 'B'] * 5, 'col2': ['X', 'Y'] * 5})
+        CAPMock = Mock()
+        CAPMock._compute.return_value = 0.5
+        CAPMethodsMock.get.return_value = CAPMock
+        kwargs = {
+            'baseline_protection': 0.5,
+            'known_column_names': ['col1'],
+            'sensitive_column_names': ['col2'],
+            'computation_method': 'CAP',
+            'num_rows_subsample': 5,
+            'verbose': False,
+            'tolerance': 0.01,
+        }
+
+        # Run
+        DisclosureProtectionEstimate._compute_estimated_cap_metric(
+            real_data, synthetic_data, num_iterations=20, **kwargs
+        )
+        num_calls = CAPMock._compute.call_count
+        CAPMock._compute.reset_mock()
+        DisclosureProtectionEstimate._compute_estimated_cap_metric(
+            real_data, synthetic_data, num_iterations=3, **kwargs
+        )
+
+        # Assert
+        assert num_calls == 10
+        assert CAPMock._compute.call_count == 3
+
+    def test__compute_estimated_cap_metric_random_state(self):
+        """Test the estimate is reproducible with a ``random_state``, also in parallel."""
+        # Setup
+        random_state = np.random.RandomState(0)
+        real_data = pd.DataFrame({
+            'col1': random_state.choice(['A', 'B', 'C', 'D'], size=100),
+            'col2': random_state.choice(['X', 'Y'], size=100),
+        })
+        synthetic_data = pd.DataFrame({
+            'col1': random_state.choice(['A', 'B', 'C', 'D'], size=100),
+            'col2': random_state.choice(['X', 'Y'], size=100),
+        })
+        kwargs = {
+            'baseline_protection': 0.5,
+            'known_column_names': ['col1'],
+            'sensitive_column_names': ['col2'],
+            'computation_method': 'CAP',
+            'num_rows_subsample': 20,
+            'num_iterations': 4,
+            'verbose': False,
+            'random_state': 42,
+        }
+
+        # Run
+        sequential = DisclosureProtectionEstimate._compute_estimated_cap_metric(
+            real_data, synthetic_data, **kwargs
+        )
+        repeated = DisclosureProtectionEstimate._compute_estimated_cap_metric(
+            real_data, synthetic_data, **kwargs
+        )
+        parallel = DisclosureProtectionEstimate._compute_estimated_cap_metric(
+            real_data, synthetic_data, n_jobs=2, **kwargs
+        )
+
+        # Assert
+        assert sequential == repeated
+        assert sequential == parallel
+
     @patch(
         'sdmetrics.single_table.privacy.disclosure_protection.DisclosureProtectionEstimate._compute_estimated_cap_metric'
     )
@@ -496,7 +589,7 @@ class TestDisclosureProtectionEstimate:
             'col2': np.random.choice(['X', 'Y', 'Z', 'X', 'X'], size=10),
             'col3': ['A'] * 10,
         })
-        mock__compute_estimated_cap_metric.return_value = (0.8, 0.6)
+        mock__compute_estimated_cap_metric.return_value = (0.8, 0.6, (0.5, 0.7))
 
         # Run
         score_breakdown = DisclosureProtectionEstimate.compute_breakdown(
@@ -512,6 +605,7 @@ class TestDisclosureProtectionEstimate:
             'score': 0.8,
             'baseline_protection': 0.875,
             'cap_protection': 0.6,
+            'cap_protection_confidence_interval': (0.5, 0.7),
         }
         mock__compute_estimated_cap_metric.assert_called_once_with(
             DataFrameMatcher(real_data),
@@ -523,6 +617,9 @@ class TestDisclosureProtectionEstimate:
             num_rows_subsample=1000,
             num_iterations=10,
             verbose=True,
+            n_jobs=None,
+            random_state=None,
+            tolerance=None,
         )
 
     @patch(
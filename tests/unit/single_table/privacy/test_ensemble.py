@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sdmetrics.single_table.privacy.categorical_sklearn import (
+    CategoricalKNNAttacker,
+    CategoricalNBAttacker,
+    CategoricalSVMAttacker,
+)
+from sdmetrics.single_table.privacy.ensemble import CategoricalEnsembleAttacker
+
+
+class TestCategoricalEnsembleAttacker:
+    def test___init___invalid_n_jobs(self):
+        """Test an error is raised when ``n_jobs`` is not valid."""
+        # Run and Assert
+        with pytest.raises(ValueError, match='`n_jobs` must be None, -1 or an integer'):
+            CategoricalEnsembleAttacker([CategoricalNBAttacker], n_jobs=0)
+
+    @pytest.mark.parametrize('n_jobs', [None, 3])
+    def test_predict_batch(self, n_jobs):
+        """Test ``predict_batch`` matches predicting the rows one by one."""
+        # Setup
+        random_state = np.random.RandomState(0)
+        synthetic_data = pd.DataFrame({
+            'key1': random_state.choice(['a', 'b', 'c'], 60),
+            'key2': random_state.randint(0, 3, 60),
+            'sensitive': random_state.choice(['x', 'y', 'z'], 60),
+        })
+        real_data = pd.DataFrame({
+            'key1': random_state.choice(['a', 'b', 'd'], 20),
+            'key2': random_state.randint(0, 3, 20),
+        })
+        attacker = CategoricalEnsembleAttacker(
+            [CategoricalNBAttacker, CategoricalKNNAttacker, CategoricalSVMAttacker], n_jobs=n_jobs
+        )
+        attacker.fit(synthetic_data, ['key1', 'key2'], ['sensitive'])
+        expected_predictions = [
+            attacker.predict(key) for key in real_data.itertuples(index=False, name=None)
+        ]
+
+        # Run
+        predictions = attacker.predict_batch(real_data)
+
+        # Assert
+        assert predictions == expected_predictions
@@ -0,0 +1,140 @@
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from sdmetrics.single_table.privacy.loss import CDFCache, InverseCDFDistance, LossFunction
+
+
+class TestLossFunction:
+    def test_measure_batch(self):
+        """Test ``measure_batch`` calls ``measure`` for every row by default."""
+
+        # Setup
+        class AbsoluteLoss(LossFunction):
+            def measure(self, pred, real):
+                return sum(abs(p - r) for p, r in zip(pred, real))
+
+        pred = np.array([[1.0, 2.0], [3.0, 4.0]])
+        real = np.array([[1.5, 2.0], [0.0, 0.0]])
+
+        # Run
+        losses = AbsoluteLoss().measure_batch(pred, real)
+
+        # Assert
+        np.testing.assert_array_equal(losses, [0.5, 7.0])
+
+
+class TestInverseCDFDistance:
+    def test_measure_batch(self):
+        """Test ``measure_batch`` matches measuring the rows one by one."""
+        # Setup
+        random_state = np.random.RandomState(0)
+        data = pd.DataFrame({
+            'col1': random_state.normal(size=100),
+            'col2': random_state.exponential(size=100),
+        })
+        loss_function = InverseCDFDistance(p=2)
+        loss_function.fit(data, ['col1', 'col2'])
+        pred = data.to_numpy()[:20]
+        real = data.to_numpy()[20:40]
+        expected_losses = [
+            loss_function.measure(tuple(pred_row), tuple(real_row))
+            for pred_row, real_row in zip(pred, real)
+        ]
+
+        # Run
+        losses = loss_function.measure_batch(pred, real)
+
+        # Assert
+        np.testing.assert_array_equal(losses, expected_losses)
+
+    def test_fit_reuses_cached_distributions(self):
+        """Test the fitted distributions are shared between fits on the same column."""
+        # Setup
+        random_state = np.random.RandomState(0)
+        data = pd.DataFrame({
+            'col1': random_state.normal(size=100),
+            'col2': random_state.exponential(size=100),
+        })
+        cache = CDFCache()
+        first = InverseCDFDistance(cache=cache)
+        second = InverseCDFDistance(cache=cache)
+
+        # Run
+        first.fit(data, ['col1', 'col2'])
+        second.fit(data.copy(), ['col2'])
+
+        # Assert
+        assert second.cdfs[0] is first.cdfs[1]
+        assert first.cdfs[0] is not first.cdfs[1]
+
+    def test_transform_caches_columns(self):
+        """Test the CDF values of a column are only computed once."""
+        # Setup
+        data = pd.DataFrame({'col': np.random.RandomState(0).normal(size=100)})
+        loss_function = InverseCDFDistance(cache=CDFCache())
+        loss_function.fit(data, ['col'])
+        values = data.to_numpy()
+        expected = loss_function.transform(values)
+
+        # Run
+        with patch.object(loss_function.cdfs[0], 'cdf') as cdf_mock:
+            result = loss_function.transform(values.copy())
+
+        # Assert
+        cdf_mock.assert_not_called()
+        np.testing.assert_array_equal(result, expected)
+        result[0, 0] = -1
+        np.testing.assert_array_equal(loss_function.transform(values), expected)
+
+    def test_measure_batch_does_not_cache_predictions(self):
+        """Test only the CDF values of the real values are cached."""
+        # Setup
+        data = pd.DataFrame({'col': np.random.RandomState(0).normal(size=100)})
+        cache = CDFCache()
+        loss_function = InverseCDFDistance(cache=cache)
+        loss_function.fit(data, ['col'])
+        values = data.to_numpy()
+
+        # Run
+        loss_function.measure_batch(values[::-1], values)
+
+        # Assert
+        assert list(cache._columns) == [
+            (loss_function._cdf_fingerprints[0], loss_function._cdf_fingerprints[0])
+        ]
+
+
+class TestCDFCache:
+    def test_get_column_bounded_by_bytes(self):
+        """Test the least recently used columns are dropped once ``max_bytes`` is exceeded."""
+        # Setup
+        cache = CDFCache(max_bytes=200)
+        column = np.zeros(10)
+
+        # Run
+        cache.get_column('a', column.copy)
+        cache.get_column('b', column.copy)
+        cache.get_column('a', column.copy)
+        cache.get_column('c', column.copy)
+        cache.get_column('d', np.zeros(100).copy)
+
+        # Assert
+        assert list(cache._columns) == ['a', 'c']
+        assert cache.num_bytes == 160
+
+    def test_clear(self):
+        """Test ``clear`` drops all the cached values."""
+        # Setup
+        cache = CDFCache()
+        cache.get_cdf('a', object)
+        cache.get_column('a', np.zeros(10).copy)
+
+        # Run
+        cache.clear()
+
+        # Assert
+        assert not cache._cdfs
+        assert not cache._columns
+        assert cache.num_bytes == 0
@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sdmetrics.single_table.privacy.numerical_sklearn import LRAttacker, SVRAttacker
+
+
+@pytest.mark.parametrize('attacker_class', [LRAttacker, SVRAttacker])
+@pytest.mark.parametrize('sensitive_fields', [['sensitive1'], ['sensitive1', 'sensitive2']])
+def test_predict_batch(attacker_class, sensitive_fields):
+    """Test ``predict_batch`` matches predicting the rows one by one."""
+    # Setup
+    random_state = np.random.RandomState(0)
+    data = pd.DataFrame({
+        'key1': random_state.normal(size=50),
+        'key2': random_state.normal(size=50),
+        'sensitive1': random_state.normal(size=50),
+        'sensitive2': random_state.normal(size=50),
+    })
+    attacker = attacker_class()
+    attacker.fit(data, ['key1', 'key2'], sensitive_fields)
+    key_data = data[['key1', 'key2']].iloc[:10]
+    expected_predictions = [
+        attacker.predict(key) for key in key_data.itertuples(index=False, name=None)
+    ]
+
+    # Run
+    predictions = attacker.predict_batch(key_data)
+
+    # Assert
+    assert predictions.shape == (10, len(sensitive_fields))
+    np.testing.assert_allclose(predictions, expected_predictions)
@@ -0,0 +1,75 @@
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sdmetrics.single_table.privacy.radius_nearest_neighbor import (
+    InverseCDFCutoff,
+    NumericalRadiusNearestNeighborAttacker,
+)
+
+
+@pytest.fixture
+def data():
+    random_state = np.random.RandomState(0)
+    synthetic_data = pd.DataFrame({
+        'key1': random_state.normal(size=60).round(1),
+        'key2': random_state.exponential(size=60).round(1),
+        'sensitive': random_state.normal(size=60),
+    })
+    real_data = pd.DataFrame({
+        'key1': random_state.normal(size=20).round(1),
+        'key2': random_state.exponential(size=20).round(1),
+        'sensitive': random_state.normal(size=20),
+    })
+    real_data.loc[3, 'key1'] = np.nan
+
+    return synthetic_data, real_data
+
+
+class TestNumericalRadiusNearestNeighborAttacker:
+    @pytest.mark.parametrize('p', [1, 2])
+    def test_predict_batch(self, data, p):
+        """Test ``predict_batch`` averages the sensitive values of the synthetic neighbors."""
+        # Setup
+        synthetic_data, real_data = data
+        weight_func = InverseCDFCutoff(p=p, cutoff=0.1)
+        weight_func.fit(synthetic_data, ['key1', 'key2'])
+        attacker = NumericalRadiusNearestNeighborAttacker(InverseCDFCutoff, {'p': p, 'cutoff': 0.1})
+        attacker.fit(synthetic_data, ['key1', 'key2'], ['sensitive'])
+        expected_predictions = []
+        for key in real_data[['key1', 'key2']].itertuples(index=False, name=None):
+            is_neighbor = [
+                weight_func.measure(key, synthetic_key) == 1
+                for synthetic_key in synthetic_data[['key1', 'key2']].itertuples(
+                    index=False, name=None
+                )
+            ]
+            neighbors = synthetic_data.loc[is_neighbor, 'sensitive']
+            expected_predictions.append(neighbors.mean() if len(neighbors) else 0)
+
+        # Run
+        predictions = attacker.predict_batch(real_data[['key1', 'key2']])
+
+        # Assert
+        np.testing.assert_allclose(predictions[:, 0], expected_predictions)
+        assert predictions[3, 0] == 0
+
+    @patch('sdmetrics.single_table.privacy.radius_nearest_neighbor.NEIGHBOR_BLOCK_SIZE', 100)
+    def test_predict_batch_blocks(self, data):
+        """Test ``predict_batch`` gives the same result when querying in several blocks."""
+        # Setup
+        synthetic_data, real_data = data
+        attacker = NumericalRadiusNearestNeighborAttacker(InverseCDFCutoff, {'p': 2, 'cutoff': 0.3})
+        attacker.fit(synthetic_data, ['key1', 'key2'], ['sensitive'])
+        expected_predictions = [
+            attacker.predict(key)
+            for key in real_data[['key1', 'key2']].itertuples(index=False, name=None)
+        ]
+
+        # Run
+        predictions = attacker.predict_batch(real_data[['key1', 'key2']])
+
+        # Assert
+        np.testing.assert_allclose(predictions, expected_predictions)
@@ -1,4 +1,15 @@
-from sdmetrics.single_table.privacy.util import closest_neighbors
+import numpy as np
+import pandas as pd
+
+from sdmetrics.single_table.privacy.util import (
+    allow_nan,
+    closest_neighbors,
+    closest_neighbors_mask,
+    factorize_columns,
+    factorize_rows,
+    majority,
+    majority_batch,
+)
 
 
 def test_closest_neighbors_exact():
@@ -30,3 +41,91 @@ def test_closest_neighbors_non_exact():
     assert ('a', '1') in results
     assert ('a', '3') in results
     assert ('b', '2') in results
+
+
+def test_factorize_rows():
+    """Test equal rows get the same code across dataframes, with nulls treated as equal."""
+    # Setup
+    first = pd.DataFrame({'a': ['x', 'y', None], 'b': [1, 2, 3]}, index=[5, 6, 7])
+    second = pd.DataFrame({'a': ['y', np.nan, 'x', 'x'], 'b': [2, 3, 2, 1]})
+
+    # Run
+    first_codes, second_codes = factorize_rows(first, second)
+
+    # Assert
+    np.testing.assert_array_equal(first_codes, [0, 1, 2])
+    np.testing.assert_array_equal(second_codes, [1, 2, 3, 0])
+
+
+def test_factorize_columns():
+    """Test each column is encoded with codes shared across dataframes."""
+    # Setup
+    first = pd.DataFrame({'a': ['x', 'y', None], 'b': [1, 2, 3]})
+    second = pd.DataFrame({'a': ['y', np.nan], 'b': [3, 4]})
+
+    # Run
+    first_codes, second_codes = factorize_columns(first, second)
+
+    # Assert
+    np.testing.assert_array_equal(first_codes, [[0, 0], [1, 1], [2, 2]])
+    np.testing.assert_array_equal(second_codes, [[1, 2], [2, 3]])
+
+
+def test_closest_neighbors_mask():
+    """Test the mask marks all the samples at the minimum hamming distance of each target."""
+    # Setup
+    samples = np.array([[0, 0], [0, 2], [1, 0], [1, 1], [1, 2]])
+    targets = np.array([[0, 1], [1, 1], [2, 2]])
+
+    # Run
+    mask = closest_neighbors_mask(samples, targets)
+
+    # Assert
+    expected_mask = [
+        [True, True, False, True, False],
+        [False, False, False, True, False],
+        [False, True, False, False, True],
+    ]
+    np.testing.assert_array_equal(mask, expected_mask)
+
+
+def test_allow_nan():
+    """Test the ``NaN`` and ``None`` entries are replaced with a placeholder."""
+    # Setup
+    data = pd.DataFrame(
+        {'col1': ['a', None, 'b'], 'col2': [1.0, 2.0, np.nan], 'col3': [1, 2, 3]},
+        index=[5, 6, 7],
+    )
+
+    # Run
+    result = allow_nan(data)
+
+    # Assert
+    expected = pd.DataFrame(
+        {
+            'col1': ['a', 'place_holder_for_nan', 'b'],
+            'col2': [1.0, 2.0, 'place_holder_for_nan'],
+            'col3': [1, 2, 3],
+        },
+        index=[5, 6, 7],
+    )
+    pd.testing.assert_frame_equal(result, expected)
+    assert data['col1'].isna().sum() == 1
+
+
+def test_majority_batch():
+    """Test ``majority_batch`` matches calling ``majority`` on every row."""
+    # Setup
+    predictions = [
+        [('a',), ('a',), None, ('b',), None],
+        [('b',), ('b',), None, ('c',), ('a',)],
+        [('b',), ('a',), None, ('c',), None],
+    ]
+
+    # Run
+    result = majority_batch(predictions)
+
+    # Assert
+    expected = [majority(row) for row in zip(*predictions)]
+    assert result == expected
+    assert result == [('b',), ('a',), None, ('c',), ('a',)]
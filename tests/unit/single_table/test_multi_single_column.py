@@ -43,6 +43,7 @@ class TestMultiSingleColumnMetric:
             {'score': 2.0},
         ]
         metric_mock.single_column_metric_kwargs = None
+        del metric_mock.single_column_metric.compute_breakdown_columns
 
         # Run
         result = MultiSingleColumnMetric._compute(metric_mock, data, data)
@@ -90,6 +91,7 @@ class TestMultiSingleColumnMetric:
         metric_mock._select_fields.return_value = ['a', 'b', 'c']
         metric_mock.single_column_metric.compute_breakdown.side_effect = [1.0, 2.0, test_error]
         metric_mock.single_column_metric_kwargs = None
+        del metric_mock.single_column_metric.compute_breakdown_columns
 
         # Run and assert
         with pytest.raises(ValueError, match='test error'):
@@ -136,6 +138,7 @@ class TestMultiSingleColumnMetric:
             {'error': test_error},
         ]
         metric_mock.single_column_metric_kwargs = None
+        del metric_mock.single_column_metric.compute_breakdown_columns
 
         # Run
         result = MultiSingleColumnMetric._compute(metric_mock, data, data, store_errors=True)
@@ -148,6 +151,74 @@ class TestMultiSingleColumnMetric:
             'd': {'score': np.nan},
         }
 
+    def test__compute_breakdown_columns(self):
+        """Test the ``_compute`` method computes all the columns at once if the metric can."""
+        # Setup
+        metadata = {'columns': {'a': {}, 'b': {}, 'c': {}}}
+        data = pd.DataFrame({'a': [0, 1], 'b': [2, 3], 'c': ['x', 'y']})
+        metric_mock = Mock()
+        metric_mock._validate_inputs.return_value = (data, data, metadata)
+        metric_mock._select_fields.return_value = ['b', 'a']
+        metric_mock.single_column_metric.compute_breakdown_columns.return_value = {
+            'a': {'score': 1.0},
+            'b': {'score': 0.5},
+        }
+        metric_mock.single_column_metric_kwargs = {'statistic': 'std'}
+
+        # Run
+        result = MultiSingleColumnMetric._compute(metric_mock, data, data)
+
+        # Assert
+        metric_mock.single_column_metric.compute_breakdown_columns.assert_called_once_with(
+            data, data, ['a', 'b'], store_errors=False, statistic='std'
+        )
+        metric_mock.single_column_metric.compute_breakdown.assert_not_called()
+        assert result == {'a': {'score': 1.0}, 'b': {'score': 0.5}, 'c': {'score': np.nan}}
+
+    def test__compute_breakdown_columns_store_errors(self):
+        """Test the ``_compute`` method lets ``compute_breakdown_columns`` store the errors."""
+        # Setup
+        metadata = {'columns': {'a': {}, 'b': {}}}
+        data = pd.DataFrame({'a': [0, 1], 'b': [2, 3]})
+        test_error = ValueError('test error')
+        metric_mock = Mock()
+        metric_mock._validate_inputs.return_value = (data, data, metadata)
+        metric_mock._select_fields.return_value = ['a', 'b']
+        metric_mock.single_column_metric.compute_breakdown_columns.return_value = {
+            'a': {'score': 1.0},
+            'b': {'error': test_error},
+        }
+        metric_mock.single_column_metric_kwargs = None
+
+        # Run
+        result = MultiSingleColumnMetric._compute(metric_mock, data, data, store_errors=True)
+
+        # Assert
+        metric_mock.single_column_metric.compute_breakdown_columns.assert_called_once_with(
+            data, data, ['a', 'b'], store_errors=True
+        )
+        metric_mock.single_column_metric.compute_breakdown.assert_not_called()
+        assert result == {'a': {'score': 1.0}, 'b': {'error': test_error}}
+
+    def test__compute_breakdown_columns_error(self):
+        """Test an error raised by ``compute_breakdown_columns`` is not hidden."""
+        # Setup
+        metadata = {'columns': {'a': {}, 'b': {}}}
+        data = pd.DataFrame({'a': [0, 1], 'b': [2, 3]})
+        metric_mock = Mock()
+        metric_mock._validate_inputs.return_value = (data, data, metadata)
+        metric_mock._select_fields.return_value = ['a', 'b']
+        metric_mock.single_column_metric.compute_breakdown_columns.side_effect = TypeError(
+            'test error'
+        )
+        metric_mock.single_column_metric_kwargs = None
+
+        # Run and Assert
+        with pytest.raises(TypeError, match='test error'):
+            MultiSingleColumnMetric._compute(metric_mock, data, data, store_errors=True)
+
+        metric_mock.single_column_metric.compute_breakdown.assert_not_called()
+
     def test_compute(self):
         """Test the ``compute`` method.
 
@@ -2,6 +2,7 @@ from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
+import pytest
 
 from sdmetrics.single_table import NewRowSynthesis
 
@@ -169,6 +170,103 @@ class TestNewRowSynthesis:
         # Assert
         assert score == 1
 
+    def test_compute_breakdown_tolerance_and_missing_values(self):
+        """Test the numerical tolerance is relative to the synthetic value and nulls match."""
+        # Setup
+        real_data = pd.DataFrame({
+            'num': [100.0, -50.0, np.nan, 0.0, 10.0],
+            'cat': ['a', 'b', 'c', None, 'a'],
+            'int': [1, 2, 3, 4, 5],
+        })
+        synthetic_data = pd.DataFrame({
+            'num': [101.0, -50.4, np.nan, 0.0, 98.0, -49.0, np.nan, 0.001, 10.0],
+            'cat': ['a', 'b', 'c', None, 'a', 'b', 'a', None, 'a'],
+            'int': [1, 2, 3, 4, 1, 2, 3, 4, 6],
+        })
+        metadata = {
+            'columns': {
+                'num': {'sdtype': 'numerical'},
+                'cat': {'sdtype': 'categorical'},
+                'int': {'sdtype': 'numerical'},
+            },
+        }
+
+        # Run
+        breakdown = NewRowSynthesis.compute_breakdown(real_data, synthetic_data, metadata)
+
+        # Assert
+        assert breakdown == {'score': 5 / 9, 'num_new_rows': 5, 'num_matched_rows': 4}
+
+    @patch('sdmetrics.single_table.new_row_synthesis.MAX_CANDIDATES', 2)
+    def test_compute_breakdown_many_candidates(self):
+        """Test the matches are found when the candidates are checked in several chunks."""
+        # Setup
+        real_data = pd.DataFrame({
+            'col1': [1.0] * 10 + [2.0] * 10,
+            'col2': list(range(20)),
+        })
+        synthetic_data = pd.DataFrame({
+            'col1': [1.0, 1.0, 2.0, 2.0, 3.0],
+            'col2': [9, 10, 19, 9, 0],
+        })
+        metadata = {
+            'columns': {
+                'col1': {'sdtype': 'numerical'},
+                'col2': {'sdtype': 'categorical'},
+            },
+        }
+
+        # Run
+        breakdown = NewRowSynthesis.compute_breakdown(real_data, synthetic_data, metadata)
+
+        # Assert
+        assert breakdown == {'score': 0.6, 'num_new_rows': 3, 'num_matched_rows': 2}
+
+    def test_compute_breakdown_chunks(self):
+        """Test the result is the same when matching the rows in chunks, in parallel or not."""
+        # Setup
+        random_state = np.random.RandomState(0)
+        real_data = pd.DataFrame({
+            'col1': random_state.randint(0, 5, 100),
+            'col2': random_state.choice(['a', 'b', None], 100),
+        })
+        synthetic_data = pd.DataFrame({
+            'col1': random_state.randint(0, 8, 53),
+            'col2': random_state.choice(['a', 'c', None], 53),
+        })
+        metadata = {
+            'columns': {
+                'col1': {'sdtype': 'numerical'},
+                'col2': {'sdtype': 'categorical'},
+            },
+        }
+
+        # Run
+        expected = NewRowSynthesis.compute_breakdown(real_data, synthetic_data, metadata)
+        chunked = NewRowSynthesis.compute_breakdown(
+            real_data, synthetic_data, metadata, chunk_size=10
+        )
+        parallel = NewRowSynthesis.compute_breakdown(
+            real_data, synthetic_data, metadata, chunk_size=10, n_jobs=2
+        )
+
+        # Assert
+        assert chunked == expected
+        assert parallel == expected
+
+    def test_compute_breakdown_invalid_chunk_options(self):
+        """Test an error is raised when ``chunk_size`` or ``n_jobs`` are not valid."""
+        # Setup
+        data = pd.DataFrame({'col': [1, 2, 3]})
+        metadata = {'columns': {'col': {'sdtype': 'numerical'}}}
+
+        # Run and Assert
+        with pytest.raises(ValueError, match='`chunk_size` must be None or an integer'):
+            NewRowSynthesis.compute_breakdown(data, data, metadata, chunk_size=0)
+
+        with pytest.raises(ValueError, match='`n_jobs` must be None, -1 or an integer'):
+            NewRowSynthesis.compute_breakdown(data, data, metadata, n_jobs=0)
+
     @patch('sdmetrics.single_table.new_row_synthesis.SingleTableMetric.normalize')
     def test_normalize(self, normalize_mock):
         """Test the ``normalize`` method.
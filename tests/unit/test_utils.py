@@ -1,15 +1,24 @@
+import json
+import pickle
 from datetime import datetime
 from unittest.mock import Mock, patch
 
 import numpy as np
 import pandas as pd
+import pytest
+from scipy.stats import ks_2samp
 
 from sdmetrics.utils import (
+    ColumnProfile,
     HyperTransformer,
+    QuantileSketch,
+    count_duplicate_keys,
     discretize_column,
     get_alternate_keys,
     get_cardinality_distribution,
     get_columns_from_metadata,
+    get_frequencies,
+    get_frequency_arrays,
     get_missing_percentage,
     get_type_from_column_meta,
 )
@@ -36,6 +45,95 @@ def test_get_cardinality_distribution():
     assert cardinality_distribution.to_list() == [2.0, 0.0, 1.0, 3.0, 1.0]
 
 
+def test_get_frequencies():
+    """Test the frequencies follow the real values, with the regularization for new values."""
+    # Setup
+    real = pd.Series(['b', 'a', 'b', 'c'])
+    synthetic = pd.Series(['d', 'a', 'a', 'e', 'b'])
+
+    # Run
+    f_obs, f_exp = get_frequencies(real, synthetic)
+
+    # Assert
+    real_total = 4 + 1e-6 + 1e-6
+    assert f_obs == [0.2, 0.4, 0.0, 0.2, 0.2]
+    assert f_exp == [2 / real_total, 1 / real_total, 1 / real_total] + [1e-6 / real_total] * 2
+
+
+def test_get_frequency_arrays_rows():
+    """Test the rows of two columns are counted as the tuples of their values."""
+    # Setup
+    real = pd.DataFrame({'col1': ['a', 'a', 'b', np.nan], 'col2': [1, 2, 1, 1]})
+    synthetic = pd.DataFrame({'col1': ['a', 'b', 'c'], 'col2': [2, 1, 1]})
+
+    # Run
+    f_obs, f_exp = get_frequency_arrays(real, synthetic)
+
+    # Assert
+    real_total = 4 + 1e-6
+    np.testing.assert_array_equal(f_obs, np.array([0, 1, 1, 0, 1]) / 3)
+    np.testing.assert_array_equal(f_exp, np.array([1, 1, 1, 1, 1e-6]) / real_total)
+
+
+def test_count_duplicate_keys():
+    """Test the missing and duplicated values are counted from the fingerprints."""
+    # Setup
+    column = pd.Series(['a', 'b', None, 'a', 'c', 'c', np.nan, 'c', 'd'])
+
+    # Run
+    result = count_duplicate_keys(column, chunk_size=4)
+
+    # Assert
+    assert result == (2, 3)
+
+
+@patch('sdmetrics.utils.pd.util.hash_pandas_object')
+def test_count_duplicate_keys_collisions(hash_mock):
+    """Test the values that share a fingerprint are only duplicates if they are equal."""
+    # Setup
+    column = pd.Series(['a', 'b', 'a', 'c'])
+    hash_mock.side_effect = lambda chunk, **kwargs: pd.Series(np.zeros(len(chunk), np.uint64))
+
+    # Run
+    verified = count_duplicate_keys(column, chunk_size=3)
+    unverified = count_duplicate_keys(column, chunk_size=3, verify=False)
+
+    # Assert
+    assert verified == (0, 1)
+    assert unverified == (0, 3)
+
+
+def test_count_duplicate_keys_batches():
+    """Test the values with repeated fingerprints are compared in batches of whole groups."""
+    # Setup
+    values = pd.Series([f'value_{idx}' for idx in range(20)])
+    column = pd.concat([values, values.iloc[:15], values.iloc[:5]], ignore_index=True)
+
+    # Run
+    with patch(
+        'sdmetrics.utils._normalize_keys', side_effect=lambda values: values
+    ) as normalize_mock:
+        result = count_duplicate_keys(column, chunk_size=6)
+
+    # Assert
+    assert result == (0, 20)
+    batch_sizes = [len(call.args[0]) for call in normalize_mock.call_args_list[7:]]
+    assert sum(batch_sizes) == 35
+    assert len(batch_sizes) > 1
+    assert max(batch_sizes) <= 6 + 2
+
+
+def test_count_duplicate_keys_equal_values():
+    """Test the values that are equal but hash differently are counted as duplicates."""
+    # Run
+    floats = count_duplicate_keys(pd.Series([0.0, -0.0, 1.0, 2.0]))
+    objects = count_duplicate_keys(pd.Series([1, 1.0, True, 'a', 'b', 2.5, np.float32(2.5)]))
+
+    # Assert
+    assert floats == (0, 1)
+    assert objects == (0, 3)
+
+
 def test_get_missing_percentage():
     """Test the ``get_missing_percentage`` utility function.
 
@@ -142,6 +240,192 @@ def test_get_alternate_keys():
     assert out == ['A', 'B', 'C']
 
 
+class TestQuantileSketch:
+    def test_ks_statistic_exact(self):
+        """Test the statistic is exact while the data fits in the sketch."""
+        # Setup
+        random_state = np.random.RandomState(0)
+        real = random_state.normal(size=500)
+        synthetic = random_state.normal(0.2, size=300)
+        real_sketch = QuantileSketch()
+        real_sketch.update(real[:200])
+        real_sketch.update(np.append(real[200:], np.nan))
+        synthetic_sketch = QuantileSketch()
+        synthetic_sketch.update(synthetic)
+
+        # Run
+        statistic, error_bound = real_sketch.ks_statistic(synthetic_sketch)
+
+        # Assert
+        assert real_sketch.count == 500
+        assert statistic == pytest.approx(ks_2samp(real, synthetic).statistic)
+        assert error_bound == 0
+
+    def test_ks_statistic_compacted(self):
+        """Test the statistic of merged and compacted sketches is within the error bound."""
+        # Setup
+        random_state = np.random.RandomState(0)
+        real = random_state.exponential(size=20000)
+        synthetic = random_state.exponential(1.1, size=15000)
+        real_sketch = QuantileSketch(size=64)
+        for chunk in np.array_split(real, 7):
+            chunk_sketch = QuantileSketch(size=64)
+            chunk_sketch.update(chunk)
+            real_sketch.merge(chunk_sketch)
+
+        synthetic_sketch = QuantileSketch(size=64)
+        synthetic_sketch.update(synthetic)
+
+        # Run
+        statistic, error_bound = real_sketch.ks_statistic(synthetic_sketch)
+
+        # Assert
+        assert real_sketch.count == 20000
+        assert 0 < error_bound < 0.2
+        assert abs(statistic - ks_2samp(real, synthetic).statistic) <= error_bound
+
+    def test_to_dict_from_dict(self):
+        """Test a sketch saved as JSON is loaded with the same values and error."""
+        # Setup
+        sketch = QuantileSketch(size=16)
+        sketch.update(np.arange(100.0))
+        values = np.array([-1.0, 10.5, 50.0, 200.0])
+
+        # Run
+        loaded = QuantileSketch.from_dict(json.loads(json.dumps(sketch.to_dict())))
+
+        # Assert
+        assert loaded.count == 100
+        assert loaded.rank_error == sketch.rank_error
+        np.testing.assert_array_equal(loaded.cdf(values), sketch.cdf(values))
+        loaded.update(np.arange(100.0))
+        sketch.update(np.arange(100.0))
+        np.testing.assert_array_equal(loaded.cdf(values), sketch.cdf(values))
+
+    def test_ks_statistic_empty(self):
+        """Test the statistic is NaN when one of the sketches is empty."""
+        # Setup
+        sketch = QuantileSketch()
+        sketch.update(np.array([1.0, 2.0]))
+
+        # Run
+        statistic, error_bound = sketch.ks_statistic(QuantileSketch())
+
+        # Assert
+        assert np.isnan(statistic)
+        assert error_bound == 0
+
+
+class TestColumnProfile:
+    def test_from_column(self):
+        """Test the counts of the values and missing values of a column."""
+        # Setup
+        column = pd.Series([3.0, 1.0, np.nan, 3.0, 2.0, None, 3.0], name='col')
+
+        # Run
+        profile = ColumnProfile.from_column(column)
+
+        # Assert
+        assert profile.name == 'col'
+        assert profile.num_rows == 7
+        assert profile.num_nulls == 2
+        assert profile.value_counts.to_dict() == {3.0: 3, 1.0: 1, 2.0: 1}
+        assert profile.minimum == 1.0
+        assert profile.maximum == 3.0
+        assert profile.num_duplicates == 2
+        assert ColumnProfile.from_column(profile) is profile
+
+    def test_from_column_chunks(self):
+        """Test profiling a column in chunks gives the same profile as all at once."""
+        # Setup
+        column = pd.Series(['b', 'a', None, 'c', 'a', 'b', 'a', None])
+
+        # Run
+        profile = ColumnProfile.from_column(column, chunk_size=3)
+
+        # Assert
+        expected_profile = ColumnProfile.from_column(column)
+        assert profile.num_rows == expected_profile.num_rows == 8
+        assert profile.num_nulls == expected_profile.num_nulls == 2
+        pd.testing.assert_series_equal(profile.value_counts, expected_profile.value_counts)
+
+    def test_merge(self):
+        """Test merging the profiles of two parts of a column."""
+        # Setup
+        dates = pd.Series(pd.to_datetime(['2020-01-02', None, '2020-01-01', '2020-01-02']))
+        profile = ColumnProfile.from_column(dates.iloc[:2])
+
+        # Run
+        profile.merge(ColumnProfile.from_column(dates.iloc[2:]))
+
+        # Assert
+        assert profile.num_rows == 4
+        assert profile.num_nulls == 1
+        assert profile.value_counts.to_dict() == {
+            pd.Timestamp('2020-01-02'): 2,
+            pd.Timestamp('2020-01-01'): 1,
+        }
+        assert profile.minimum == pd.Timestamp('2020-01-01')
+
+    def test_from_column_empty(self):
+        """Test the profile of an empty column."""
+        # Run
+        profile = ColumnProfile.from_column(pd.Series([], dtype=float))
+
+        # Assert
+        assert profile.num_rows == 0
+        assert profile.num_nulls == 0
+        assert profile.value_counts.empty
+        assert np.isnan(profile.minimum)
+
+    def test_value_counts_lazy(self):
+        """Test the values are only counted the first time the counts are used."""
+        # Setup
+        profile = ColumnProfile.from_column(pd.Series([2.0, np.nan, 1.0, 2.0]), chunk_size=2)
+
+        # Run
+        with patch.object(
+            ColumnProfile, '_count_values', wraps=ColumnProfile._count_values
+        ) as count_values_mock:
+            minimum = profile.minimum
+            maximum = profile.maximum
+            num_calls = count_values_mock.call_count
+            value_counts = profile.value_counts
+            profile.value_counts
+
+        # Assert
+        assert (minimum, maximum) == (1.0, 2.0)
+        assert num_calls == 0
+        assert count_values_mock.call_count == 2
+        assert value_counts.to_dict() == {2.0: 2, 1.0: 1}
+
+    def test_count_between(self):
+        """Test ``count_between`` counts the values within the bounds, before or after counting."""
+        # Setup
+        profile = ColumnProfile.from_column(pd.Series([1.0, 2.0, np.nan, 3.0, 2.0]))
+        counted_profile = ColumnProfile.from_column(pd.Series([1.0, 2.0, np.nan, 3.0, 2.0]))
+        counted_profile.value_counts
+
+        # Run
+        num_values = profile.count_between(1.5, 3.0)
+        num_counted_values = counted_profile.count_between(1.5, 3.0)
+
+        # Assert
+        assert num_values == num_counted_values == 3
+
+    def test_pickle(self):
+        """Test a profile can be pickled and used afterwards."""
+        # Setup
+        profile = ColumnProfile.from_column(pd.Series(['a', 'b', 'a']))
+
+        # Run
+        loaded = pickle.loads(pickle.dumps(profile))
+
+        # Assert
+        assert loaded.value_counts.to_dict() == {'a': 2, 'b': 1}
+        assert loaded.num_duplicates == 1
+
+
 class TestHyperTransformer:
     @patch('sdmetrics.utils.OneHotEncoder')
     def test_fit(self, one_hot_encoder_mock):